@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Persistent TTL cache for Arbiscan API responses
+Shared by every script through SQLite, so repeated and chained runs reuse answers instead of spending API quota
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+ARBISCAN_CACHE_DB = os.getenv('ARBISCAN_CACHE_DB', 'sdm_arbiscan_cache.db')
+
+# Set ARBISCAN_CACHE=0 to always query the API
+ARBISCAN_CACHE = os.getenv('ARBISCAN_CACHE', '1') != '0'
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# (fresh seconds, extra seconds a stale copy may be served while it is refreshed) per action.
+# Actions not listed here (verifysourcecode, checkverifystatus) are never cached.
+ACTION_TTLS = {
+    "getsourcecode": (7 * DAY, 30 * DAY),
+    "getcontractcreation": (365 * DAY, 0),
+    "tokenholderlist": (10 * 60, DAY),
+    "tokentx": (60, HOUR),
+    "getLogs": (5 * 60, DAY),
+}
+
+# Unverified contracts can be verified at any moment, so "no source" is only trusted briefly
+UNVERIFIED_SOURCE_TTL = (5 * 60, HOUR)
+
+
+def _is_unverified(response: Dict[str, Any]) -> bool:
+    result = response.get("result")
+    return not (isinstance(result, list) and result and result[0].get("SourceCode"))
+
+
+def ttl_for(action: str, response: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+    """(fresh, stale) lifetimes for a response, or None if it must not be cached."""
+    if action not in ACTION_TTLS or response.get("status") != "1":
+        # Errors and rate-limit answers come back with status "0"
+        return None
+    if action == "getsourcecode" and _is_unverified(response):
+        return UNVERIFIED_SOURCE_TTL
+    return ACTION_TTLS[action]
+
+
+def cache_key(action: str, params: Dict[str, Any]) -> str:
+    return json.dumps([action, {k: str(v).lower() for k, v in params.items()}], sort_keys=True)
+
+
+class ArbiscanCache:
+    """Arbiscan responses keyed by action and parameters, with per-action freshness."""
+
+    def __init__(self, path: str = ARBISCAN_CACHE_DB):
+        self.conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, action TEXT NOT NULL, response TEXT NOT NULL, "
+            "fresh_until REAL NOT NULL, stale_until REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def get(self, action: str, params: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Return (response, fresh). response is None on a miss or once even the stale window has passed."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT response, fresh_until, stale_until FROM responses WHERE key = ?",
+                (cache_key(action, params),),
+            ).fetchone()
+        now = time.time()
+        if row is None or now >= row[2]:
+            self.misses += 1
+            return None, False
+        fresh = now < row[1]
+        if fresh:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        return json.loads(row[0]), fresh
+
+    def put(self, action: str, params: Dict[str, Any], response: Dict[str, Any]) -> None:
+        ttl = ttl_for(action, response)
+        if ttl is None:
+            return
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (cache_key(action, params), action, json.dumps(response), now + ttl[0], now + ttl[0] + ttl[1]),
+            )
+
+    def invalidate(self, action: str) -> None:
+        """Drop every cached response for an action, e.g. getsourcecode after a verification."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM responses WHERE action = ?", (action,))
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "stale_hits": self.stale_hits, "misses": self.misses}
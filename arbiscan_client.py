@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Shared Arbiscan API client
+One keep-alive, connection-pooled session for every Arbiscan call made by the scripts
+"""
+
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+
+# Load environment variables before rate_limit and arbiscan_cache read their settings at import
+load_dotenv()
+
+from rate_limit import APIKeyPool, arbiscan_keys_from_env  # noqa: E402
+from arbiscan_cache import ARBISCAN_CACHE, ArbiscanCache  # noqa: E402
+
+ARBISCAN_API = os.getenv('ARBISCAN_API_URL') or 'https://api.arbiscan.io/api'
+ARBISCAN_API_KEY = os.getenv('ARBISCAN_API_KEY')
+
+
+class ArbiscanClient:
+    """Typed wrappers around the Arbiscan endpoints the scripts use.
+
+    Every method returns the decoded JSON response unchanged, so callers keep
+    checking data["status"] and data["result"] as before. Read-only actions are
+    served from an ArbiscanCache when one is given: fresh entries directly,
+    stale ones immediately while a background call refreshes them.
+    """
+
+    def __init__(self, api_keys: Optional[List[Optional[str]]] = None, base_url: str = ARBISCAN_API, pool_size: int = 16,
+                 cache: Optional[ArbiscanCache] = None):
+        self.key_pool = APIKeyPool(api_keys or arbiscan_keys_from_env())
+        self.cache = cache
+        # Worker threads are joined at interpreter exit, so pending refreshes still land in the cache
+        self._revalidator = ThreadPoolExecutor(max_workers=2) if cache else None
+        self._revalidating = set()
+        self._revalidating_lock = threading.Lock()
+        self.base_url = base_url
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        })
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self._timings_lock = threading.Lock()
+
+    def _record(self, action: str, elapsed: float) -> None:
+        with self._timings_lock:
+            stats = self.timings.setdefault(action, {"calls": 0, "total": 0.0, "max": 0.0})
+            stats["calls"] += 1
+            stats["total"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+
+    def _request(self, module: str, action: str, params: Dict[str, Any], method: str = "GET", timeout: float = 10) -> Dict[str, Any]:
+        payload = {"module": module, "action": action, **params, "apikey": self.key_pool.acquire()}
+        start = time.monotonic()
+        try:
+            if method == "POST":
+                response = self.session.post(self.base_url, data=payload, timeout=timeout)
+            else:
+                response = self.session.get(self.base_url, params=payload, timeout=timeout)
+            return response.json()
+        finally:
+            self._record(action, time.monotonic() - start)
+
+    def _revalidate(self, module: str, action: str, params: Dict[str, Any], key: str) -> None:
+        try:
+            self.cache.put(action, params, self._request(module, action, params))
+        except Exception:
+            pass  # Keep serving the stale copy; the next call retries
+        finally:
+            with self._revalidating_lock:
+                self._revalidating.discard(key)
+
+    def _cached_request(self, module: str, action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET through the response cache, refreshing stale entries in the background."""
+        if self.cache is None:
+            return self._request(module, action, params)
+
+        cached, fresh = self.cache.get(action, params)
+        if cached is not None:
+            if not fresh:
+                key = (action, tuple(sorted(params.items())))
+                with self._revalidating_lock:
+                    start_refresh = key not in self._revalidating
+                    self._revalidating.add(key)
+                if start_refresh:
+                    self._revalidator.submit(self._revalidate, module, action, params, key)
+            return cached
+
+        response = self._request(module, action, params)
+        self.cache.put(action, params, response)
+        return response
+
+    def _invalidate(self, action: str) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(action)
+
+    # Contract module
+
+    def getsourcecode(self, address: str) -> Dict[str, Any]:
+        return self._cached_request("contract", "getsourcecode", {"address": address})
+
+    def getcontractcreation(self, addresses: Union[str, List[str]]) -> Dict[str, Any]:
+        if not isinstance(addresses, str):
+            addresses = ",".join(addresses)
+        return self._cached_request("contract", "getcontractcreation", {"contractaddresses": addresses})
+
+    def verifysourcecode(self, timeout: float = 30, **params: Any) -> Dict[str, Any]:
+        data = self._request("contract", "verifysourcecode", params, method="POST", timeout=timeout)
+        self._invalidate("getsourcecode")
+        return data
+
+    def checkverifystatus(self, guid: str) -> Dict[str, Any]:
+        data = self._request("contract", "checkverifystatus", {"guid": guid})
+        if data.get("status") == "1":
+            # Newly verified source must not be hidden behind a cached "not verified"
+            self._invalidate("getsourcecode")
+        return data
+
+    # Account, token and logs modules
+
+    def tokentx(self, contractaddress: str, page: int = 1, offset: int = 20, sort: str = "desc", **params: Any) -> Dict[str, Any]:
+        return self._cached_request("account", "tokentx", {
+            "contractaddress": contractaddress,
+            "page": str(page),
+            "offset": str(offset),
+            "sort": sort,
+            **params
+        })
+
+    def tokenholderlist(self, contractaddress: str, page: int = 1, offset: int = 20) -> Dict[str, Any]:
+        return self._cached_request("token", "tokenholderlist", {
+            "contractaddress": contractaddress,
+            "page": str(page),
+            "offset": str(offset)
+        })
+
+    def getLogs(self, address: str, fromBlock: Union[int, str] = 0, toBlock: Union[int, str] = "latest",
+                page: int = 1, offset: int = 1000, **topics: Any) -> Dict[str, Any]:
+        return self._cached_request("logs", "getLogs", {
+            "address": address,
+            "fromBlock": str(fromBlock),
+            "toBlock": str(toBlock),
+            "page": str(page),
+            "offset": str(offset),
+            **topics
+        })
+
+    # Reporting
+
+    def print_timing(self) -> None:
+        """Print per-endpoint call counts and latency."""
+        cache = self.cache.stats() if self.cache is not None else None
+        if not self.timings and not (cache and any(cache.values())):
+            return
+        print("\n⏱️  Arbiscan API Timing")
+        print("-" * 40)
+        for action, stats in sorted(self.timings.items()):
+            avg_ms = stats["total"] / stats["calls"] * 1000
+            print(f"• {action}: {stats['calls']} calls, avg {avg_ms:.0f}ms, max {stats['max'] * 1000:.0f}ms")
+        limiter = self.key_pool.stats()
+        print(f"• Rate limiter: {limiter['keys']} key(s) at {limiter['rate_per_key']:g}/s, "
+              f"waited {limiter['waited_seconds']}s")
+        if cache is not None:
+            print(f"• Response cache: {cache['hits']} fresh hits, {cache['stale_hits']} stale hits, "
+                  f"{cache['misses']} misses")
+
+
+_shared_client: Optional[ArbiscanClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_arbiscan_client() -> ArbiscanClient:
+    """Return the process-wide Arbiscan client."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = ArbiscanClient(cache=ArbiscanCache() if ARBISCAN_CACHE else None)
+        return _shared_client
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-log decode cost of event_decoder over synthetic SDM logs
+
+Usage: python benchmarks/bench_event_decoder.py [--logs 1000000] [--compare-web3]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from event_decoder import EVENT_TOPIC_BYTES, decode_logs  # noqa: E402
+
+
+def _word(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+def _address_topic() -> bytes:
+    return b"\0" * 12 + os.urandom(20)
+
+
+def _string_tail(value: bytes) -> bytes:
+    padded = value + b"\0" * (-len(value) % 32)
+    return _word(len(value)) + padded
+
+
+def synthetic_logs(count: int, seed: int = 1):
+    """Build a realistic mix: mostly Transfers, some Approvals and mint analytics events."""
+    random.seed(seed)
+    templates = [
+        (80, lambda: ([EVENT_TOPIC_BYTES["Transfer"], _address_topic(), _address_topic()],
+                      _word(random.getrandbits(90)))),
+        (8, lambda: ([EVENT_TOPIC_BYTES["Approval"], _address_topic(), _address_topic()],
+                     _word(random.getrandbits(256)))),
+        (6, lambda: ([EVENT_TOPIC_BYTES["TokensMinted"], _address_topic(), _address_topic()],
+                     _word(random.getrandbits(90)) + _word(random.getrandbits(100)) + _word(1_750_000_000))),
+        (3, lambda: ([EVENT_TOPIC_BYTES["MintMilestone"], _address_topic()],
+                     _word(random.getrandbits(100)) + _word(random.randint(1, 100)))),
+        (3, lambda: ([EVENT_TOPIC_BYTES["CrossChainMint"], _address_topic()],
+                     _word(random.getrandbits(90)) + _word(96) + os.urandom(32) + _string_tail(b"ethereum-mainnet"))),
+    ]
+    weights = [weight for weight, _ in templates]
+    builders = [builder for _, builder in templates]
+    logs = []
+    for index, builder in enumerate(random.choices(builders, weights, k=count)):
+        topics, data = builder()
+        logs.append({"topics": topics, "data": data, "blockNumber": 362698455 + index // 4, "logIndex": index % 4})
+    return logs
+
+
+def bench_web3(logs, sample: int) -> float:
+    """Per-log cost of web3's contract event processing for Transfer logs, for comparison."""
+    from web3 import Web3
+    from hexbytes import HexBytes
+
+    abi = [{"anonymous": False, "name": "Transfer", "type": "event", "inputs": [
+        {"indexed": True, "name": "from", "type": "address"},
+        {"indexed": True, "name": "to", "type": "address"},
+        {"indexed": False, "name": "value", "type": "uint256"}]}]
+    event = Web3().eth.contract(abi=abi).events.Transfer()
+    transfers = [log for log in logs if log["topics"][0] == EVENT_TOPIC_BYTES["Transfer"]][:sample]
+    web3_logs = [{
+        "address": "0x602b869eEf1C9F0487F31776bad8Af3C4A173394",
+        "topics": [HexBytes(topic) for topic in log["topics"]],
+        "data": HexBytes(log["data"]),
+        "blockNumber": log["blockNumber"], "logIndex": log["logIndex"], "transactionIndex": 0,
+        "transactionHash": HexBytes(b"\0" * 32), "blockHash": HexBytes(b"\0" * 32),
+    } for log in transfers]
+    start = time.perf_counter()
+    for log in web3_logs:
+        event.process_log(log)
+    return (time.perf_counter() - start) / len(web3_logs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark SDM event decoding")
+    parser.add_argument("--logs", type=int, default=1_000_000, help="number of synthetic logs (default: 1,000,000)")
+    parser.add_argument("--compare-web3", action="store_true", help="also time web3 process_log on a sample")
+    parser.add_argument("--web3-sample", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    print(f"Generating {args.logs:,} synthetic logs...")
+    logs = synthetic_logs(args.logs)
+
+    start = time.perf_counter()
+    decoded = decode_logs(logs)
+    elapsed = time.perf_counter() - start
+
+    print(f"event_decoder: {len(decoded):,} logs in {elapsed:.2f}s "
+          f"({elapsed / len(logs) * 1e6:.2f} µs/log, {len(logs) / elapsed:,.0f} logs/s)")
+
+    if args.compare_web3:
+        per_log = bench_web3(logs, args.web3_sample)
+        print(f"web3 process_log: {per_log * 1e6:.2f} µs/log "
+              f"({per_log / (elapsed / len(logs)):.1f}x slower)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
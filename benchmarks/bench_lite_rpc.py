@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark lite_rpc against web3 for the ERC20 token reads: import time, ABI codec cost and per-call client overhead
+
+Usage: python benchmarks/bench_lite_rpc.py [--calls 20000] [--imports 5]
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from lite_rpc import FUNCTIONS, LiteClient, decode_result, encode_call  # noqa: E402
+
+TOKEN_ADDRESS = "0x602b869eEf1C9F0487F31776bad8Af3C4A173394"
+OWNER = "0xC5D133296E17BA25DF0409a6C31607bf3B78e3e3"
+
+
+def _word(value: int) -> bytes:
+    return value.to_bytes(32, "big")
+
+
+def _string(value: str) -> bytes:
+    raw = value.encode()
+    return _word(32) + _word(len(raw)) + raw + b"\0" * (-len(raw) % 32)
+
+
+# What SDM returns for each read, ABI-encoded
+RETURNS = {
+    "name": _string("Diamondz Shadow Game + Movies"),
+    "symbol": _string("SDM"),
+    "decimals": _word(18),
+    "totalSupply": _word(4_000_000_000 * 10**18),
+    "balanceOf": _word(1_250_000 * 10**18),
+    "owner": b"\0" * 12 + bytes.fromhex(OWNER[2:]),
+}
+READS = ["name", "symbol", "decimals", "totalSupply", "owner"]
+ARGS = {"balanceOf": [OWNER]}
+
+
+class CannedPool:
+    """Stands in for RPCPool with canned answers, so only client-side overhead is timed."""
+
+    def __init__(self):
+        self.by_selector = {FUNCTIONS[fn_name][0]: "0x" + data.hex() for fn_name, data in RETURNS.items()}
+        self.code = "0x" + "60806040" * 1900
+
+    def raw_request(self, method, params):
+        if method == "eth_call":
+            result = self.by_selector[params[0]["data"][:10]]
+        elif method == "eth_getCode":
+            result = self.code
+        elif method == "eth_chainId":
+            result = "0xa4b1"
+        else:
+            raise ValueError(f"Unexpected method {method}")
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+    def request(self, method, params):
+        return self.raw_request(method, params)["result"]
+
+    def batch(self, calls):
+        return [self.raw_request(method, params) for method, params in calls]
+
+
+def _per_call(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+
+def bench_imports(runs: int):
+    """Best-of-runs wall time of a fresh interpreter importing each module."""
+    results = {}
+    for module in ("lite_rpc", "web3"):
+        best = None
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", f"import {module}"], cwd=ROOT, check=True)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[module] = best
+    baseline = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        elapsed = time.perf_counter() - start
+        baseline = elapsed if baseline is None else min(baseline, elapsed)
+    return {module: elapsed - baseline for module, elapsed in results.items()}
+
+
+def bench_codec(calls: int, compare_web3: bool):
+    """Encode plus decode cost of one read, averaged over the six functions."""
+    def lite():
+        for fn_name, data in RETURNS.items():
+            encode_call(fn_name, *ARGS.get(fn_name, []))
+            decode_result(fn_name, data)
+
+    results = {"lite": _per_call(lite, calls) / len(RETURNS)}
+    if compare_web3:
+        from web3 import Web3
+        from verify_token import ERC20_ABI
+        w3 = Web3()
+        contract = w3.eth.contract(address=TOKEN_ADDRESS, abi=ERC20_ABI)
+        types = {fn_name: return_type for fn_name, (_, _, return_type) in FUNCTIONS.items()}
+
+        def web3():
+            for fn_name, data in RETURNS.items():
+                contract.encodeABI(fn_name=fn_name, args=ARGS.get(fn_name, []))
+                w3.codec.decode([types[fn_name]], data)
+
+        results["web3"] = _per_call(web3, max(1, calls // 10)) / len(RETURNS)
+    return results
+
+
+def bench_calls(calls: int, compare_web3: bool):
+    """Full client path of one eth_call (build request, go through the pool, decode) against canned answers."""
+    pool = CannedPool()
+    client = LiteClient(pool)
+
+    def lite_batch():
+        _, read = client.token_reads(TOKEN_ADDRESS, READS)
+        for fn_name in READS:
+            read(fn_name)
+
+    results = {
+        "lite call": _per_call(lambda: client.call(TOKEN_ADDRESS, "totalSupply"), calls),
+        "lite batch (code + 5 reads)": _per_call(lite_batch, max(1, calls // 5)),
+    }
+    if compare_web3:
+        from rpc_pool import pooled_web3
+        from verify_token import ERC20_ABI
+        w3 = pooled_web3(pool)
+        contract = w3.eth.contract(address=TOKEN_ADDRESS, abi=ERC20_ABI)
+        results["web3 call"] = _per_call(lambda: contract.functions.totalSupply().call(), max(1, calls // 10))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark lite_rpc against web3")
+    parser.add_argument("--calls", type=int, default=20_000, help="iterations per timed loop (default: 20,000)")
+    parser.add_argument("--imports", type=int, default=5, help="fresh interpreters per import timing (default: 5)")
+    parser.add_argument("--no-web3", action="store_true", help="time lite_rpc only")
+    args = parser.parse_args(argv)
+    compare_web3 = not args.no_web3
+
+    if compare_web3:
+        imports = bench_imports(args.imports)
+        print("Import time (fresh interpreter, minus bare startup):")
+        for module, elapsed in imports.items():
+            print(f"  {module}: {elapsed * 1000:.1f} ms")
+        print(f"  web3 is {imports['web3'] / imports['lite_rpc']:.1f}x slower to import")
+
+    codec = bench_codec(args.calls, compare_web3)
+    print("ABI encode + decode per read:")
+    for name, per_read in codec.items():
+        print(f"  {name}: {per_read * 1e6:.2f} µs")
+    if compare_web3:
+        print(f"  web3 is {codec['web3'] / codec['lite']:.1f}x slower")
+
+    calls = bench_calls(args.calls, compare_web3)
+    print("Client overhead per call (canned responses, no network):")
+    for name, per_call in calls.items():
+        print(f"  {name}: {per_call * 1e6:.2f} µs")
+    if compare_web3:
+        print(f"  web3 is {calls['web3 call'] / calls['lite call']:.1f}x slower per eth_call")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Replay benchmark of the verification scripts against local JSON-RPC and Arbiscan stand-ins
+Runs each entry point cold (empty caches) and warm, reports wall time, peak RSS and requests per method, and fails on regressions
+
+Usage: python benchmarks/bench_replay.py [--only verify_token] [--runs 3] [--latency 0.02] [--update-baseline]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+from typing import Dict, Any, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(BENCH_DIR, "..")
+sys.path.insert(0, ROOT)
+
+from replay_server import DEFAULT_FIXTURE, ReplayServers, load_fixture  # noqa: E402
+
+BASELINE_FILE = os.path.join(BENCH_DIR, "replay_baseline.json")
+
+# Entry points and their arguments; each runs cold, then warm against the caches the cold run left behind
+SCENARIOS = {
+    "verify_token": ["verify_token.py"],
+    "verify_token_lite": ["verify_token.py", "--backend", "lite"],
+    "quicknode_verify": ["quicknode_verify.py"],
+    "quicknode_verify_lite": ["quicknode_verify.py", "--backend", "lite"],
+    "token_analysis": ["token_analysis.py"],
+}
+
+# Seconds added to every stand-in response, roughly a round trip to a hosted endpoint
+DEFAULT_LATENCY = 0.02
+
+# Allowed slowdown before a run counts as a regression; request counts must never grow
+DEFAULT_TIME_TOLERANCE = 0.5
+DEFAULT_RSS_TOLERANCE = 0.25
+
+SCRIPT_TIMEOUT = 300
+
+
+def _script_env(servers: ReplayServers, workdir: str) -> Dict[str, str]:
+    """Environment pointing every endpoint at the stand-ins and every cache into workdir."""
+    env = dict(os.environ)
+    env.update({
+        "ARBITRUM_RPC_URL": servers.rpc_url,
+        "ARBISCAN_API_URL": servers.arbiscan_url,
+        "QUICKNODE_RPC_URL": "",
+        "INFURA_API_KEY": "",
+        "ARBISCAN_API_KEY": "replay",
+        "ARBISCAN_API_KEYS": "",
+        "RATE_LIMIT_STATE_DIR": os.path.join(workdir, "ratelimit"),
+        "WATCH_ADDRESSES_FILE": os.path.join(workdir, "watch_addresses.txt"),
+        "RPC_HEDGE": "0",
+        "RPC_BACKEND": "web3",
+        "CHAIN_CACHE": "1",
+        "ARBISCAN_CACHE": "1",
+        "PYTHONPATH": os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])),
+    })
+    return env
+
+
+def run_script(args: List[str], env: Dict[str, str], workdir: str) -> Dict[str, Any]:
+    """Run one entry point to completion in workdir; returns exit code, wall time, peak RSS and output."""
+    log_path = os.path.join(workdir, "output.log")
+    with open(log_path, "w") as log:
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable, os.path.join(ROOT, args[0])] + args[1:],
+                                   cwd=workdir, env=env, stdout=log, stderr=subprocess.STDOUT)
+        timer = threading.Timer(SCRIPT_TIMEOUT, process.kill)
+        timer.start()
+        try:
+            if hasattr(os, "wait4"):
+                _, status, usage = os.wait4(process.pid, 0)
+                process.returncode = os.waitstatus_to_exitcode(status)
+                # ru_maxrss is in kilobytes on Linux and bytes on macOS
+                peak_rss = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+            else:  # Windows: no per-child resource usage
+                process.wait()
+                peak_rss = None
+        finally:
+            timer.cancel()
+        elapsed = time.perf_counter() - start
+    with open(log_path) as f:
+        output = f.read()
+    return {"returncode": process.returncode, "wall_time": elapsed, "peak_rss": peak_rss, "output": output}
+
+
+def run_scenario(servers: ReplayServers, args: List[str], runs: int) -> Dict[str, Dict[str, Any]]:
+    """Cold and warm results for one entry point, best wall time of `runs` fresh work directories."""
+    results: Dict[str, Dict[str, Any]] = {}
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory(prefix="sdm-replay-") as workdir:
+            env = _script_env(servers, workdir)
+            for phase in ("cold", "warm"):
+                servers.reset_counts()
+                run = run_script(args, env, workdir)
+                run["requests"] = servers.counts()
+                best = results.get(phase)
+                if best is None or run["returncode"] != 0 or (best["returncode"] == 0 and run["wall_time"] < best["wall_time"]):
+                    if best is not None:
+                        run["peak_rss"] = max(filter(None, [run["peak_rss"], best["peak_rss"]]), default=None)
+                    results[phase] = run
+                elif run["peak_rss"] and best["peak_rss"]:
+                    best["peak_rss"] = max(best["peak_rss"], run["peak_rss"])
+    return results
+
+
+def _rpc_total(requests: Dict[str, int]) -> int:
+    return sum(count for key, count in requests.items() if key.startswith("rpc.") and key != "rpc.batch")
+
+
+def print_results(results: Dict[str, Dict[str, Any]]) -> None:
+    print(f"\n{'Scenario':<30} {'Wall':>8} {'Peak RSS':>10} {'RPC calls':>10} {'RPC HTTP':>9} {'Arbiscan':>9}")
+    print("-" * 80)
+    for name, result in results.items():
+        requests = result["requests"]
+        rss = f"{result['peak_rss'] / 2**20:.1f} MB" if result["peak_rss"] else "n/a"
+        arbiscan = sum(count for key, count in requests.items() if key.startswith("arbiscan."))
+        status = "" if result["returncode"] == 0 else f"  ❌ exit {result['returncode']}"
+        print(f"{name:<30} {result['wall_time']:>7.2f}s {rss:>10} {_rpc_total(requests):>10} "
+              f"{requests.get('http.rpc', 0):>9} {arbiscan:>9}{status}")
+    print("\nRequests per method:")
+    for name, result in results.items():
+        methods = ", ".join(f"{key}={count}" for key, count in result["requests"].items() if not key.startswith("http."))
+        print(f"• {name}: {methods or 'none'}")
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], latency: float,
+            time_tolerance: float, rss_tolerance: float) -> List[str]:
+    """Regressions of results against the baseline, as messages; an empty list means the run passed."""
+    problems = []
+    compare_time = baseline.get("latency") == latency
+    for name, result in results.items():
+        if result["returncode"] != 0:
+            tail = "\n".join(result["output"].strip().splitlines()[-15:])
+            problems.append(f"{name}: exited with {result['returncode']}\n{tail}")
+            continue
+        unhandled = {key: count for key, count in result["requests"].items() if key.endswith(".unhandled")}
+        if unhandled:
+            problems.append(f"{name}: requests the stand-ins cannot replay: {unhandled}")
+        expected = baseline.get("scenarios", {}).get(name)
+        if expected is None:
+            continue
+        for key, count in result["requests"].items():
+            allowed = expected["requests"].get(key, 0)
+            if count > allowed:
+                problems.append(f"{name}: {key} went from {allowed} to {count} requests")
+        if compare_time and result["wall_time"] > expected["wall_time"] * (1 + time_tolerance):
+            problems.append(f"{name}: wall time {result['wall_time']:.2f}s exceeds baseline "
+                            f"{expected['wall_time']:.2f}s by more than {time_tolerance:.0%}")
+        if result["peak_rss"] and expected.get("peak_rss") and result["peak_rss"] > expected["peak_rss"] * (1 + rss_tolerance):
+            problems.append(f"{name}: peak RSS {result['peak_rss'] / 2**20:.1f} MB exceeds baseline "
+                            f"{expected['peak_rss'] / 2**20:.1f} MB by more than {rss_tolerance:.0%}")
+    if not compare_time:
+        print(f"\n⚠️  Baseline was recorded with {baseline.get('latency')}s latency, wall times not compared")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay benchmark of the SDM verification scripts")
+    parser.add_argument("--only", action="append", choices=sorted(SCENARIOS), help="run just this scenario (repeatable)")
+    parser.add_argument("--runs", type=int, default=1, help="fresh cold/warm runs per scenario; best wall time is kept")
+    parser.add_argument("--fixture", default=DEFAULT_FIXTURE, help="recorded token_verification_data_*.json")
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY,
+                        help=f"seconds added to every stand-in response (default: {DEFAULT_LATENCY})")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="results to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="save this run as the new baseline")
+    parser.add_argument("--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE)
+    parser.add_argument("--rss-tolerance", type=float, default=DEFAULT_RSS_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    servers = ReplayServers(load_fixture(args.fixture), latency=args.latency).start()
+    print(f"🔁 Replaying {os.path.basename(args.fixture)} (JSON-RPC {servers.rpc_url}, Arbiscan {servers.arbiscan_url}, "
+          f"{args.latency * 1000:.0f}ms latency)")
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        for name in args.only or SCENARIOS:
+            print(f"• {name}...")
+            for phase, result in run_scenario(servers, SCENARIOS[name], args.runs).items():
+                results[f"{name} ({phase})"] = result
+    finally:
+        servers.stop()
+
+    print_results(results)
+
+    baseline: Optional[Dict[str, Any]] = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    problems = compare(results, baseline or {"latency": args.latency}, args.latency,
+                       args.time_tolerance, args.rss_tolerance)
+
+    if args.update_baseline:
+        if problems and any("exited with" in problem or "replay" in problem for problem in problems):
+            print("\n❌ Not updating the baseline from a failing run")
+        else:
+            saved = baseline if baseline and baseline.get("latency") == args.latency else {"latency": args.latency, "scenarios": {}}
+            for name, result in results.items():
+                saved["scenarios"][name] = {"wall_time": round(result["wall_time"], 3),
+                                            "peak_rss": result["peak_rss"], "requests": result["requests"]}
+            with open(args.baseline, "w") as f:
+                json.dump(saved, f, indent=2, sort_keys=True)
+                f.write("\n")
+            print(f"\n💾 Baseline saved to {args.baseline}")
+            return 0
+
+    if problems:
+        print("\n❌ Regressions:")
+        for problem in problems:
+            print(f"• {problem}")
+        return 1
+    print("\n✅ No regressions" + ("" if baseline else " (no baseline yet, run with --update-baseline)"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+"""
+Local stand-ins for the Arbitrum JSON-RPC endpoint and the Arbiscan API, seeded from a recorded verification run
+Every request is counted per method, so a benchmark can check exactly how many calls a script made
+
+Usage: python benchmarks/replay_server.py [--fixture token_verification_data_20250910_023229.json] [--rpc-port 8545] [--arbiscan-port 8546]
+"""
+
+import os
+import ast
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from event_decoder import EVENT_TOPICS  # noqa: E402
+from lite_rpc import FUNCTIONS, encode_address  # noqa: E402
+
+DEFAULT_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                               "token_verification_data_20250910_023229.json")
+
+CHAIN_ID = 42161
+MULTICALL3_ADDRESS = "0xca11bde05977b3631167028862be2a173976ca11"
+AGGREGATE3_SELECTOR = "0x82ad56cb"
+
+# Arbitrum produces about four blocks per second
+BLOCK_TIME = 0.25
+
+# How far the finalized block trails the head
+FINALIZED_LAG = 1_200
+
+GAS_PRICE = 10_000_000
+
+# Selectors the synthesized runtime code dispatches on, besides the ERC20 reads
+EXTRA_SELECTORS = ["0x40c10f19", "0x42966c68", "0xf2fde38b", "0xa9059cbb", "0x095ea7b3", "0x23b872dd"]
+
+
+def _hash(*parts: Any) -> str:
+    """Deterministic 32-byte hex value standing in for a hash the recording does not have."""
+    return "0x" + hashlib.sha256(":".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def _data_hex(value: Any) -> str:
+    """Log data as recorded: a hex string, or the repr of the bytes the scripts saved with default=str."""
+    if isinstance(value, str) and value.startswith(("b'", 'b"')):
+        return "0x" + ast.literal_eval(value).hex()
+    return value if isinstance(value, str) and value.startswith("0x") else "0x" + (value or "")
+
+
+def runtime_code(size: int) -> str:
+    """Runtime bytecode of the recorded size with a Solidity prologue, a selector dispatcher and a metadata trailer."""
+    code = bytes.fromhex("6080604052")
+    for i, selector in enumerate([FUNCTIONS[name][0] for name in FUNCTIONS] + EXTRA_SELECTORS):
+        code += bytes.fromhex("8063" + selector[2:] + "1461" + f"{0x100 + i * 0x20:04x}" + "57")
+    code += bytes.fromhex("7f" + EVENT_TOPICS["OwnershipTransferred"][2:] + "4e487b71" + "00")
+    trailer = (bytes.fromhex("a264697066735822") + bytes.fromhex("1220") + hashlib.sha256(b"SDM").digest()
+               + bytes.fromhex("64736f6c6343000818"))
+    trailer += len(trailer).to_bytes(2, "big")
+    padding = max(0, size - len(code) - len(trailer))
+    return "0x" + (code + b"\x5b" * padding + trailer).hex()
+
+
+def load_fixture(path: str = DEFAULT_FIXTURE) -> Dict[str, Any]:
+    """Chain and explorer state implied by a token_verification_data_*.json recording.
+
+    The recording holds the token reads, the code size, the mint receipt and its
+    logs and the verification status; block hashes, other timestamps and the
+    head are derived from it deterministically so request counts are stable.
+    """
+    with open(path) as f:
+        recorded = json.load(f)
+    token = recorded["token_verification"]
+    info = token["token_info"]
+    tx = recorded["transaction_analysis"]
+    details = tx["details"]
+
+    mint_block = details["block_number"]
+    mint_time = int(datetime.strptime(details["timestamp"], "%Y-%m-%d %H:%M:%S UTC")
+                    .replace(tzinfo=timezone.utc).timestamp())
+    recorded_at = int(datetime.fromisoformat(recorded["timestamp"]).replace(tzinfo=timezone.utc).timestamp())
+    head = mint_block + int((recorded_at - mint_time) / BLOCK_TIME)
+
+    tx_hash = recorded["mint_tx_hash"].lower()
+    block_hash = _hash("block", mint_block)
+    logs = [{
+        "address": log["address"].lower(),
+        "topics": log["topics"],
+        "data": _data_hex(log["data"]),
+        "blockNumber": hex(mint_block),
+        "blockHash": block_hash,
+        "transactionHash": tx_hash,
+        "transactionIndex": hex(details["transaction_index"]),
+        "logIndex": hex(log["index"]),
+        "removed": False,
+    } for log in tx["logs"]]
+
+    receipt = {
+        "transactionHash": tx_hash,
+        "transactionIndex": hex(details["transaction_index"]),
+        "blockHash": block_hash,
+        "blockNumber": hex(mint_block),
+        "from": details["from"].lower(),
+        "to": details["to"].lower() if details["to"] else None,
+        "contractAddress": details["contract_address"].lower() if details.get("contract_address") else None,
+        "status": "0x1" if details["status"] == "Success" else "0x0",
+        "gasUsed": hex(details["gas_used"]),
+        "cumulativeGasUsed": hex(details["gas_used"]),
+        "effectiveGasPrice": hex(details["effective_gas_price"]),
+        "logsBloom": "0x" + "00" * 256,
+        "type": "0x2",
+        "logs": logs,
+    }
+    transaction = {
+        "hash": tx_hash,
+        "blockHash": block_hash,
+        "blockNumber": hex(mint_block),
+        "transactionIndex": receipt["transactionIndex"],
+        "from": receipt["from"],
+        "to": receipt["to"],
+        "input": "0x",
+        "value": "0x0",
+        "nonce": "0x0",
+        "gas": hex(details["gas_used"] * 2),
+        "gasPrice": receipt["effectiveGasPrice"],
+        "type": "0x0",
+        "chainId": hex(CHAIN_ID),
+        "v": "0x0", "r": _hash("r", tx_hash), "s": _hash("s", tx_hash),
+    }
+
+    # Balances follow from replaying the recorded Transfer logs
+    balances: Counter = Counter()
+    for log in logs:
+        if log["topics"][0] == EVENT_TOPICS["Transfer"]:
+            value = int(log["data"], 16)
+            balances["0x" + log["topics"][1][-40:]] -= value
+            balances["0x" + log["topics"][2][-40:]] += value
+    balances.pop("0x" + "0" * 40, None)
+
+    verification = recorded.get("contract_verification", {})
+    return {
+        "head": head,
+        "genesis": {"block": mint_block, "timestamp": mint_time},
+        "token": {
+            "address": recorded["token_address"].lower(),
+            "name": info["name"],
+            "symbol": info["symbol"],
+            "decimals": info["decimals"],
+            "total_supply": info["total_supply_raw"],
+            "owner": info.get("owner"),
+            "code": runtime_code(token["contract_info"]["code_size"]),
+            "creator": receipt["from"],
+            "creation_tx": tx_hash,
+        },
+        "balances": dict(balances),
+        "transactions": {tx_hash: transaction},
+        "receipts": {tx_hash: receipt},
+        "logs": logs,
+        "verification": {
+            "SourceCode": verification.get("source_code") or "",
+            "ContractName": verification.get("contract_name") or "",
+            "CompilerVersion": verification.get("compiler_version") or "",
+            "OptimizationUsed": verification.get("optimization") or "",
+        },
+    }
+
+
+def _topics_match(topics: List[str], wanted: List[Any]) -> bool:
+    """eth_getLogs topic filtering: None matches anything, a list matches any of its entries."""
+    for i, option in enumerate(wanted):
+        if option is None:
+            continue
+        options = {option.lower()} if isinstance(option, str) else {entry.lower() for entry in option}
+        if i >= len(topics) or topics[i].lower() not in options:
+            return False
+    return True
+
+
+def _word(value: int) -> str:
+    return f"{value:064x}"
+
+
+def _string(value: str) -> str:
+    raw = value.encode().hex()
+    return _word(32) + _word(len(value.encode())) + raw + "0" * (-len(raw) % 64)
+
+
+class ReplayChain:
+    """Answers JSON-RPC calls from fixture state and counts them per method."""
+
+    def __init__(self, fixture: Dict[str, Any]):
+        self.fixture = fixture
+        self.token = fixture["token"]
+        self.counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.counts[key] += 1
+
+    def timestamp(self, block: int) -> int:
+        genesis = self.fixture["genesis"]
+        return genesis["timestamp"] + int((block - genesis["block"]) * BLOCK_TIME)
+
+    def _block_number(self, tag: Any) -> int:
+        head = self.fixture["head"]
+        if tag in (None, "latest", "pending", "safe"):
+            return head
+        if tag == "finalized":
+            return head - FINALIZED_LAG
+        if tag == "earliest":
+            return 0
+        return int(tag, 16) if isinstance(tag, str) else int(tag)
+
+    def _block(self, tag: Any) -> Optional[Dict[str, Any]]:
+        number = self._block_number(tag)
+        if number > self.fixture["head"]:
+            return None
+        transactions = [tx["hash"] for tx in self.fixture["transactions"].values() if int(tx["blockNumber"], 16) == number]
+        return {
+            "number": hex(number),
+            "hash": _hash("block", number),
+            "parentHash": _hash("block", number - 1),
+            "timestamp": hex(self.timestamp(number)),
+            "miner": "0x" + "00" * 20,
+            "gasLimit": hex(1_125_899_906_842_624),
+            "gasUsed": "0x0",
+            "baseFeePerGas": hex(GAS_PRICE),
+            "difficulty": "0x1",
+            "totalDifficulty": hex(number),
+            "extraData": "0x",
+            "logsBloom": "0x" + "00" * 256,
+            "nonce": "0x0000000000000000",
+            "sha3Uncles": _hash("uncles"),
+            "stateRoot": _hash("state", number),
+            "receiptsRoot": _hash("receipts", number),
+            "transactionsRoot": _hash("transactions", number),
+            "size": "0x0",
+            "uncles": [],
+            "transactions": transactions,
+        }
+
+    def _call(self, to: str, data: str) -> str:
+        """Return data of an eth_call, raising ValueError for a revert."""
+        to = (to or "").lower()
+        selector = data[:10]
+        if to == MULTICALL3_ADDRESS and selector == AGGREGATE3_SELECTOR:
+            return self._aggregate3(data)
+        if to != self.token["address"]:
+            return "0x"
+        if selector == FUNCTIONS["name"][0]:
+            return "0x" + _string(self.token["name"])
+        if selector == FUNCTIONS["symbol"][0]:
+            return "0x" + _string(self.token["symbol"])
+        if selector == FUNCTIONS["decimals"][0]:
+            return "0x" + _word(self.token["decimals"])
+        if selector == FUNCTIONS["totalSupply"][0]:
+            return "0x" + _word(self.token["total_supply"])
+        if selector == FUNCTIONS["owner"][0] and self.token["owner"]:
+            return "0x" + encode_address(self.token["owner"])
+        if selector == FUNCTIONS["balanceOf"][0]:
+            return "0x" + _word(self.fixture["balances"].get("0x" + data[-40:].lower(), 0))
+        raise ValueError("execution reverted")
+
+    def _aggregate3(self, data: str) -> str:
+        from eth_abi import decode, encode
+        calls = decode(["(address,bool,bytes)[]"], bytes.fromhex(data[10:]))[0]
+        results = []
+        for target, allow_failure, calldata in calls:
+            try:
+                results.append((True, bytes.fromhex(self._call(target, "0x" + calldata.hex())[2:])))
+            except ValueError:
+                if not allow_failure:
+                    raise
+                results.append((False, b""))
+        return "0x" + encode(["(bool,bytes)[]"], [results]).hex()
+
+    def _logs(self, log_filter: Dict[str, Any]) -> List[Dict[str, Any]]:
+        start = self._block_number(log_filter.get("fromBlock", "latest"))
+        end = self._block_number(log_filter.get("toBlock", "latest"))
+        addresses = log_filter.get("address")
+        if isinstance(addresses, str):
+            addresses = [addresses]
+        addresses = {address.lower() for address in addresses} if addresses else None
+        matched = []
+        for log in self.fixture["logs"]:
+            if not start <= int(log["blockNumber"], 16) <= end:
+                continue
+            if addresses is not None and log["address"] not in addresses:
+                continue
+            if _topics_match(log["topics"], log_filter.get("topics") or []):
+                matched.append(log)
+        return matched
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        method, params = request.get("method"), request.get("params") or []
+        self.count(method)
+        try:
+            result = self._dispatch(method, params)
+        except ValueError as e:
+            return {"jsonrpc": "2.0", "id": request.get("id"), "error": {"code": 3, "message": str(e)}}
+        except KeyError:
+            self.count("unhandled")
+            return {"jsonrpc": "2.0", "id": request.get("id"),
+                    "error": {"code": -32601, "message": f"Method {method} not replayed"}}
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+    def _dispatch(self, method: str, params: List[Any]) -> Any:
+        if method == "eth_chainId":
+            return hex(CHAIN_ID)
+        if method == "net_version":
+            return str(CHAIN_ID)
+        if method == "eth_blockNumber":
+            return hex(self.fixture["head"])
+        if method == "eth_gasPrice":
+            return hex(GAS_PRICE)
+        if method == "eth_getBlockByNumber":
+            return self._block(params[0])
+        if method == "eth_getCode":
+            return self.token["code"] if params[0].lower() == self.token["address"] else "0x"
+        if method == "eth_call":
+            return self._call(params[0].get("to"), params[0].get("data") or params[0].get("input") or "0x")
+        if method == "eth_getTransactionByHash":
+            return self.fixture["transactions"].get(params[0].lower())
+        if method == "eth_getTransactionReceipt":
+            return self.fixture["receipts"].get(params[0].lower())
+        if method == "eth_getBlockReceipts":
+            number = self._block_number(params[0])
+            return [receipt for receipt in self.fixture["receipts"].values() if int(receipt["blockNumber"], 16) == number]
+        if method == "eth_getLogs":
+            return self._logs(params[0])
+        raise KeyError(method)
+
+
+class ReplayExplorer:
+    """Answers the Arbiscan API actions the scripts use from fixture state, counting them per action."""
+
+    def __init__(self, fixture: Dict[str, Any], chain: ReplayChain):
+        self.fixture = fixture
+        self.chain = chain
+        self.counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def handle(self, params: Dict[str, str]) -> Dict[str, Any]:
+        action = params.get("action", "")
+        with self._lock:
+            self.counts[action] += 1
+        token = self.fixture["token"]
+        if action == "getsourcecode":
+            return {"status": "1", "message": "OK", "result": [dict(self.fixture["verification"])]}
+        if action == "getcontractcreation":
+            wanted = params.get("contractaddresses", "").lower().split(",")
+            result = [{"contractAddress": token["address"], "contractCreator": token["creator"], "txHash": token["creation_tx"]}
+                      for address in wanted if address == token["address"]]
+            return {"status": "1" if result else "0", "message": "OK" if result else "No data found", "result": result or None}
+        if action == "tokentx":
+            return self._tokentx(params)
+        if action == "getLogs":
+            to_block = params.get("toBlock", "latest")
+            logs = self.chain._logs({
+                "address": params.get("address"),
+                "fromBlock": hex(int(params.get("fromBlock", "0"))),
+                "toBlock": to_block if to_block == "latest" else hex(int(to_block)),
+            })
+            return {"status": "1" if logs else "0", "message": "OK" if logs else "No records found", "result": logs}
+        with self._lock:
+            self.counts["unhandled"] += 1
+        return {"status": "0", "message": "NOTOK", "result": f"Action {action} not replayed"}
+
+    def _tokentx(self, params: Dict[str, str]) -> Dict[str, Any]:
+        token = self.fixture["token"]
+        transfers = []
+        for log in self.fixture["logs"]:
+            if log["topics"][0] != EVENT_TOPICS["Transfer"] or log["address"] != token["address"]:
+                continue
+            block = int(log["blockNumber"], 16)
+            transfers.append({
+                "blockNumber": str(block),
+                "timeStamp": str(self.chain.timestamp(block)),
+                "hash": log["transactionHash"],
+                "from": "0x" + log["topics"][1][-40:],
+                "to": "0x" + log["topics"][2][-40:],
+                "value": str(int(log["data"], 16)),
+                "contractAddress": token["address"],
+                "tokenName": token["name"],
+                "tokenSymbol": token["symbol"],
+                "tokenDecimal": str(token["decimals"]),
+                "transactionIndex": str(int(log["transactionIndex"], 16)),
+            })
+        if params.get("sort") == "desc":
+            transfers.reverse()
+        offset = int(params.get("offset", "20"))
+        page = int(params.get("page", "1"))
+        result = transfers[(page - 1) * offset:page * offset]
+        return {"status": "1" if result else "0", "message": "OK" if result else "No transactions found", "result": result}
+
+
+def _handler(respond, latency: float, counter: Counter, lock: threading.Lock):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, payload: Any) -> None:
+            if latency:
+                time.sleep(latency)
+            body = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            with lock:
+                counter["http_requests"] += 1
+            query = {key: values[-1] for key, values in parse_qs(urlparse(self.path).query).items()}
+            self._reply(respond(query))
+
+        def do_POST(self):
+            with lock:
+                counter["http_requests"] += 1
+            raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if self.headers.get("Content-Type", "").startswith("application/json"):
+                self._reply(respond(json.loads(raw)))
+            else:
+                self._reply(respond({key: values[-1] for key, values in parse_qs(raw.decode()).items()}))
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+class ReplayServers:
+    """The JSON-RPC and Arbiscan stand-ins, each on its own local port, served from background threads."""
+
+    def __init__(self, fixture: Dict[str, Any], rpc_port: int = 0, arbiscan_port: int = 0, latency: float = 0.0):
+        self.chain = ReplayChain(fixture)
+        self.explorer = ReplayExplorer(fixture, self.chain)
+        self.http = {"rpc": Counter(), "arbiscan": Counter()}
+        lock = threading.Lock()
+
+        def rpc(payload):
+            if isinstance(payload, list):
+                self.chain.count("batch")
+                return [self.chain.handle(item) for item in payload]
+            return self.chain.handle(payload)
+
+        self.rpc_server = ThreadingHTTPServer(("127.0.0.1", rpc_port), _handler(rpc, latency, self.http["rpc"], lock))
+        self.arbiscan_server = ThreadingHTTPServer(("127.0.0.1", arbiscan_port),
+                                                   _handler(self.explorer.handle, latency, self.http["arbiscan"], lock))
+        self.rpc_server.daemon_threads = self.arbiscan_server.daemon_threads = True
+
+    @property
+    def rpc_url(self) -> str:
+        return f"http://127.0.0.1:{self.rpc_server.server_port}/"
+
+    @property
+    def arbiscan_url(self) -> str:
+        return f"http://127.0.0.1:{self.arbiscan_server.server_port}/api"
+
+    def start(self) -> "ReplayServers":
+        for server in (self.rpc_server, self.arbiscan_server):
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        for server in (self.rpc_server, self.arbiscan_server):
+            server.shutdown()
+            server.server_close()
+
+    def reset_counts(self) -> None:
+        self.chain.counts.clear()
+        self.explorer.counts.clear()
+        for counter in self.http.values():
+            counter.clear()
+
+    def counts(self) -> Dict[str, int]:
+        """Requests per JSON-RPC method ("rpc.") and Arbiscan action ("arbiscan."), plus HTTP round trips ("http.")."""
+        counts = {f"rpc.{method}": count for method, count in self.chain.counts.items()}
+        counts.update({f"arbiscan.{action}": count for action, count in self.explorer.counts.items()})
+        counts.update({f"http.{name}": counter["http_requests"] for name, counter in self.http.items() if counter})
+        return dict(sorted(counts.items()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve recorded SDM chain and Arbiscan state locally")
+    parser.add_argument("--fixture", default=DEFAULT_FIXTURE, help="token_verification_data_*.json recording")
+    parser.add_argument("--rpc-port", type=int, default=8545)
+    parser.add_argument("--arbiscan-port", type=int, default=8546)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every HTTP response")
+    args = parser.parse_args(argv)
+
+    servers = ReplayServers(load_fixture(args.fixture), args.rpc_port, args.arbiscan_port, args.latency).start()
+    print(f"JSON-RPC: {servers.rpc_url}")
+    print(f"Arbiscan: {servers.arbiscan_url}")
+    print(f"Run scripts with ARBITRUM_RPC_URL={servers.rpc_url} ARBISCAN_API_URL={servers.arbiscan_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print(json.dumps(servers.counts(), indent=2))
+        servers.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
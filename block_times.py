@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Persistent block timestamp cache with block-at-time lookup
+Block times vary on Arbitrum, so ages and date ranges are computed from real header timestamps
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from rpc_pool import RPCPool, get_rpc_pool
+
+BLOCK_TIMES_DB = os.getenv('BLOCK_TIMES_DB', 'sdm_block_times.db')
+
+# Headers per JSON-RPC batch when filling the cache
+DEFAULT_BATCH_SIZE = 100
+
+
+class BlockTimes:
+    """block number -> timestamp cache backed by SQLite. Timestamps never change once a block is final."""
+
+    def __init__(self, path: str = BLOCK_TIMES_DB, pool: Optional[RPCPool] = None, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.pool = pool or get_rpc_pool()
+        self.batch_size = batch_size
+        self.fetches = 0
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS block_times (block_number INTEGER PRIMARY KEY, timestamp INTEGER NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_block_times_timestamp ON block_times (timestamp)")
+        self._memory: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _store(self, timestamps: Dict[int, int]) -> None:
+        with self._lock, self.conn:
+            self._memory.update(timestamps)
+            self.conn.executemany("INSERT OR REPLACE INTO block_times VALUES (?, ?)", timestamps.items())
+
+    def _cached(self, blocks: List[int]) -> Dict[int, int]:
+        found = {block: self._memory[block] for block in blocks if block in self._memory}
+        missing = [block for block in blocks if block not in found]
+        for i in range(0, len(missing), 500):
+            chunk = missing[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT block_number, timestamp FROM block_times WHERE block_number IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            found.update(rows)
+        self._memory.update(found)
+        return found
+
+    def timestamps(self, block_numbers: Iterable[int]) -> Dict[int, int]:
+        """Timestamps for many blocks; only uncached blocks are fetched, in batches."""
+        blocks = sorted(set(block_numbers))
+        result = self._cached(blocks)
+        missing = [block for block in blocks if block not in result]
+        for i in range(0, len(missing), self.batch_size):
+            chunk = missing[i:i + self.batch_size]
+            responses = self.pool.batch([("eth_getBlockByNumber", [hex(block), False]) for block in chunk])
+            self.fetches += len(chunk)
+            fetched = {
+                block: int(response["result"]["timestamp"], 16)
+                for block, response in zip(chunk, responses) if response.get("result")
+            }
+            self._store(fetched)
+            result.update(fetched)
+        return result
+
+    def timestamp(self, block_number: int) -> int:
+        timestamps = self.timestamps([block_number])
+        if block_number not in timestamps:
+            raise LookupError(f"Block {block_number} not found")
+        return timestamps[block_number]
+
+    def head(self) -> Tuple[int, int]:
+        """Latest block number and its timestamp."""
+        block = self.pool.request("eth_getBlockByNumber", ["latest", False])
+        number, timestamp = int(block["number"], 16), int(block["timestamp"], 16)
+        self._store({number: timestamp})
+        return number, timestamp
+
+    def _bracket(self, timestamp: int, low: int, high: int) -> Tuple[int, int]:
+        """Narrow [low, high] using cached blocks on either side of timestamp."""
+        below = self.conn.execute(
+            "SELECT MAX(block_number) FROM block_times WHERE timestamp <= ? AND block_number BETWEEN ? AND ?",
+            (timestamp, low, high),
+        ).fetchone()[0]
+        above = self.conn.execute(
+            "SELECT MIN(block_number) FROM block_times WHERE timestamp > ? AND block_number BETWEEN ? AND ?",
+            (timestamp, low, high),
+        ).fetchone()[0]
+        return (below if below is not None else low), (above if above is not None else high)
+
+    def block_at(self, timestamp: int, low: int = 0, high: Optional[int] = None) -> int:
+        """Last block whose timestamp is <= timestamp, found by interpolation search.
+
+        Block times are close to uniform over short spans, so each guess lands
+        near the answer and only a handful of headers are fetched. A bisection
+        step is taken whenever a guess fails to halve the range, which bounds
+        the worst case on uneven stretches.
+        """
+        if high is None:
+            high = self.head()[0]
+        if self.timestamp(high) <= timestamp:
+            return high
+        if self.timestamp(low) > timestamp:
+            raise ValueError(f"Timestamp {timestamp} is before block {low}")
+
+        # Invariant: ts(low) <= timestamp < ts(high)
+        low, high = self._bracket(timestamp, low, high)
+        bisect_next = False
+        while high - low > 1:
+            bounds = self.timestamps([low, high])
+            low_ts, high_ts = bounds[low], bounds[high]
+            if bisect_next or high_ts == low_ts:
+                guess = (low + high) // 2
+            else:
+                guess = low + (timestamp - low_ts) * (high - low) // (high_ts - low_ts)
+            guess = min(max(guess, low + 1), high - 1)
+
+            span = high - low
+            if self.timestamp(guess) <= timestamp:
+                low = guess
+            else:
+                high = guess
+            bisect_next = (high - low) * 2 > span
+        return low
+
+
+def utc_date(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime('%Y-%m-%d')
+
+
+def daily_counts(block_times: BlockTimes, block_numbers: Iterable[int]) -> Dict[str, int]:
+    """Count occurrences per UTC day for a list of block numbers (one entry per log or tx)."""
+    block_numbers = list(block_numbers)
+    timestamps = block_times.timestamps(block_numbers)
+    counts: Dict[str, int] = {}
+    for block in block_numbers:
+        day = utc_date(timestamps[block])
+        counts[day] = counts.get(day, 0) + 1
+    return dict(sorted(counts.items()))
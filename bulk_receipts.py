@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Bulk receipt fetching
+Fetches many receipts per round trip with eth_getBlockReceipts or JSON-RPC batches
+"""
+
+from typing import Dict, Any, Iterable, List, Optional, Set
+
+from hexbytes import HexBytes
+
+from event_decoder import to_checksum_address
+from log_scanner import normalize_log
+from rpc_pool import RPCPool, get_rpc_pool
+
+# Calls per JSON-RPC batch; most providers accept at least 100
+DEFAULT_BATCH_SIZE = 100
+
+# Blocks per eth_getBlockReceipts batch; each response carries every receipt in the block
+DEFAULT_BLOCK_BATCH_SIZE = 20
+
+
+def _address(value: Optional[str]) -> Optional[str]:
+    return to_checksum_address(value) if value else None
+
+
+def normalize_receipt(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a raw JSON-RPC receipt into the shape web3's get_transaction_receipt returns."""
+    return {
+        "transactionHash": HexBytes(raw["transactionHash"]),
+        "transactionIndex": int(raw["transactionIndex"], 16),
+        "blockHash": HexBytes(raw["blockHash"]),
+        "blockNumber": int(raw["blockNumber"], 16),
+        "from": _address(raw.get("from")),
+        "to": _address(raw.get("to")),
+        "contractAddress": _address(raw.get("contractAddress")),
+        "status": int(raw.get("status", "0x1"), 16),
+        "gasUsed": int(raw["gasUsed"], 16),
+        "cumulativeGasUsed": int(raw.get("cumulativeGasUsed", "0x0"), 16),
+        "effectiveGasPrice": int(raw.get("effectiveGasPrice", "0x0"), 16),
+        "logs": [normalize_log(log) for log in raw.get("logs", [])],
+    }
+
+
+def _chunks(items: List[Any], size: int) -> Iterable[List[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class ReceiptFetcher:
+    """Fetch receipts for many transactions with as few round trips as possible."""
+
+    def __init__(self, pool: Optional[RPCPool] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                 block_batch_size: int = DEFAULT_BLOCK_BATCH_SIZE):
+        self.pool = pool or get_rpc_pool()
+        self.batch_size = batch_size
+        self.block_batch_size = block_batch_size
+        self.block_receipts_supported: Optional[bool] = None
+        self.round_trips = 0
+
+    def _batch(self, calls):
+        self.round_trips += 1
+        return self.pool.batch(calls)
+
+    def receipts(self, tx_hashes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Receipts keyed by lowercase tx hash; hashes without a receipt are left out."""
+        hashes = list(dict.fromkeys(tx_hash.lower() for tx_hash in tx_hashes))
+        receipts = {}
+        for chunk in _chunks(hashes, self.batch_size):
+            responses = self._batch([("eth_getTransactionReceipt", [tx_hash]) for tx_hash in chunk])
+            for tx_hash, response in zip(chunk, responses):
+                if response.get("result"):
+                    receipts[tx_hash] = normalize_receipt(response["result"])
+        return receipts
+
+    def block_receipts(self, block_numbers: Iterable[int], tx_hashes: Optional[Set[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Receipts of every tx in the given blocks (optionally only tx_hashes), keyed by lowercase tx hash.
+
+        Uses eth_getBlockReceipts when the provider supports it; otherwise needs
+        tx_hashes and falls back to batched eth_getTransactionReceipt.
+        """
+        blocks = sorted(set(block_numbers))
+        wanted = {tx_hash.lower() for tx_hash in tx_hashes} if tx_hashes is not None else None
+        receipts = {}
+        missing_blocks = []
+
+        if self.block_receipts_supported is not False:
+            for chunk in _chunks(blocks, self.block_batch_size):
+                responses = self._batch([("eth_getBlockReceipts", [hex(block)]) for block in chunk])
+                for block, response in zip(chunk, responses):
+                    if "error" in response or response.get("result") is None:
+                        missing_blocks.append(block)
+                        continue
+                    self.block_receipts_supported = True
+                    for raw in response["result"]:
+                        tx_hash = raw["transactionHash"].lower()
+                        if wanted is None or tx_hash in wanted:
+                            receipts[tx_hash] = normalize_receipt(raw)
+                if self.block_receipts_supported is None:
+                    # The first chunk failed entirely, so the provider doesn't support it
+                    self.block_receipts_supported = False
+                    missing_blocks.extend(blocks[len(chunk):])
+                    break
+        else:
+            missing_blocks = blocks
+
+        if missing_blocks:
+            if wanted is None:
+                raise RuntimeError("eth_getBlockReceipts is not supported; pass tx_hashes to fall back")
+            receipts.update(self.receipts(tx_hash for tx_hash in wanted if tx_hash not in receipts))
+        return receipts
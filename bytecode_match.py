@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Local bytecode-match search for contract verification
+Compiles the source over a matrix of compiler settings in parallel and finds the one that reproduces the deployed code
+"""
+
+import os
+import json
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from evm_disasm import metadata_trailer
+from compile_cache import CompileCache, artifacts, compile_key
+
+# Optional path template for solc binaries, e.g. /opt/solc/solc-{version}
+SOLC_BINARY = os.getenv('SOLC_BINARY', '')
+
+# Where foundry (svm) and py-solc-x install compilers
+SOLC_SEARCH_PATHS = [
+    os.path.expanduser("~/.svm/{version}/solc-{version}"),
+    os.path.expanduser("~/.solcx/solc-v{version}"),
+]
+
+DEFAULT_OPTIMIZER_RUNS = [200, 10_000, 1, 1_000, 1_000_000, None]  # None: optimizer off
+# Releases that know none of these (before 0.5.14) are compiled with their own default
+DEFAULT_EVM_VERSIONS = ["paris", "london", "shanghai", "cancun", "berlin", "istanbul"]
+
+# First release that accepts each EVM version
+EVM_VERSION_SINCE = {
+    "istanbul": (0, 5, 14),
+    "berlin": (0, 8, 5),
+    "london": (0, 8, 7),
+    "paris": (0, 8, 18),
+    "shanghai": (0, 8, 20),
+    "cancun": (0, 8, 24),
+}
+
+# via-IR output is only stable enough to have been used for deployments from here on
+VIA_IR_SINCE = (0, 8, 13)
+
+COMPILE_TIMEOUT = 300
+
+
+class SearchUnavailable(Exception):
+    """The search could not run: no local compiler, or no settings to try with the installed ones."""
+
+
+def _version_tuple(version: str) -> Tuple[int, ...]:
+    return tuple(int(part) for part in version.lstrip("v").split("+")[0].split("."))
+
+
+def find_solc(version: str) -> Optional[str]:
+    """Path of a solc binary for an exact version, or None if none is installed."""
+    candidates = [SOLC_BINARY] if SOLC_BINARY else []
+    candidates += SOLC_SEARCH_PATHS
+    for template in candidates:
+        path = template.format(version=version)
+        if os.path.isfile(path) and os.access(path, os.X_OK):
+            return path
+    path = shutil.which("solc")
+    if path:
+        try:
+            output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+        if f"Version: {version}+" in output:
+            return path
+    return None
+
+
+def standard_input(sources: Dict[str, str], optimizer_runs: Optional[int], via_ir: bool,
+                   evm_version: Optional[str]) -> Dict[str, Any]:
+    """solc standard-JSON input for one candidate. Only runtime bytecode is requested."""
+    settings: Dict[str, Any] = {
+        "optimizer": {"enabled": optimizer_runs is not None, "runs": optimizer_runs or 200},
+        "outputSelection": {"*": {"*": ["evm.bytecode.object", "evm.deployedBytecode.object",
+                                        "evm.deployedBytecode.immutableReferences"]}},
+    }
+    if via_ir:
+        settings["viaIR"] = True
+    if evm_version:
+        settings["evmVersion"] = evm_version
+    return {
+        "language": "Solidity",
+        "sources": {path: {"content": content} for path, content in sources.items()},
+        "settings": settings,
+    }
+
+
+def compile_standard(solc: str, input_json: Dict[str, Any], version: Optional[str] = None,
+                     cache: Optional[CompileCache] = None) -> Dict[str, Any]:
+    """Run solc --standard-json and return its parsed output.
+
+    With a cache (and the compiler version for the key), artifacts of an earlier
+    identical compile are returned without running solc.
+    """
+    key = compile_key(version, input_json) if cache is not None and version else None
+    if key:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    result = subprocess.run([solc, "--standard-json"], input=json.dumps(input_json),
+                            capture_output=True, text=True, timeout=COMPILE_TIMEOUT)
+    if not result.stdout:
+        raise RuntimeError(f"solc failed: {result.stderr.strip()}")
+    output = json.loads(result.stdout)
+    errors = [error for error in output.get("errors", []) if error.get("severity") == "error"]
+    if errors:
+        raise RuntimeError(errors[0].get("formattedMessage", errors[0].get("message")))
+    if key:
+        output = artifacts(output)
+        cache.put(key, output)
+    return output
+
+
+def runtime_artifact(output: Dict[str, Any], contract_file: str, contract_name: str) -> Tuple[bytes, Dict[str, Any]]:
+    """(runtime bytecode, immutable references) of one contract from solc output."""
+    evm = output["contracts"][contract_file][contract_name]["evm"]
+    deployed = evm["deployedBytecode"]
+    return bytes.fromhex(deployed["object"]), deployed.get("immutableReferences", {})
+
+
+def creation_code(match: Dict[str, Any], contract_file: str, contract_name: str) -> bytes:
+    """Init code compiled with a match's settings; after a search it comes straight from the compile cache."""
+    solc = find_solc(match["version"])
+    if solc is None:
+        raise FileNotFoundError(f"No local solc for {match['version']}")
+    output = compile_standard(solc, match["input"], match["version"], CompileCache())
+    return bytes.fromhex(output["contracts"][contract_file][contract_name]["evm"]["bytecode"]["object"])
+
+
+def mask(code: bytes, immutable_references: Dict[str, Any]) -> bytes:
+    """Strip the metadata trailer and zero out immutable slots so only compiler output is compared."""
+    end, _ = metadata_trailer(code)
+    masked = bytearray(code[:end])
+    for references in immutable_references.values():
+        for reference in references:
+            start, length = reference["start"], reference["length"]
+            masked[start:start + length] = b"\0" * min(length, max(0, len(masked) - start))
+    return bytes(masked)
+
+
+def candidates(versions: Iterable[str], optimizer_runs: Iterable[Optional[int]] = DEFAULT_OPTIMIZER_RUNS,
+               via_ir: Iterable[bool] = (False, True),
+               evm_versions: Iterable[str] = DEFAULT_EVM_VERSIONS) -> List[Dict[str, Any]]:
+    """Settings matrix, most likely combinations first.
+
+    EVM versions a compiler doesn't know are skipped; a compiler that knows none
+    of them is tried with its default EVM version instead.
+    """
+    evm_versions = list(evm_versions)
+    matrix = []
+    for ir in via_ir:
+        for version in versions:
+            release = _version_tuple(version)
+            if ir and release < VIA_IR_SINCE:
+                continue
+            known = [evm_version for evm_version in evm_versions
+                     if release >= EVM_VERSION_SINCE.get(evm_version, (0, 0, 0))] or [None]
+            for runs in optimizer_runs:
+                for evm_version in known:
+                    matrix.append({"version": version, "optimizer_runs": runs, "via_ir": ir, "evm_version": evm_version})
+    return matrix
+
+
+def _try_candidate(candidate: Dict[str, Any], solc: str, sources: Dict[str, str], contract_file: str,
+                   contract_name: str, target: bytes) -> Tuple[Dict[str, Any], Optional[str], Optional[str]]:
+    """Compile one candidate in a worker process. Returns (candidate, "exact"/"partial"/None, error)."""
+    input_json = standard_input(sources, candidate["optimizer_runs"], candidate["via_ir"], candidate["evm_version"])
+    try:
+        output = compile_standard(solc, input_json, candidate["version"], CompileCache())
+        code, immutables = runtime_artifact(output, contract_file, contract_name)
+    except Exception as e:
+        return candidate, None, str(e)
+    if mask(code, immutables) != mask(target, immutables):
+        return candidate, None, None
+    # Identical metadata means the sources hash the same too, not just the code
+    exact = metadata_trailer(code)[1] == metadata_trailer(target)[1]
+    return candidate, "exact" if exact else "partial", None
+
+
+def search(onchain_code: bytes, sources: Dict[str, str], contract_file: str, contract_name: str,
+           versions: Iterable[str], max_workers: Optional[int] = None, verbose: bool = True,
+           **matrix: Any) -> Optional[Dict[str, Any]]:
+    """Find the compiler settings that reproduce onchain_code, compiling candidates in parallel.
+
+    Returns the matching candidate with its standard-JSON input, or None. Raises
+    SearchUnavailable if no requested compiler version is installed locally or
+    there are no settings to try, so callers never read that as "no match".
+    """
+    say = print if verbose else (lambda *args, **kwargs: None)
+    target = bytes(onchain_code)
+    solcs = {version: find_solc(version) for version in versions}
+    missing = [version for version, path in solcs.items() if path is None]
+    if missing:
+        say(f"⚠️  solc {', '.join(missing)} not installed locally, skipping")
+    available = [version for version, path in solcs.items() if path]
+    if not available:
+        raise SearchUnavailable(f"No local solc for {', '.join(solcs)}")
+
+    matrix = candidates(available, **matrix)
+    if not matrix:
+        raise SearchUnavailable(f"No compiler settings to try for solc {', '.join(available)}")
+    say(f"🔬 Compiling {len(matrix)} candidate settings locally...")
+    best = None
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_try_candidate, candidate, solcs[candidate["version"]], sources,
+                            contract_file, contract_name, target)
+            for candidate in matrix
+        ]
+        for future in as_completed(futures):
+            candidate, match, error = future.result()
+            if error:
+                say(f"   ❌ {describe(candidate)}: {error.splitlines()[0]}")
+            if match and (best is None or match == "exact"):
+                best = {**candidate, "match": match}
+                say(f"   ✅ {describe(candidate)}: {match} match")
+                if match == "exact":
+                    break
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    if best is not None:
+        best["input"] = standard_input(sources, best["optimizer_runs"], best["via_ir"], best["evm_version"])
+    return best
+
+
+def describe(candidate: Dict[str, Any]) -> str:
+    runs = candidate["optimizer_runs"]
+    optimizer = f"runs={runs}" if runs is not None else "optimizer off"
+    return (f"solc {candidate['version']}, {optimizer}, {candidate['evm_version'] or 'default'}"
+            + (", via-IR" if candidate["via_ir"] else ""))
+
+
+def arbiscan_params(match: Dict[str, Any], address: str, contract_file: str, contract_name: str,
+                    compiler_version: str, constructor_args: str = "", license_type: str = "3") -> Dict[str, Any]:
+    """verifysourcecode parameters for a match, submitted as standard-JSON so every setting (viaIR too) is carried over."""
+    input_json = json.loads(json.dumps(match["input"]))
+    # Arbiscan recompiles with its own output selection
+    input_json["settings"].pop("outputSelection", None)
+    return {
+        "contractaddress": address,
+        "sourceCode": json.dumps(input_json),
+        "codeformat": "solidity-standard-json-input",
+        "contractname": f"{contract_file}:{contract_name}",
+        "compilerversion": compiler_version,
+        "constructorArguements": constructor_args,  # Note: Arbiscan uses this spelling
+        "licenseType": license_type,
+    }
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Decoder for the CBOR metadata solc appends to runtime bytecode
+Recovers the exact compiler version and source hash so verification can target the right compiler
+"""
+
+from typing import Dict, Any, Optional, Tuple
+
+from evm_disasm import metadata_trailer
+
+# Long version strings Arbiscan expects for each 0.8.x release
+SOLC_BUILDS = {
+    "0.8.0": "c7dfd78e", "0.8.1": "df193b15", "0.8.2": "661d1103", "0.8.3": "8d00100c",
+    "0.8.4": "c7e474f2", "0.8.5": "a4f2e591", "0.8.6": "11564f7e", "0.8.7": "e28d00a7",
+    "0.8.8": "dddeac2f", "0.8.9": "e5eed63a", "0.8.10": "fc410830", "0.8.11": "d7f03943",
+    "0.8.12": "f00d7308", "0.8.13": "abaa5c0e", "0.8.14": "80d49f37", "0.8.15": "e14f2714",
+    "0.8.16": "07a7930e", "0.8.17": "8df45f5f", "0.8.18": "87f61d96", "0.8.19": "7dd6d404",
+    "0.8.20": "a1b79de6", "0.8.21": "d9974bed", "0.8.22": "4fc1097e", "0.8.23": "f704f362",
+    "0.8.24": "e11b9ed9", "0.8.25": "b61c2a91", "0.8.26": "8a97fa7a", "0.8.27": "40a35a09",
+    "0.8.28": "7893614a",
+}
+
+# Official release list, consulted for versions missing from SOLC_BUILDS
+SOLC_LIST_URL = "https://binaries.soliditylang.org/linux-amd64/list.json"
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+class CBORError(ValueError):
+    """Metadata is not well-formed CBOR."""
+
+
+def _base58(data: bytes) -> str:
+    number = int.from_bytes(data, "big")
+    encoded = ""
+    while number:
+        number, remainder = divmod(number, 58)
+        encoded = BASE58_ALPHABET[remainder] + encoded
+    return "1" * (len(data) - len(data.lstrip(b"\0"))) + encoded
+
+
+def _read(data: bytes, pos: int) -> Tuple[Any, int]:
+    """Decode one CBOR item at pos. Supports the subset solc emits: uints, byte/text strings, maps, bools."""
+    if pos >= len(data):
+        raise CBORError("Truncated CBOR")
+    initial = data[pos]
+    major, info = initial >> 5, initial & 0x1f
+    pos += 1
+    if info < 24:
+        value = info
+    elif info <= 27:
+        size = 1 << (info - 24)
+        if pos + size > len(data):
+            raise CBORError("Truncated CBOR")
+        value = int.from_bytes(data[pos:pos + size], "big")
+        pos += size
+    elif info == 31 and major == 5:
+        value = None  # Indefinite-length map
+    else:
+        raise CBORError(f"Unsupported CBOR item 0x{initial:02x}")
+
+    if major == 0:
+        return value, pos
+    if major in (2, 3):
+        if pos + value > len(data):
+            raise CBORError("Truncated CBOR string")
+        raw = bytes(data[pos:pos + value])
+        return (raw if major == 2 else raw.decode("utf-8")), pos + value
+    if major == 5:
+        result = {}
+        while value is None or len(result) < value:
+            if value is None and data[pos] == 0xff:
+                return result, pos + 1
+            key, pos = _read(data, pos)
+            result[key], pos = _read(data, pos)
+        return result, pos
+    if major == 7 and info in (20, 21):
+        return info == 21, pos
+    raise CBORError(f"Unsupported CBOR major type {major}")
+
+
+def decode_cbor(data: bytes) -> Dict[str, Any]:
+    value, pos = _read(data, 0)
+    if not isinstance(value, dict) or pos != len(data):
+        raise CBORError("Metadata is not a single CBOR map")
+    return value
+
+
+def decode_metadata(code: bytes) -> Optional[Dict[str, Any]]:
+    """Decode the metadata trailer of runtime code; None if the code carries no (valid) metadata.
+
+    Returns the compiler version (solc >= 0.5.9 embeds it), the IPFS CID or
+    Swarm hash of the metadata JSON and whether experimental features were on.
+    """
+    _, trailer = metadata_trailer(bytes(code))
+    if trailer is None:
+        return None
+    try:
+        fields = decode_cbor(trailer)
+    except (CBORError, UnicodeDecodeError, IndexError):
+        return None
+
+    solc = fields.get("solc")
+    if isinstance(solc, bytes) and len(solc) == 3:
+        # Releases store major, minor, patch as three bytes; prereleases store the full string
+        solc = ".".join(str(part) for part in solc)
+    return {
+        "solc": solc,
+        "ipfs": _base58(fields["ipfs"]) if isinstance(fields.get("ipfs"), bytes) else None,
+        "bzzr0": fields["bzzr0"].hex() if isinstance(fields.get("bzzr0"), bytes) else None,
+        "bzzr1": fields["bzzr1"].hex() if isinstance(fields.get("bzzr1"), bytes) else None,
+        "experimental": bool(fields.get("experimental", False)),
+        "fields": sorted(fields),
+    }
+
+
+def arbiscan_compiler_version(version: str, session=None) -> Optional[str]:
+    """Map "0.8.19" to Arbiscan's "v0.8.19+commit.7dd6d404"; None if the build can't be resolved."""
+    if "+commit." in version:
+        return version if version.startswith("v") else "v" + version
+    if version in SOLC_BUILDS:
+        return f"v{version}+commit.{SOLC_BUILDS[version]}"
+    try:
+        import requests
+        releases = (session or requests).get(SOLC_LIST_URL, timeout=10).json()
+        for build in releases.get("builds", []):
+            if build.get("version") == version and not build.get("prerelease"):
+                SOLC_BUILDS[version] = build["longVersion"].split("+commit.")[1]
+                return "v" + build["longVersion"]
+    except (ImportError, OSError, ValueError, KeyError, IndexError):
+        pass
+    return None
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+On-disk cache for immutable JSON-RPC responses
+Transactions, receipts, blocks and state at finalized blocks never change, so they are fetched once and kept in SQLite
+"""
+
+import os
+import json
+import time
+import zlib
+import hashlib
+import sqlite3
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+CHAIN_CACHE_DB = os.getenv('CHAIN_CACHE_DB', 'sdm_chain_cache.db')
+
+# Set CHAIN_CACHE=0 to send every request to the network
+CHAIN_CACHE = os.getenv('CHAIN_CACHE', '1') != '0'
+
+# Least recently used entries are evicted once the cache grows past this size
+CHAIN_CACHE_MAX_MB = int(os.getenv('CHAIN_CACHE_MAX_MB', '256'))
+
+# Evict down to this fraction of the limit so eviction doesn't run on every insert
+EVICT_TO = 0.9
+
+# Methods whose response is identified by a hash in params[0]; cacheable once the
+# block that contains the object is finalized
+BY_HASH = {"eth_getBlockByHash", "eth_getTransactionByHash", "eth_getTransactionReceipt"}
+
+# Methods that read state at an explicit block: position of the block parameter
+BY_BLOCK = {
+    "eth_getBlockByNumber": 0,
+    "eth_getBlockReceipts": 0,
+    "eth_getBalance": 1,
+    "eth_getCode": 1,
+    "eth_getTransactionCount": 1,
+    "eth_call": 1,
+    "eth_getStorageAt": 2,
+}
+
+
+def _block_number(value: Any) -> Optional[int]:
+    """Block number of an explicit hex block parameter; None for tags ("latest", ...) and block hashes."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.startswith("0x") and len(value) <= 18:
+        return int(value, 16)
+    return None
+
+
+def cache_key(method: str, params: Any) -> Optional[str]:
+    """Content key for a request whose response can be cached, or None if it never can."""
+    if method in BY_HASH:
+        if not params or not isinstance(params[0], str):
+            return None
+    elif method in BY_BLOCK:
+        position = BY_BLOCK[method]
+        if len(params) <= position or _block_number(params[position]) is None:
+            return None
+    else:
+        return None
+    canonical = json.dumps([method, params], sort_keys=True, separators=(",", ":")).lower()
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def pinned_block(method: str, params: Any, result: Any) -> Optional[int]:
+    """Block a response depends on; it may be cached once that block is finalized."""
+    if result is None:
+        # Unknown hash or pending data may appear later
+        return None
+    if method in BY_BLOCK:
+        return _block_number(params[BY_BLOCK[method]])
+    number = (result.get("blockNumber") or result.get("number")) if isinstance(result, dict) else None
+    return _block_number(number)
+
+
+class ChainCache:
+    """Size-bounded LRU store of JSON-RPC results keyed by cache_key."""
+
+    def __init__(self, path: str = CHAIN_CACHE_DB, max_bytes: int = CHAIN_CACHE_MAX_MB * 2**20):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses (last_used)")
+        self.size = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return (hit, result) and mark the entry as recently used."""
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return False, None
+            with self.conn:
+                self.conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+            self.hits += 1
+        return True, json.loads(zlib.decompress(row[0]))
+
+    def put(self, key: str, result: Any) -> None:
+        value = zlib.compress(json.dumps(result, separators=(",", ":")).encode(), 1)
+        with self._lock, self.conn:
+            old = self.conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self.conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                              (key, value, len(value), time.time()))
+            self.size += len(value) - (old[0] if old else 0)
+            if self.size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache is back under EVICT_TO of its limit."""
+        target = self.max_bytes * EVICT_TO
+        rows = self.conn.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall()
+        evicted = []
+        for key, size in rows:
+            if self.size <= target:
+                break
+            evicted.append((key,))
+            self.size -= size
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size_mb": round(self.size / 2**20, 1)}
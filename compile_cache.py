@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache of solc compilation artifacts
+Keyed by hash(sources, compiler version, settings), so recompiling unchanged sources with the same settings is instant
+"""
+
+import os
+import gzip
+import json
+import hashlib
+import tempfile
+from typing import Dict, Any, Optional
+
+COMPILE_CACHE_DIR = os.getenv('COMPILE_CACHE_DIR', 'sdm_compile_cache')
+
+# Least recently used artifacts are evicted once the cache grows past this size
+COMPILE_CACHE_MAX_MB = int(os.getenv('COMPILE_CACHE_MAX_MB', '512'))
+
+# Evict down to this fraction of the limit so eviction doesn't run on every write
+EVICT_TO = 0.9
+
+
+def compile_key(version: str, input_json: Dict[str, Any]) -> str:
+    """sha256 over the compiler version, every source and the settings, in canonical JSON."""
+    canonical = json.dumps({"version": version, "sources": input_json["sources"], "settings": input_json["settings"]},
+                           sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def artifacts(output: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only what callers use from solc output: creation and runtime bytecode plus immutable references."""
+    contracts = {}
+    for path, by_name in output.get("contracts", {}).items():
+        for name, contract in by_name.items():
+            evm = contract.get("evm", {})
+            deployed = evm.get("deployedBytecode", {})
+            contracts.setdefault(path, {})[name] = {"evm": {
+                "bytecode": {"object": evm.get("bytecode", {}).get("object", "")},
+                "deployedBytecode": {
+                    "object": deployed.get("object", ""),
+                    "immutableReferences": deployed.get("immutableReferences", {}),
+                },
+            }}
+    return {"contracts": contracts}
+
+
+class CompileCache:
+    """One gzip'd JSON file per artifact set. Writes are atomic renames, so parallel compilers can share it."""
+
+    def __init__(self, directory: str = COMPILE_CACHE_DIR, max_bytes: int = COMPILE_CACHE_MAX_MB * 2**20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".json.gz")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt") as f:
+                result = json.load(f)
+            # The modification time doubles as the LRU clock
+            os.utime(path)
+            return result
+        except (OSError, ValueError):
+            # Missing, evicted by another process meanwhile, or unreadable
+            return None
+
+    def put(self, key: str, artifacts_json: Dict[str, Any]) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as f:
+                f.write(json.dumps(artifacts_json, separators=(",", ":")).encode())
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        self.evict()
+
+    def _entries(self):
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".json.gz"):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    yield entry.path, stat.st_size, stat.st_mtime
+
+    def evict(self) -> int:
+        """Delete least recently used artifacts until the cache is under EVICT_TO of its limit."""
+        entries = list(self._entries())
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return 0
+        removed = 0
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= self.max_bytes * EVICT_TO:
+                break
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass  # Another process got there first
+            total -= size
+        return removed
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Constructor arguments recovered from contract creation transactions
+Takes the bytes after the init code in the creation input and checks them against the constructor signature
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+from typing import Dict, Any, Iterable, List, Optional
+
+from eth_abi import decode, encode
+from web3 import Web3
+
+from arbiscan_client import ArbiscanClient, get_arbiscan_client
+from bulk_receipts import DEFAULT_BATCH_SIZE, _chunks
+from evm_disasm import metadata_trailer
+from rpc_pool import RPCPool, get_rpc_pool
+
+# forge inspect output (or a JSON ABI) and the source it was generated from
+ABI_FILE = "abi.json"
+CONSTRUCTOR_SOURCE = "src/tokens/BurnMintERC677.sol"
+
+# getcontractcreation accepts at most this many addresses per call
+CREATION_LOOKUP_SIZE = 5
+
+_SIGNATURE = re.compile(r"constructor\s*\(([^)]*)\)", re.S)
+_DATA_LOCATIONS = {"memory", "calldata", "storage", "payable"}
+
+
+def _split_params(params: str) -> List[str]:
+    """ABI types from a parameter list, dropping names and data locations."""
+    types = []
+    for param in params.split(","):
+        words = [word for word in param.split() if word not in _DATA_LOCATIONS]
+        if words:
+            types.append(words[0])
+    return types
+
+
+def types_from_abi(path: str = ABI_FILE) -> Optional[List[str]]:
+    """Constructor types from a JSON ABI or a `forge inspect <contract> abi` table; None if it has no constructor."""
+    with open(path) as f:
+        text = f.read()
+    try:
+        abi = json.loads(text)
+    except ValueError:
+        # Table row: | constructor | constructor(string,string,address) nonpayable | |
+        for line in text.splitlines():
+            cells = [cell.strip() for cell in line.strip("|").split("|")]
+            if cells and cells[0] == "constructor":
+                match = _SIGNATURE.search(cells[1])
+                return _split_params(match.group(1)) if match else []
+        return None
+    if isinstance(abi, dict):
+        abi = abi.get("abi", [])
+    for entry in abi:
+        if entry.get("type") == "constructor":
+            return [param["type"] for param in entry.get("inputs", [])]
+    return None
+
+
+def types_from_source(source: str, contract_name: Optional[str] = None) -> List[str]:
+    """Constructor types parsed from Solidity source, inside contract_name when given (flattened files hold many)."""
+    if contract_name:
+        start = re.search(rf"\bcontract\s+{re.escape(contract_name)}\b", source)
+        if start is None:
+            raise ValueError(f"Contract {contract_name} not found in source")
+        source = source[start.end():]
+        following = re.search(r"\n\s*(?:abstract\s+)?(?:contract|library|interface)\s+\w+", source)
+        if following:
+            source = source[:following.start()]
+    match = _SIGNATURE.search(source)
+    return _split_params(match.group(1)) if match else []
+
+
+def constructor_types(abi_path: str = ABI_FILE, source_path: str = CONSTRUCTOR_SOURCE,
+                      contract_name: Optional[str] = None) -> List[str]:
+    """Constructor types from abi.json, falling back to the Solidity source."""
+    if abi_path and os.path.exists(abi_path):
+        types = types_from_abi(abi_path)
+        if types is not None:
+            return types
+    with open(source_path) as f:
+        return types_from_source(f.read(), contract_name)
+
+
+def split_creation_input(creation_input: bytes, init_code: Optional[bytes] = None,
+                         runtime_code: Optional[bytes] = None) -> bytes:
+    """The constructor arguments appended to a creation input.
+
+    With the compiled init code the arguments are simply what follows it. Without
+    it, solc places the runtime code (and its metadata trailer) last in the init
+    code, so the arguments start right after the last copy of that trailer.
+    """
+    creation_input = bytes(creation_input)
+    if init_code is not None:
+        init_code = bytes(init_code)
+        # Only the metadata hash at the end may differ from what was deployed
+        end, _ = metadata_trailer(init_code)
+        if len(creation_input) < len(init_code) or creation_input[:end] != init_code[:end]:
+            raise ValueError("Creation input does not start with the compiled init code")
+        return creation_input[len(init_code):]
+    if runtime_code is None:
+        raise ValueError("Need the compiled init code or the deployed runtime code")
+    end, trailer = metadata_trailer(bytes(runtime_code))
+    if trailer is None:
+        raise ValueError("Runtime code has no metadata trailer to locate the arguments by")
+    position = creation_input.rfind(bytes(runtime_code)[end:])
+    if position < 0:
+        raise ValueError("Runtime metadata not found in the creation input (created by a factory?)")
+    return creation_input[position + len(runtime_code) - end:]
+
+
+def decode_args(types: List[str], args: bytes) -> List[Any]:
+    """ABI-decode constructor arguments, requiring them to re-encode to exactly the same bytes."""
+    if not types:
+        if args:
+            raise ValueError(f"Constructor takes no arguments but {len(args)} bytes follow the init code")
+        return []
+    try:
+        values = list(decode(types, args))
+    except Exception as e:
+        raise ValueError(f"Arguments do not decode as ({','.join(types)}): {e}")
+    if encode(types, values) != args:
+        raise ValueError(f"Arguments are not a canonical encoding of ({','.join(types)})")
+    return values
+
+
+class ConstructorArgs:
+    """Find creation transactions for many contracts with as few round trips as possible and derive their arguments."""
+
+    def __init__(self, pool: Optional[RPCPool] = None, explorer: Optional[ArbiscanClient] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        self.pool = pool or get_rpc_pool()
+        self.explorer = explorer or get_arbiscan_client()
+        self.batch_size = batch_size
+        self.creations: Dict[str, Dict[str, Any]] = {}
+
+    def prefetch(self, addresses: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Creation tx hash, creator, input and deployed code per lowercase address.
+
+        Creation lookups go to the explorer five addresses at a time; the
+        transactions and code then come back in JSON-RPC batches.
+        """
+        wanted = [address.lower() for address in dict.fromkeys(addresses) if address.lower() not in self.creations]
+        found = {}
+        for chunk in _chunks(wanted, CREATION_LOOKUP_SIZE):
+            data = self.explorer.getcontractcreation(chunk)
+            if data.get("status") != "1":
+                raise RuntimeError(f"getcontractcreation failed: {data.get('result') or data.get('message')}")
+            for item in data["result"]:
+                found[item["contractAddress"].lower()] = {"tx_hash": item["txHash"], "creator": item.get("contractCreator")}
+
+        addresses_found = list(found)
+        for chunk in _chunks(addresses_found, max(1, self.batch_size // 2)):
+            calls = [("eth_getTransactionByHash", [found[address]["tx_hash"]]) for address in chunk]
+            calls += [("eth_getCode", [Web3.to_checksum_address(address), "latest"]) for address in chunk]
+            responses = self.pool.batch(calls)
+            for i, address in enumerate(chunk):
+                tx = responses[i].get("result") or {}
+                code = responses[len(chunk) + i].get("result") or "0x"
+                found[address]["input"] = bytes.fromhex((tx.get("input") or "0x")[2:])
+                found[address]["direct"] = tx.get("to") is None
+                found[address]["code"] = bytes.fromhex(code[2:])
+        self.creations.update(found)
+        return {address.lower(): self.creations[address.lower()] for address in addresses if address.lower() in self.creations}
+
+    def derive(self, address: str, types: List[str], init_code: Optional[bytes] = None) -> Dict[str, Any]:
+        """ABI-encoded (hex, no 0x) and decoded constructor arguments of a deployed contract.
+
+        Raises ValueError when they can't be recovered, rather than letting a guess reach the explorer.
+        """
+        creation = self.prefetch([address]).get(address.lower())
+        if creation is None:
+            raise ValueError(f"No creation transaction found for {address}")
+        if not creation["input"]:
+            raise ValueError(f"Creation transaction {creation['tx_hash']} not found")
+        if not creation["direct"]:
+            raise ValueError(f"{address} was created by a factory; its arguments are not in the transaction input")
+        args = split_creation_input(creation["input"], init_code, creation["code"])
+        return {
+            "hex": args.hex(),
+            "values": decode_args(types, args),
+            "types": types,
+            "tx_hash": creation["tx_hash"],
+            "creator": creation["creator"],
+        }
+
+
+def format_values(types: List[str], values: List[Any]) -> List[str]:
+    return [f"{abi_type}: {value.hex() if isinstance(value, bytes) else value}" for abi_type, value in zip(types, values)]
+
+
+def main(argv=None) -> int:
+    """Print a contract's constructor arguments as hex (no 0x) for shell scripts; decoded values go to stderr."""
+    parser = argparse.ArgumentParser(description="Constructor arguments of a deployed contract, from its creation transaction")
+    parser.add_argument("address", help="deployed contract address")
+    parser.add_argument("--contract-name", help="contract whose constructor to read from the source, if abi.json is missing")
+    args = parser.parse_args(argv)
+    try:
+        types = constructor_types(contract_name=args.contract_name)
+        constructor = ConstructorArgs().derive(args.address, types)
+    except Exception as e:
+        print(f"❌ Could not derive constructor arguments: {e}", file=sys.stderr)
+        return 1
+    print(f"✅ From tx {constructor['tx_hash']}:", file=sys.stderr)
+    for value in format_values(constructor["types"], constructor["values"]):
+        print(f"   • {value}", file=sys.stderr)
+    print(constructor["hex"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
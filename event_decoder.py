@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Fixed-layout decoders for SDM (BurnMintERC677) events
+Decodes logs straight from topic and data bytes instead of going through web3 contract event processing
+"""
+
+from typing import Dict, Any, Callable, Iterable, List, Optional, Union
+
+ZERO_ADDRESS = "0x" + "0" * 40
+
+# topic0 of every event emitted by the token (BurnMintERC677, see abi.json)
+EVENT_TOPICS = {
+    "Transfer": "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef",
+    # ERC677 Transfer(address,address,uint256,bytes), emitted by transferAndCall
+    "TransferAndCall": "0xe19260aff97b920c7df27010903aeb9c8d2be5d310a2c67824cf3f15396e4c16",
+    "Approval": "0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925",
+    "TokensMinted": "0x68bdb952732439160113c0e57c44584be6ae651b5df934f5a995370572590d57",
+    "MintMilestone": "0x9b2a65c7e0a86ec9f5390df9335816f9d73a9a7d901ea9b61dc5305b186e65f9",
+    "CrossChainMint": "0x9c156ee7cdf7af220f2682cd264a1b2779659c00b42214cc18339c9844b66f48",
+    "MinterAdded": "0x6ae172837ea30b801fbfcdd4108aa1d5bf8ff775444fd70256b44e6bf3dfc3f6",
+    "MinterRemoved": "0xe94479a9f7e1952cc78f2d6baab678adc1b772d936c6583def489e524cb66692",
+    "BurnerAdded": "0x86e57fd2b90329052917118de7c3f521f400d439b9650deaa906a25b08b94560",
+    "BurnerRemoved": "0x90eabbc0c667db2a5029ed6bc0f5fe9f356d11684a4ca9fcfaec0e53f12b9c8e",
+    "OwnershipTransferred": "0x8be0079c531659141344cd1fd0a4f28419497f9722a3daafe3b4186f6b6457e0",
+}
+EVENT_TOPIC_BYTES = {name: bytes.fromhex(topic[2:]) for name, topic in EVENT_TOPICS.items()}
+EVENT_NAMES = {topic: name for name, topic in EVENT_TOPIC_BYTES.items()}
+
+
+def to_checksum_address(address: Union[str, bytes]) -> str:
+    """EIP-55 form of a 20-byte address, same as Web3.to_checksum_address without importing web3."""
+    from eth_hash.auto import keccak
+    if isinstance(address, (bytes, bytearray)):
+        hex_address = bytes(address).hex()
+    else:
+        hex_address = address[2:] if address[:2].lower() == "0x" else address
+        hex_address = hex_address.lower()
+    if len(hex_address) != 40 or any(c not in "0123456789abcdef" for c in hex_address):
+        raise ValueError(f"Not a 20-byte address: {address!r}")
+    digest = keccak(hex_address.encode()).hex()
+    return "0x" + "".join(c.upper() if int(d, 16) >= 8 else c for c, d in zip(hex_address, digest))
+
+
+def _address(topic: bytes) -> str:
+    return "0x" + topic[12:32].hex()
+
+
+def _uint(data: bytes, slot: int) -> int:
+    return int.from_bytes(data[slot * 32:slot * 32 + 32], "big")
+
+
+def _dynamic(data: bytes, slot: int) -> bytes:
+    """ABI dynamic bytes/string whose offset is stored in the given head slot."""
+    offset = _uint(data, slot)
+    length = int.from_bytes(data[offset:offset + 32], "big")
+    return data[offset + 32:offset + 32 + length]
+
+
+# Each decoder takes (topics, data) as plain bytes and returns the event arguments
+
+def _transfer(topics, data):
+    return {"from": _address(topics[1]), "to": _address(topics[2]), "value": _uint(data, 0)}
+
+
+def _transfer_and_call(topics, data):
+    return {"from": _address(topics[1]), "to": _address(topics[2]), "value": _uint(data, 0),
+            "data": "0x" + _dynamic(data, 1).hex()}
+
+
+def _approval(topics, data):
+    return {"owner": _address(topics[1]), "spender": _address(topics[2]), "value": _uint(data, 0)}
+
+
+def _tokens_minted(topics, data):
+    return {"minter": _address(topics[1]), "recipient": _address(topics[2]), "amount": _uint(data, 0),
+            "totalSupply": _uint(data, 1), "timestamp": _uint(data, 2)}
+
+
+def _mint_milestone(topics, data):
+    return {"recipient": _address(topics[1]), "totalMinted": _uint(data, 0), "milestoneReached": _uint(data, 1)}
+
+
+def _cross_chain_mint(topics, data):
+    return {"recipient": _address(topics[1]), "amount": _uint(data, 0),
+            "sourceChain": _dynamic(data, 1).decode("utf-8", errors="replace"),
+            "ccipMessageId": "0x" + data[64:96].hex()}
+
+
+def _role(argument: str) -> Callable[[List[bytes], bytes], Dict[str, Any]]:
+    return lambda topics, data: {argument: _address(topics[1])}
+
+
+def _ownership_transferred(topics, data):
+    return {"previousOwner": _address(topics[1]), "newOwner": _address(topics[2])}
+
+
+DECODERS: Dict[bytes, Callable[[List[bytes], bytes], Dict[str, Any]]] = {
+    EVENT_TOPIC_BYTES["Transfer"]: _transfer,
+    EVENT_TOPIC_BYTES["TransferAndCall"]: _transfer_and_call,
+    EVENT_TOPIC_BYTES["Approval"]: _approval,
+    EVENT_TOPIC_BYTES["TokensMinted"]: _tokens_minted,
+    EVENT_TOPIC_BYTES["MintMilestone"]: _mint_milestone,
+    EVENT_TOPIC_BYTES["CrossChainMint"]: _cross_chain_mint,
+    EVENT_TOPIC_BYTES["MinterAdded"]: _role("minter"),
+    EVENT_TOPIC_BYTES["MinterRemoved"]: _role("minter"),
+    EVENT_TOPIC_BYTES["BurnerAdded"]: _role("burner"),
+    EVENT_TOPIC_BYTES["BurnerRemoved"]: _role("burner"),
+    EVENT_TOPIC_BYTES["OwnershipTransferred"]: _ownership_transferred,
+}
+
+
+def decode_raw(topics: List[bytes], data: bytes) -> Optional[Dict[str, Any]]:
+    """Decode one event from plain topic and data bytes; None if it is not an SDM event or is malformed."""
+    if not topics:
+        return None
+    decoder = DECODERS.get(topics[0])
+    if decoder is None:
+        return None
+    try:
+        return {"event": EVENT_NAMES[topics[0]], "args": decoder(topics, data)}
+    except (IndexError, ValueError):
+        return None
+
+
+def decode_log(log: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Decode a web3-style log (HexBytes topics and data); None if it is not an SDM event."""
+    # HexBytes slicing is slow, so work on plain bytes
+    return decode_raw([bytes(topic) for topic in log["topics"]], bytes(log["data"]))
+
+
+def decode_logs(logs: Iterable[Dict[str, Any]], include_unknown: bool = False) -> List[Dict[str, Any]]:
+    """Decode a batch of logs, keeping block/tx position so results can be joined back to the logs."""
+    decoders, names = DECODERS, EVENT_NAMES
+    decoded = []
+    for log in logs:
+        topics = [bytes(topic) for topic in log["topics"]]
+        decoder = decoders.get(topics[0]) if topics else None
+        args = None
+        if decoder is not None:
+            try:
+                args = decoder(topics, bytes(log["data"]))
+            except (IndexError, ValueError):
+                args = None
+        if args is None and not include_unknown:
+            continue
+        decoded.append({
+            "event": names[topics[0]] if args is not None else "Unknown",
+            "args": args or {},
+            "address": log.get("address"),
+            "blockNumber": log.get("blockNumber"),
+            "logIndex": log.get("logIndex"),
+            "transactionHash": log.get("transactionHash"),
+        })
+    return decoded
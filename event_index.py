@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Local SQLite index of SDM contract events
+Each sync only fetches blocks after the last checkpoint, so analyses read history locally
+"""
+
+import os
+import time
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
+
+from hexbytes import HexBytes
+
+from event_decoder import EVENT_TOPICS, EVENT_NAMES, to_checksum_address
+
+# Syncing needs web3 and the RPC pool; reading stored logs doesn't, so they are imported on first sync
+if TYPE_CHECKING:
+    from rpc_pool import RPCPool
+
+TOKEN_ADDRESS = "0x602b869eEf1C9F0487F31776bad8Af3C4A173394"
+
+EVENT_INDEX_DB = os.getenv('EVENT_INDEX_DB', 'sdm_events.db')
+
+# Blocks behind head that are left for the next sync, in case of a reorg
+DEFAULT_CONFIRMATIONS = 20
+
+# Blocks fetched between checkpoints; a crash loses at most one window of work
+DEFAULT_SYNC_WINDOW = 500_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS logs (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    transaction_index INTEGER NOT NULL,
+    transaction_hash BLOB NOT NULL,
+    block_hash BLOB NOT NULL,
+    address TEXT NOT NULL,
+    event TEXT,
+    topic0 BLOB,
+    topic1 BLOB,
+    topic2 BLOB,
+    topic3 BLOB,
+    data BLOB NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS idx_logs_address ON logs (address, block_number);
+CREATE INDEX IF NOT EXISTS idx_logs_topic0 ON logs (topic0, block_number);
+CREATE INDEX IF NOT EXISTS idx_logs_topic1 ON logs (topic1);
+CREATE INDEX IF NOT EXISTS idx_logs_topic2 ON logs (topic2);
+CREATE INDEX IF NOT EXISTS idx_logs_tx ON logs (transaction_hash);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    address TEXT PRIMARY KEY,
+    last_block INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def _topic(value: Any) -> Optional[bytes]:
+    """Accept a topic as hex string or bytes; addresses are left-padded to 32 bytes."""
+    if value is None:
+        return None
+    raw = bytes(HexBytes(value))
+    return raw.rjust(32, b"\0")
+
+
+class EventIndex:
+    """Checkpointed SQLite copy of one contract's logs."""
+
+    def __init__(
+        self,
+        path: str = EVENT_INDEX_DB,
+        address: str = TOKEN_ADDRESS,
+        pool: Optional["RPCPool"] = None,
+        start_block: Optional[int] = None,
+    ):
+        self.path = path
+        self.address = to_checksum_address(address)
+        self._pool = pool
+        self.start_block = start_block  # None: the token's creation block
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self) -> "RPCPool":
+        if self._pool is None:
+            from rpc_pool import get_rpc_pool
+            self._pool = get_rpc_pool()
+        return self._pool
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def checkpoint(self) -> Optional[int]:
+        """Last block whose logs are fully stored, or None before the first sync."""
+        row = self.conn.execute(
+            "SELECT last_block FROM checkpoints WHERE address = ?", (self.address,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _store(self, logs: List[Dict[str, Any]], last_block: int) -> None:
+        """Insert one window of logs and advance the checkpoint in the same transaction."""
+        rows = []
+        for log in logs:
+            topics = [bytes(topic) for topic in log["topics"]] + [None] * (4 - len(log["topics"]))
+            rows.append((
+                log["blockNumber"], log["logIndex"], log["transactionIndex"],
+                bytes(log["transactionHash"]), bytes(log["blockHash"]), log["address"],
+                EVENT_NAMES.get(topics[0], "Unknown"), *topics[:4], bytes(log["data"]),
+            ))
+        with self._lock, self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO logs VALUES (?,?,?,?,?,?,?,?,?,?,?,?)", rows)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (address, last_block, updated_at) VALUES (?, ?, ?)",
+                (self.address, last_block, time.time()),
+            )
+
+    def sync(
+        self,
+        to_block: Optional[int] = None,
+        confirmations: int = DEFAULT_CONFIRMATIONS,
+        window: int = DEFAULT_SYNC_WINDOW,
+        verbose: bool = True,
+    ) -> int:
+        """Fetch logs for blocks after the checkpoint; returns the number of new logs stored."""
+        from log_scanner import LogScanner, TOKEN_CREATION_BLOCK
+        if to_block is None:
+            to_block = int(self.pool.request("eth_blockNumber", []), 16) - confirmations
+
+        checkpoint = self.checkpoint()
+        start_block = TOKEN_CREATION_BLOCK if self.start_block is None else self.start_block
+        from_block = start_block if checkpoint is None else checkpoint + 1
+        if from_block > to_block:
+            return 0
+
+        scanner = LogScanner(self.pool)
+        start = time.time()
+        stored = 0
+        for window_start in range(from_block, to_block + 1, window):
+            window_end = min(window_start + window - 1, to_block)
+            logs = list(scanner.scan(self.address, None, window_start, window_end))
+            self._store(logs, window_end)
+            stored += len(logs)
+
+        if verbose:
+            stats = scanner.stats()
+            print(f"   Event index: synced blocks {from_block:,}-{to_block:,} in {time.time() - start:.1f}s "
+                  f"({stored} new logs, {stats['requests']} eth_getLogs calls)")
+        return stored
+
+    @staticmethod
+    def _row_to_log(row: tuple) -> Dict[str, Any]:
+        block_number, log_index, tx_index, tx_hash, block_hash, address, event, t0, t1, t2, t3, data = row
+        return {
+            "address": address,
+            "topics": [HexBytes(topic) for topic in (t0, t1, t2, t3) if topic is not None],
+            "data": HexBytes(data),
+            "blockNumber": block_number,
+            "blockHash": HexBytes(block_hash),
+            "transactionHash": HexBytes(tx_hash),
+            "transactionIndex": tx_index,
+            "logIndex": log_index,
+            "event": event,
+        }
+
+    def logs(
+        self,
+        event: Optional[str] = None,
+        from_block: Optional[int] = None,
+        to_block: Optional[int] = None,
+        topic1: Any = None,
+        topic2: Any = None,
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Read stored logs in web3 get_logs shape, filtered by event name, block range and topics."""
+        clauses, params = ["address = ?"], [self.address]
+        if event is not None:
+            clauses.append("topic0 = ?")
+            params.append(_topic(EVENT_TOPICS[event]))
+        if from_block is not None:
+            clauses.append("block_number >= ?")
+            params.append(from_block)
+        if to_block is not None:
+            clauses.append("block_number <= ?")
+            params.append(to_block)
+        if topic1 is not None:
+            clauses.append("topic1 = ?")
+            params.append(_topic(topic1))
+        if topic2 is not None:
+            clauses.append("topic2 = ?")
+            params.append(_topic(topic2))
+
+        order = "DESC" if newest_first else "ASC"
+        sql = (f"SELECT * FROM logs WHERE {' AND '.join(clauses)} "
+               f"ORDER BY block_number {order}, log_index {order}")
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._row_to_log(row) for row in self.conn.execute(sql, params)]
+
+    def count_by_event(self) -> Dict[str, int]:
+        rows = self.conn.execute(
+            "SELECT event, COUNT(*) FROM logs WHERE address = ? GROUP BY event ORDER BY COUNT(*) DESC",
+            (self.address,),
+        )
+        return dict(rows.fetchall())
+
+    def transactions(self, event: Optional[str] = None) -> List[Tuple[str, int]]:
+        """Distinct (tx hash, block number) pairs of transactions that emitted stored logs."""
+        sql = "SELECT DISTINCT transaction_hash, block_number FROM logs WHERE address = ?"
+        params: List[Any] = [self.address]
+        if event is not None:
+            sql += " AND topic0 = ?"
+            params.append(_topic(EVENT_TOPICS[event]))
+        rows = self.conn.execute(sql + " ORDER BY block_number", params)
+        return [("0x" + bytes(tx_hash).hex(), block_number) for tx_hash, block_number in rows]
+
+    def transfer_records(self, to_block: Optional[int] = None) -> bytes:
+        """Every Transfer packed as 72-byte from|to|amount records, skipping log dict construction."""
+        # || yields TEXT even for blob operands; the cast keeps the raw bytes
+        sql = ("SELECT CAST(substr(topic1, 13) || substr(topic2, 13) || substr(data, 1, 32) AS BLOB) "
+               "FROM logs WHERE address = ? AND topic0 = ? AND topic2 IS NOT NULL AND length(data) >= 32")
+        params: List[Any] = [self.address, _topic(EVENT_TOPICS["Transfer"])]
+        if to_block is not None:
+            sql += " AND block_number <= ?"
+            params.append(to_block)
+        return b"".join(row[0] for row in self.conn.execute(sql + " ORDER BY block_number, log_index", params))
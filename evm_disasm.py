@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Single-pass EVM bytecode disassembler
+Walks opcodes (skipping PUSH data), extracts dispatcher selectors and locates the Solidity CBOR metadata trailer
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+OPCODES = {
+    0x00: "STOP", 0x01: "ADD", 0x02: "MUL", 0x03: "SUB", 0x04: "DIV", 0x05: "SDIV", 0x06: "MOD",
+    0x07: "SMOD", 0x08: "ADDMOD", 0x09: "MULMOD", 0x0a: "EXP", 0x0b: "SIGNEXTEND",
+    0x10: "LT", 0x11: "GT", 0x12: "SLT", 0x13: "SGT", 0x14: "EQ", 0x15: "ISZERO", 0x16: "AND",
+    0x17: "OR", 0x18: "XOR", 0x19: "NOT", 0x1a: "BYTE", 0x1b: "SHL", 0x1c: "SHR", 0x1d: "SAR",
+    0x20: "KECCAK256",
+    0x30: "ADDRESS", 0x31: "BALANCE", 0x32: "ORIGIN", 0x33: "CALLER", 0x34: "CALLVALUE",
+    0x35: "CALLDATALOAD", 0x36: "CALLDATASIZE", 0x37: "CALLDATACOPY", 0x38: "CODESIZE",
+    0x39: "CODECOPY", 0x3a: "GASPRICE", 0x3b: "EXTCODESIZE", 0x3c: "EXTCODECOPY",
+    0x3d: "RETURNDATASIZE", 0x3e: "RETURNDATACOPY", 0x3f: "EXTCODEHASH",
+    0x40: "BLOCKHASH", 0x41: "COINBASE", 0x42: "TIMESTAMP", 0x43: "NUMBER", 0x44: "PREVRANDAO",
+    0x45: "GASLIMIT", 0x46: "CHAINID", 0x47: "SELFBALANCE", 0x48: "BASEFEE", 0x49: "BLOBHASH",
+    0x4a: "BLOBBASEFEE",
+    0x50: "POP", 0x51: "MLOAD", 0x52: "MSTORE", 0x53: "MSTORE8", 0x54: "SLOAD", 0x55: "SSTORE",
+    0x56: "JUMP", 0x57: "JUMPI", 0x58: "PC", 0x59: "MSIZE", 0x5a: "GAS", 0x5b: "JUMPDEST",
+    0x5c: "TLOAD", 0x5d: "TSTORE", 0x5e: "MCOPY", 0x5f: "PUSH0",
+    0xa0: "LOG0", 0xa1: "LOG1", 0xa2: "LOG2", 0xa3: "LOG3", 0xa4: "LOG4",
+    0xf0: "CREATE", 0xf1: "CALL", 0xf2: "CALLCODE", 0xf3: "RETURN", 0xf4: "DELEGATECALL",
+    0xf5: "CREATE2", 0xfa: "STATICCALL", 0xfd: "REVERT", 0xfe: "INVALID", 0xff: "SELFDESTRUCT",
+}
+OPCODES.update({0x60 + i: f"PUSH{i + 1}" for i in range(32)})
+OPCODES.update({0x80 + i: f"DUP{i + 1}" for i in range(16)})
+OPCODES.update({0x90 + i: f"SWAP{i + 1}" for i in range(16)})
+
+PUSH1, PUSH4, PUSH32 = 0x60, 0x63, 0x7f
+EQ, JUMPI, JUMPDEST, INVALID = 0x14, 0x57, 0x5b, 0xfe
+
+# Solidity >= 0.8 reverts with Panic(uint256) on overflow and other checked failures
+PANIC_SELECTOR = "0x4e487b71"
+
+# How many instructions after a PUSH4 the EQ / JUMPI of a dispatcher branch may appear
+DISPATCH_WINDOW = 3
+
+# Analyses kept in memory, keyed by code hash
+ANALYSIS_CACHE_SIZE = 64
+
+
+def metadata_trailer(code: bytes) -> Tuple[int, Optional[bytes]]:
+    """Split off the CBOR metadata solc appends to runtime code.
+
+    Returns (length of the executable part, CBOR payload or None). The last two
+    bytes hold the payload length, and the payload must start with a CBOR map.
+    """
+    if len(code) < 2:
+        return len(code), None
+    length = int.from_bytes(code[-2:], "big")
+    start = len(code) - 2 - length
+    if length == 0 or start < 0 or not (0xa1 <= code[start] <= 0xb7 or code[start] == 0xbf):
+        return len(code), None
+    return start, bytes(code[start:-2])
+
+
+def instructions(code: bytes, end: Optional[int] = None) -> Iterator[Tuple[int, int, bytes]]:
+    """Yield (pc, opcode, push data) for each instruction, never decoding PUSH data as opcodes."""
+    end = len(code) if end is None else end
+    pc = 0
+    while pc < end:
+        op = code[pc]
+        if PUSH1 <= op <= PUSH32:
+            size = op - PUSH1 + 1
+            yield pc, op, bytes(code[pc + 1:pc + 1 + size])
+            pc += 1 + size
+        else:
+            yield pc, op, b""
+            pc += 1
+
+
+def disassemble(code: bytes, end: Optional[int] = None) -> List[str]:
+    """Human-readable listing, one instruction per line."""
+    return [
+        f"{pc:05x}: {OPCODES.get(op, f'UNKNOWN_{op:02x}')}" + (f" 0x{data.hex()}" if data else "")
+        for pc, op, data in instructions(code, end)
+    ]
+
+
+def _analyze(code: bytes) -> Dict[str, Any]:
+    end, metadata = metadata_trailer(code)
+    selectors = []
+    push4 = set()
+    push32 = set()
+    jumpdests = 0
+    unknown = 0
+    count = 0
+    # The dispatcher compares the calldata selector with PUSH4 constants: PUSH4 sel (DUP) EQ PUSH dest JUMPI
+    candidate: Optional[bytes] = None
+    seen_eq = False
+    budget = 0
+    for pc, op, data in instructions(code, end):
+        count += 1
+        if op == PUSH4:
+            push4.add(data)
+            candidate, seen_eq, budget = data, False, DISPATCH_WINDOW
+            continue
+        if op == PUSH32:
+            push32.add(data)
+        elif op == JUMPDEST:
+            jumpdests += 1
+        elif op not in OPCODES:
+            unknown += 1
+        if candidate is None:
+            continue
+        if not seen_eq and op == EQ:
+            seen_eq, budget = True, DISPATCH_WINDOW
+        elif seen_eq and op == JUMPI:
+            selectors.append(candidate)
+            candidate = None
+        else:
+            budget -= 1
+            if budget <= 0:
+                candidate = None
+    starts = list(instructions(code, min(end, 5)))
+    return {
+        "size": len(code),
+        "executable_size": end,
+        "instructions": count,
+        "jumpdests": jumpdests,
+        "unknown_opcodes": unknown,
+        # PUSH1 0x80 PUSH1 0x40 MSTORE: Solidity's free memory pointer setup
+        "solidity_prologue": [op for _, op, _ in starts[:3]] == [PUSH1, PUSH1, 0x52]
+                             and [data for _, _, data in starts[:2]] == [b"\x80", b"\x40"],
+        "selectors": sorted("0x" + selector.hex() for selector in dict.fromkeys(selectors)),
+        "push4": {"0x" + value.hex() for value in push4},
+        "push32": {"0x" + value.hex() for value in push32},
+        "metadata_offset": end if metadata is not None else None,
+        "metadata": metadata,
+    }
+
+
+_analyses: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_analyses_lock = threading.Lock()
+
+
+def analyze(code: bytes) -> Dict[str, Any]:
+    """Disassemble runtime code once and summarize it; results are cached by code hash."""
+    code = bytes(code)
+    key = hashlib.sha256(code).digest()
+    with _analyses_lock:
+        if key in _analyses:
+            _analyses.move_to_end(key)
+            return _analyses[key]
+    analysis = _analyze(code)
+    with _analyses_lock:
+        _analyses[key] = analysis
+        while len(_analyses) > ANALYSIS_CACHE_SIZE:
+            _analyses.popitem(last=False)
+    return analysis
+
+
+def has_selector(analysis: Dict[str, Any], selector: str) -> bool:
+    return selector.lower() in analysis["selectors"]
+
+
+def has_constant(analysis: Dict[str, Any], value: str) -> bool:
+    """True if a PUSH4/PUSH32 constant (error selector, event topic) appears in the code."""
+    value = value.lower()
+    return value in analysis["push4"] or value in analysis["push32"]
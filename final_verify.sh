@@ -21,8 +21,13 @@ if [ -z "$ARBISCAN_API_KEY" ]; then
   exit 1
 fi
 
-# Constructor arguments (no 0x prefix)
-CONSTRUCTOR_ARGS="000000000000000000000000000000000000000000000000000000000000006000000000000000000000000000000000000000000000000000000000000000a000000000000000000000000018b2b2ce7d05bfe0883ff874ba0c536a89d07363000000000000000000000000000000000000000000000000000000000000001d4469616d6f6e647a20536861646f772047616d65202b204d6f766965730000000000000000000000000000000000000000000000000000000000000000000003534d0000000000000000000000000000000000000000000000000000000000"
+# Constructor arguments (no 0x prefix), read back from the creation transaction
+echo "Deriving constructor arguments from the creation transaction..."
+if ! CONSTRUCTOR_ARGS=$(python3 constructor_args.py "$CONTRACT_ADDRESS" --contract-name BurnMintERC677); then
+  echo "❌ Could not derive the constructor arguments, not submitting"
+  exit 1
+fi
+echo ""
 
 echo "Contract: $CONTRACT_ADDRESS"
 echo "Network: Arbitrum"
@@ -69,7 +74,7 @@ echo ""
 echo "4. Contract Name: BurnMintERC677"
 echo ""
 echo "5. For the source code, run this command to get flattened version:"
-echo "   forge flatten src/tokens/BurnMintERC677.sol > flattened.sol"
+echo "   python3 sol_flatten.py src/tokens/BurnMintERC677.sol -o flattened.sol"
 echo "   Then copy the contents of flattened.sol"
 echo ""
 echo "6. Constructor Arguments (ABI-encoded):"
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Holder ledger rebuilt from Transfer logs
+Nets every debit and credit into per-address balances, vectorized with numpy when it is installed
+"""
+
+import heapq
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from event_decoder import to_checksum_address
+
+# numpy is imported on first use (see _load_numpy); its import alone outweighs netting small ledgers
+np = None
+
+# Below this many transfers pure-Python netting finishes before numpy would have imported
+NUMPY_MIN_TRANSFERS = 100_000
+
+ZERO_ADDRESS = b"\0" * 20
+
+# uint256 amounts are split into 16-bit limbs. Per-address limb sums stay exact in
+# float64 bincount weights for up to 2**37 transfers.
+LIMB_BITS = 16
+LIMBS = 256 // LIMB_BITS
+
+# Transfers are packed as fixed-size records: 20-byte from, 20-byte to, 32-byte big-endian amount
+RECORD_SIZE = 72
+
+
+def pack_logs(logs: Iterable[Dict[str, Any]]) -> bytes:
+    """Pack web3-style Transfer logs into ledger records."""
+    return b"".join(
+        bytes(log["topics"][1])[12:] + bytes(log["topics"][2])[12:] + bytes(log["data"])[:32]
+        for log in logs
+    )
+
+
+def _load_numpy() -> bool:
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:  # Pure-Python netting is used instead
+            return False
+        np = numpy
+    return True
+
+
+def _net_python(records: bytes) -> Dict[bytes, int]:
+    balances: Dict[bytes, int] = {}
+    for offset in range(0, len(records), RECORD_SIZE):
+        sender = records[offset:offset + 20]
+        recipient = records[offset + 20:offset + 40]
+        value = int.from_bytes(records[offset + 40:offset + 72], "big")
+        balances[sender] = balances.get(sender, 0) - value
+        balances[recipient] = balances.get(recipient, 0) + value
+    return balances
+
+
+def _factorize(addresses):
+    """Map S20 addresses to dense ids. Returns (ids, unique addresses)."""
+    # Sorting 8-byte integers is far faster than 20-byte strings; fall back if two addresses share a tail
+    tails = np.frombuffer(addresses.tobytes(), dtype=[("head", "V12"), ("tail", "<u8")])["tail"]
+    unique_tails, ids = np.unique(tails, return_inverse=True)
+    representatives = np.empty(len(unique_tails), dtype="S20")
+    representatives[ids] = addresses
+    if np.array_equal(representatives[ids], addresses):
+        return ids, representatives
+    representatives, ids = np.unique(addresses, return_inverse=True)
+    return ids, representatives
+
+
+def _net_numpy(records: bytes) -> Dict[bytes, int]:
+    transfers = np.frombuffer(records, dtype=[
+        ("from", "S20"), ("to", "S20"), ("amount", f">u{LIMB_BITS // 8}", (LIMBS,))
+    ])
+    count = len(transfers)
+
+    ids, addresses = _factorize(np.concatenate([transfers["from"], transfers["to"]]))
+    sender_ids, recipient_ids = ids[:count], ids[count:]
+    size = len(addresses)
+
+    # Net each limb with two bincounts; limbs that are zero for every transfer are skipped
+    limbs = transfers["amount"]
+    totals = np.zeros(size, dtype=object)
+    for i in range(LIMBS):
+        column = limbs[:, i]
+        if not column.any():
+            continue
+        weights = column.astype(np.float64)
+        net = (np.bincount(recipient_ids, weights=weights, minlength=size)
+               - np.bincount(sender_ids, weights=weights, minlength=size))
+        # Recombine with Python ints so balances above 64 bits stay exact
+        totals += net.astype(np.int64).astype(object) * (1 << (LIMB_BITS * (LIMBS - 1 - i)))
+
+    # numpy strips trailing NUL bytes from S20 values
+    return {bytes(address).ljust(20, b"\0"): int(total) for address, total in zip(addresses, totals)}
+
+
+def net_transfers(records: bytes, use_numpy: Optional[bool] = None) -> Dict[bytes, int]:
+    """Net packed Transfer records into {20-byte address: balance}.
+
+    The zero address ends up with minus the minted-and-not-burned supply.
+    """
+    if len(records) % RECORD_SIZE:
+        raise ValueError(f"Transfer records must be a multiple of {RECORD_SIZE} bytes")
+    if use_numpy is None:
+        use_numpy = len(records) // RECORD_SIZE >= NUMPY_MIN_TRANSFERS and _load_numpy()
+    elif use_numpy and not _load_numpy():
+        raise ImportError("use_numpy=True needs numpy installed")
+    if not records:
+        return {}
+    return _net_numpy(records) if use_numpy else _net_python(records)
+
+
+class HolderLedger:
+    """Every holder's balance as reconstructed from the token's Transfer history."""
+
+    def __init__(self, balances: Dict[bytes, int], transfer_count: int):
+        self.transfer_count = transfer_count
+        self.minted = -balances.get(ZERO_ADDRESS, 0)
+        self.balances = {address: balance for address, balance in balances.items()
+                         if address != ZERO_ADDRESS and balance != 0}
+
+    @classmethod
+    def from_records(cls, records: bytes, use_numpy: Optional[bool] = None) -> "HolderLedger":
+        return cls(net_transfers(records, use_numpy), len(records) // RECORD_SIZE)
+
+    @classmethod
+    def from_logs(cls, logs: Iterable[Dict[str, Any]], use_numpy: Optional[bool] = None) -> "HolderLedger":
+        return cls.from_records(pack_logs(logs), use_numpy)
+
+    @classmethod
+    def from_index(cls, index, to_block: Optional[int] = None, use_numpy: Optional[bool] = None) -> "HolderLedger":
+        """Build the ledger from an EventIndex's stored Transfer logs."""
+        return cls.from_records(index.transfer_records(to_block), use_numpy)
+
+    @property
+    def holder_count(self) -> int:
+        return sum(1 for balance in self.balances.values() if balance > 0)
+
+    @property
+    def circulating(self) -> int:
+        """Sum of all holder balances; equals totalSupply if the Transfer history is complete."""
+        return sum(self.balances.values())
+
+    def negative_balances(self) -> List[Tuple[str, int]]:
+        """Addresses that went below zero, which means logs are missing from the history."""
+        return [(to_checksum_address(address), balance)
+                for address, balance in self.balances.items() if balance < 0]
+
+    def top(self, n: int = 10, total_supply: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Largest holders with their share of total_supply (defaults to the reconstructed supply)."""
+        supply = total_supply or self.circulating
+        largest = heapq.nlargest(n, self.balances.items(), key=lambda item: item[1])
+        return [
+            {
+                "address": to_checksum_address(address),
+                "balance": balance,
+                "percentage": balance / supply * 100 if supply else 0.0,
+            }
+            for address, balance in largest
+        ]
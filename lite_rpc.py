@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Lightweight JSON-RPC client for the ERC20 reads the scripts make
+Precomputed selectors and hand-rolled ABI codecs for a fixed set of functions, so the hot path never imports web3
+"""
+
+import os
+from decimal import Decimal, localcontext
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
+
+from bulk_receipts import normalize_receipt
+from event_decoder import to_checksum_address
+from log_scanner import normalize_log
+from rpc_pool import RPCPool, RPCError, get_rpc_pool
+
+# Default backend of TokenVerifier and QuickNodeVerifier: "web3", or "lite" for this module
+BACKENDS = ("web3", "lite")
+RPC_BACKEND = os.getenv('RPC_BACKEND', 'web3')
+
+# keccak256(signature)[:4] of every supported function, with its argument and return types
+FUNCTIONS = {
+    "name": ("0x06fdde03", [], "string"),
+    "symbol": ("0x95d89b41", [], "string"),
+    "decimals": ("0x313ce567", [], "uint8"),
+    "totalSupply": ("0x18160ddd", [], "uint256"),
+    "balanceOf": ("0x70a08231", ["address"], "uint256"),
+    "owner": ("0x8da5cb5b", [], "address"),
+}
+
+BlockIdentifier = Union[int, str]
+
+
+def _block(block: BlockIdentifier) -> str:
+    return hex(block) if isinstance(block, int) else block
+
+
+def _bytes(value: Optional[str]) -> bytes:
+    return bytes.fromhex(value[2:]) if value and value.startswith("0x") else bytes.fromhex(value or "")
+
+
+def encode_address(address: str) -> str:
+    """One 32-byte ABI word (hex, no 0x) holding an address."""
+    hex_address = address[2:] if address[:2].lower() == "0x" else address
+    if len(hex_address) != 40:
+        raise ValueError(f"Not a 20-byte address: {address!r}")
+    return bytes.fromhex(hex_address).hex().rjust(64, "0")
+
+
+def encode_call(fn_name: str, *args: Any) -> str:
+    """Calldata for one of FUNCTIONS, as a 0x-prefixed hex string."""
+    selector, arg_types, _ = FUNCTIONS[fn_name]
+    if len(args) != len(arg_types):
+        raise TypeError(f"{fn_name}() takes {len(arg_types)} arguments, {len(args)} given")
+    return selector + "".join(encode_address(arg) for arg in args)
+
+
+def _word(data: bytes, offset: int) -> int:
+    if len(data) < offset + 32:
+        raise ValueError(f"Return data too short: {len(data)} bytes")
+    return int.from_bytes(data[offset:offset + 32], "big")
+
+
+def decode_uint256(data: bytes) -> int:
+    return _word(data, 0)
+
+
+def decode_uint8(data: bytes) -> int:
+    value = _word(data, 0)
+    if value > 0xff:
+        raise ValueError(f"Value {value} out of range for uint8")
+    return value
+
+
+def decode_address(data: bytes) -> str:
+    value = _word(data, 0)
+    if value >> 160:
+        raise ValueError("Address word has non-zero padding")
+    return to_checksum_address(data[12:32])
+
+
+def decode_string(data: bytes) -> str:
+    offset = _word(data, 0)
+    length = _word(data, offset)
+    start = offset + 32
+    if len(data) < start + length:
+        raise ValueError(f"String of {length} bytes runs past the return data")
+    return data[start:start + length].decode("utf-8")
+
+
+DECODERS: Dict[str, Callable[[bytes], Any]] = {
+    "string": decode_string,
+    "uint8": decode_uint8,
+    "uint256": decode_uint256,
+    "address": decode_address,
+}
+
+
+def from_wei(value: int, decimals: int = 18) -> Decimal:
+    """value / 10**decimals, computed with the same precision as web3's from_wei."""
+    with localcontext() as context:
+        context.prec = 999
+        return Decimal(value) / Decimal(10 ** decimals)
+
+
+def decode_result(fn_name: str, data: bytes) -> Any:
+    """Decode what one of FUNCTIONS returned; empty data means the call hit no such function."""
+    if not data:
+        raise ValueError(f"{fn_name}() returned no data (not a contract, or no such function)")
+    return DECODERS[FUNCTIONS[fn_name][2]](data)
+
+
+class LiteClient:
+    """The handful of calls the token scripts need, over an RPCPool, without web3.
+
+    Results have the shapes web3 would return: ints, checksummed addresses,
+    bytes for code, and receipts and logs normalized like bulk_receipts does.
+    """
+
+    def __init__(self, pool: Optional[RPCPool] = None):
+        self.pool = pool or get_rpc_pool()
+
+    def is_connected(self) -> bool:
+        try:
+            self.pool.request("eth_chainId", [])
+            return True
+        except Exception:
+            return False
+
+    def chain_id(self) -> int:
+        return int(self.pool.request("eth_chainId", []), 16)
+
+    def block_number(self) -> int:
+        return int(self.pool.request("eth_blockNumber", []), 16)
+
+    def gas_price(self) -> int:
+        return int(self.pool.request("eth_gasPrice", []), 16)
+
+    def get_code(self, address: str, block: BlockIdentifier = "latest") -> bytes:
+        return _bytes(self.pool.request("eth_getCode", [address, _block(block)]))
+
+    def call(self, address: str, fn_name: str, *args: Any, block: BlockIdentifier = "latest") -> Any:
+        """Call one of FUNCTIONS on address and decode its return value."""
+        data = self.pool.request("eth_call", [{"to": address, "data": encode_call(fn_name, *args)}, _block(block)])
+        return decode_result(fn_name, _bytes(data))
+
+    def token_reads(self, address: str, fn_names: List[str],
+                    block: BlockIdentifier = "latest") -> Tuple[bytes, Callable[[str], Any]]:
+        """Contract code plus argument-less reads in one JSON-RPC batch.
+
+        read(fn_name) raises for the reads that failed, so callers keep their
+        per-field fallbacks; a failed code lookup raises straight away.
+        """
+        calls = [("eth_getCode", [address, _block(block)])]
+        calls += [("eth_call", [{"to": address, "data": encode_call(fn_name)}, _block(block)]) for fn_name in fn_names]
+        responses = self.pool.batch(calls)
+        if "error" in responses[0]:
+            raise RPCError(responses[0]["error"])
+        code = _bytes(responses[0]["result"])
+        by_name = dict(zip(fn_names, responses[1:]))
+
+        def read(fn_name: str) -> Any:
+            response = by_name[fn_name]
+            if "error" in response:
+                raise RPCError(response["error"])
+            return decode_result(fn_name, _bytes(response["result"]))
+
+        return code, read
+
+    def get_transaction(self, tx_hash: str) -> Dict[str, Any]:
+        """Raw transaction fields (hex strings); raises LookupError if unknown."""
+        tx = self.pool.request("eth_getTransactionByHash", [tx_hash])
+        if tx is None:
+            raise LookupError(f"Transaction {tx_hash} not found")
+        return tx
+
+    def get_transaction_receipt(self, tx_hash: str) -> Dict[str, Any]:
+        receipt = self.pool.request("eth_getTransactionReceipt", [tx_hash])
+        if receipt is None:
+            raise LookupError(f"Transaction receipt {tx_hash} not found")
+        return normalize_receipt(receipt)
+
+    def get_logs(self, log_filter: Dict[str, Any]) -> List[Dict[str, Any]]:
+        log_filter = dict(log_filter)
+        for key in ("fromBlock", "toBlock"):
+            if key in log_filter:
+                log_filter[key] = _block(log_filter[key])
+        return [normalize_log(raw) for raw in self.pool.request("eth_getLogs", [log_filter]) or []]
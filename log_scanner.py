@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Adaptive block-range log scanner
+Walks eth_getLogs from a start block to head in parallel, resizing ranges to what the provider accepts
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+
+from hexbytes import HexBytes
+
+from event_decoder import to_checksum_address
+from rpc_pool import RPCPool, RPCError, get_rpc_pool
+
+# Block in which the SDM token was created (tx 0x1061de9e...)
+TOKEN_CREATION_BLOCK = 362698455
+
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+# Range sizing, in blocks. Arbitrum produces ~4 blocks per second, so ranges can be large
+DEFAULT_INITIAL_RANGE = 10_000
+DEFAULT_MIN_RANGE = 1
+DEFAULT_MAX_RANGE = 1_000_000
+
+# Grow the range while responses stay below a quarter of this many logs
+DEFAULT_TARGET_LOGS = 2_000
+
+# Provider errors that mean the range asked for too much, so splitting it helps
+SPLIT_ERROR_CODES = {-32005}
+SPLIT_ERROR_MESSAGES = ("query returned more than", "response size exceeded", "limit exceeded", "block range")
+TIMEOUT_MESSAGES = ("timed out", "timeout")
+
+
+def range_too_large(error: Exception) -> bool:
+    """Whether an eth_getLogs failure is the provider rejecting the range's size, or a timeout on it."""
+    message = str(error).lower()
+    if isinstance(error, RPCError):
+        return error.code in SPLIT_ERROR_CODES or any(text in message for text in SPLIT_ERROR_MESSAGES + TIMEOUT_MESSAGES)
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return any(text in message for text in TIMEOUT_MESSAGES)
+    return False
+
+
+def transient(error: Exception) -> bool:
+    """Whether a failure is worth retrying unchanged: the endpoints were unreachable or failing."""
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+def normalize_log(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a raw JSON-RPC log into the same shape web3's get_logs returns."""
+    return {
+        "address": to_checksum_address(raw["address"]),
+        "topics": [HexBytes(topic) for topic in raw.get("topics", [])],
+        "data": HexBytes(raw.get("data", "0x")),
+        "blockNumber": int(raw["blockNumber"], 16),
+        "blockHash": HexBytes(raw["blockHash"]),
+        "transactionHash": HexBytes(raw["transactionHash"]),
+        "transactionIndex": int(raw["transactionIndex"], 16),
+        "logIndex": int(raw["logIndex"], 16),
+        "removed": raw.get("removed", False),
+    }
+
+
+class LogScanner:
+    """Fetch every log matching a filter between two blocks, in (blockNumber, logIndex) order.
+
+    Ranges that the provider rejects (too many results, response too large,
+    timeouts) are split in half and retried; ranges that come back sparse
+    make the next ranges twice as large. Other transport failures retry the
+    same range with backoff, and anything else (invalid params, bad data)
+    is raised straight away. Up to max_workers ranges are in
+    flight at once, but logs are always yielded in canonical order.
+    """
+
+    def __init__(
+        self,
+        pool: Optional[RPCPool] = None,
+        initial_range: int = DEFAULT_INITIAL_RANGE,
+        min_range: int = DEFAULT_MIN_RANGE,
+        max_range: int = DEFAULT_MAX_RANGE,
+        target_logs: int = DEFAULT_TARGET_LOGS,
+        max_workers: int = 4,
+        max_retries: int = 3,
+    ):
+        self.pool = pool or get_rpc_pool()
+        self.range_size = initial_range
+        self.min_range = min_range
+        self.max_range = max_range
+        self.target_logs = target_logs
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.requests = 0
+        self.splits = 0
+
+    def _fetch(self, address: str, topics: Optional[List[Any]], start: int, end: int) -> List[Dict[str, Any]]:
+        log_filter = {"address": address, "fromBlock": hex(start), "toBlock": hex(end)}
+        if topics:
+            log_filter["topics"] = topics
+        self.requests += 1
+        return [normalize_log(raw) for raw in self.pool.request("eth_getLogs", [log_filter]) or []]
+
+    def _resize(self, span: int, log_count: Optional[int]) -> None:
+        """Shrink after a rejected range, grow after a sparse one."""
+        if log_count is None:
+            self.range_size = max(self.min_range, min(self.range_size, span // 2))
+        elif log_count < self.target_logs // 4 and span >= self.range_size:
+            self.range_size = min(self.max_range, self.range_size * 2)
+
+    def scan(
+        self,
+        address: str,
+        topics: Optional[List[Any]] = None,
+        from_block: int = TOKEN_CREATION_BLOCK,
+        to_block: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield logs for address/topics between from_block and to_block (default: head)."""
+        address = to_checksum_address(address)
+        if to_block is None:
+            to_block = int(self.pool.request("eth_blockNumber", []), 16)
+
+        next_start = from_block
+        cursor = from_block          # First block not yet yielded
+        completed: Dict[int, Tuple[int, List[Dict[str, Any]]]] = {}
+        attempts: Dict[Tuple[int, int], int] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight = {}
+
+            def submit(start: int, end: int) -> None:
+                future = executor.submit(self._fetch, address, topics, start, end)
+                in_flight[future] = (start, end)
+
+            while cursor <= to_block:
+                # Keep workers busy, but don't buffer unboundedly far ahead of the cursor
+                while (next_start <= to_block and len(in_flight) < self.max_workers
+                       and len(completed) < self.max_workers * 4):
+                    end = min(next_start + self.range_size - 1, to_block)
+                    submit(next_start, end)
+                    next_start = end + 1
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    start, end = in_flight.pop(future)
+                    try:
+                        logs = future.result()
+                    except Exception as e:
+                        too_large = range_too_large(e)
+                        if too_large and end > start:
+                            # Too many results or too slow: split and retry both halves
+                            self.splits += 1
+                            self._resize(end - start + 1, None)
+                            mid = (start + end) // 2
+                            submit(start, mid)
+                            submit(mid + 1, end)
+                            continue
+                        if not too_large and not transient(e):
+                            raise
+                        retries = attempts.get((start, end), 0) + 1
+                        if retries > self.max_retries:
+                            raise RuntimeError(f"eth_getLogs failed for blocks {start}-{end}: {e}") from e
+                        attempts[(start, end)] = retries
+                        time.sleep(0.5 * retries)
+                        submit(start, end)
+                        continue
+
+                    self._resize(end - start + 1, len(logs))
+                    completed[start] = (end, logs)
+
+                # Yield every range that is now contiguous with the cursor
+                while cursor in completed:
+                    end, logs = completed.pop(cursor)
+                    logs.sort(key=lambda log: (log["blockNumber"], log["logIndex"]))
+                    yield from logs
+                    cursor = end + 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {"requests": self.requests, "splits": self.splits, "range_size": self.range_size}
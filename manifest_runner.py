@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Manifest-driven batch verification and analysis
+Runs the analysis and verification steps for every deployment in a manifest concurrently, within per-chain limits
+
+Manifest format (JSON):
+
+    {
+      "chains": {
+        "arbitrum": {
+          "chain_id": 42161,
+          "rpc": ["https://arb1.arbitrum.io/rpc", "$QUICKNODE_RPC_URL"],
+          "explorer_api": "https://api.arbiscan.io/api",
+          "api_keys_env": "ARBISCAN_API_KEYS",
+          "concurrency": 4
+        }
+      },
+      "contracts": [
+        {
+          "name": "SDM",
+          "chain": "arbitrum",
+          "address": "0x602b869eEf1C9F0487F31776bad8Af3C4A173394",
+          "contract_name": "BurnMintERC677",
+          "source": "BurnMintERC677_flattened.sol",
+          "constructor_args": "creation_tx",
+          "tasks": ["analyze", "verify"]
+        }
+      ]
+    }
+
+RPC URLs and explorer settings may reference environment variables ($NAME);
+endpoints whose variables are unset are skipped. constructor_args defaults to
+"creation_tx": the arguments are read back from the creation transaction, for
+all entries of a chain in a few batched calls. A hex string or {"file": path}
+is only used when that fails (factory deployments) and is checked otherwise. Etherscan v2 style explorers work by putting the
+chain in the URL, e.g. "https://api.etherscan.io/v2/api?chainid=8453".
+
+Usage: python manifest_runner.py deployments.json [--only SDM ...] [--tasks analyze,verify]
+"""
+
+import os
+import io
+import sys
+import json
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional
+
+from web3 import Web3
+from dotenv import load_dotenv
+
+from rpc_pool import RPCPool, RPCEndpoint, pooled_web3
+from chain_cache import CHAIN_CACHE, CHAIN_CACHE_DB, ChainCache
+from arbiscan_client import ARBISCAN_API, ArbiscanClient
+from arbiscan_cache import ARBISCAN_CACHE, ARBISCAN_CACHE_DB, ArbiscanCache
+from rate_limit import arbiscan_keys_from_env
+from cbor_metadata import decode_metadata, arbiscan_compiler_version
+from bytecode_match import SearchUnavailable, search, describe, arbiscan_params, creation_code
+from constructor_args import ConstructorArgs, types_from_source
+from verify_poller import VerificationPoller
+from verify_token import TokenVerifier
+
+# Load environment variables
+load_dotenv()
+
+ARBITRUM_CHAIN_ID = 42161
+DEFAULT_CHAIN_CONCURRENCY = 4
+TASKS = ("analyze", "verify")
+CREATION_TX = "creation_tx"
+
+
+class _ThreadOutput(io.TextIOBase):
+    """sys.stdout replacement that sends each worker thread's prints to its own buffer.
+
+    The existing verification and analysis functions print as they go; buffering
+    per entry keeps concurrent reports from interleaving.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def capture(self):
+        self.local.buffer = io.StringIO()
+
+    def release(self) -> str:
+        buffer, self.local.buffer = self.local.buffer, None
+        return buffer.getvalue()
+
+
+def _per_chain(path: str, chain_id: int) -> str:
+    """Cache file for a chain; Arbitrum keeps the default path the single-chain scripts use."""
+    if chain_id == ARBITRUM_CHAIN_ID:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}_{chain_id}{ext}"
+
+
+class Chain:
+    """RPC pool, explorer client and concurrency limit for one chain in the manifest."""
+
+    def __init__(self, name: str, config: Dict[str, Any]):
+        self.name = name
+        self.chain_id = int(config.get("chain_id", ARBITRUM_CHAIN_ID))
+        urls = [os.path.expandvars(url) for url in config.get("rpc", [])]
+        endpoints = [RPCEndpoint(f"{name}-{i}", url) for i, url in enumerate(urls) if url and "$" not in url]
+        if not endpoints:
+            raise ValueError(f"Chain {name!r} has no usable RPC endpoint")
+        # Both caches key on method/action and params only, so each chain gets its own files
+        cache = ChainCache(_per_chain(CHAIN_CACHE_DB, self.chain_id)) if CHAIN_CACHE else None
+        self.pool = RPCPool(endpoints, cache=cache)
+
+        keys_env = config.get("api_keys_env")
+        keys = [key.strip() for key in os.getenv(keys_env, "").split(",") if key.strip()] if keys_env else []
+        self.explorer = ArbiscanClient(
+            api_keys=keys or arbiscan_keys_from_env(),
+            base_url=os.path.expandvars(config.get("explorer_api", ARBISCAN_API)),
+            cache=ArbiscanCache(_per_chain(ARBISCAN_CACHE_DB, self.chain_id)) if ARBISCAN_CACHE else None,
+        )
+        self.constructors = ConstructorArgs(self.pool, self.explorer)
+        self.concurrency = int(config.get("concurrency", DEFAULT_CHAIN_CONCURRENCY))
+
+
+def load_manifest(path: str) -> Dict[str, Any]:
+    """Read and validate a manifest; raises ValueError describing the first problem found."""
+    with open(path) as f:
+        manifest = json.load(f)
+    chains = manifest.get("chains") or {}
+    contracts = manifest.get("contracts") or []
+    if not contracts:
+        raise ValueError("Manifest lists no contracts")
+    seen = set()
+    for i, entry in enumerate(contracts):
+        label = entry.get("name") or f"contracts[{i}]"
+        for field in ("name", "chain", "address"):
+            if not entry.get(field):
+                raise ValueError(f"{label}: missing {field!r}")
+        if entry["name"] in seen:
+            raise ValueError(f"{label}: duplicate name")
+        seen.add(entry["name"])
+        if entry["chain"] not in chains:
+            raise ValueError(f"{label}: unknown chain {entry['chain']!r}")
+        if not Web3.is_address(entry["address"]):
+            raise ValueError(f"{label}: invalid address {entry['address']!r}")
+        unknown = set(entry.get("tasks", TASKS)) - set(TASKS)
+        if unknown:
+            raise ValueError(f"{label}: unknown tasks {sorted(unknown)}")
+        if "verify" in entry.get("tasks", TASKS) and not (entry.get("source") and entry.get("contract_name")):
+            raise ValueError(f"{label}: verification needs 'source' and 'contract_name'")
+    return manifest
+
+
+def given_constructor_args(entry: Dict[str, Any], base_dir: str) -> Optional[str]:
+    """Hex (no 0x) from a hand-supplied constructor_args string or file; None when the entry defers to the creation tx."""
+    source = entry.get("constructor_args", CREATION_TX)
+    if source == CREATION_TX:
+        return None
+    if isinstance(source, dict):
+        with open(os.path.join(base_dir, source["file"])) as f:
+            source = f.read()
+    source = source.strip()
+    return source[2:] if source.startswith("0x") else source
+
+
+def resolve_constructor_args(entry: Dict[str, Any], chain: Chain, base_dir: str, source: str,
+                             match: Dict[str, Any]) -> Optional[str]:
+    """Constructor arguments for submission: derived from the creation tx, else the hand-supplied value."""
+    given = given_constructor_args(entry, base_dir)
+    file_name = os.path.basename(entry["source"])
+    try:
+        types = types_from_source(source, entry["contract_name"])
+        init_code = creation_code(match, file_name, entry["contract_name"])
+        derived = chain.constructors.derive(entry["address"], types, init_code)["hex"]
+    except Exception as e:
+        if given is None:
+            print(f"❌ Could not derive constructor arguments: {e}")
+            return None
+        print(f"⚠️  Could not derive constructor arguments ({e}), using the manifest value")
+        return given
+    if given is not None and given.lower() != derived:
+        print("⚠️  Manifest constructor_args differ from the creation transaction, using the latter")
+    return derived
+
+
+def analyze(entry: Dict[str, Any], chain: Chain) -> Dict[str, Any]:
+    verifier = TokenVerifier(pool=chain.pool, explorer=chain.explorer)
+    token = verifier.verify_token_contract(entry["address"], batched=True)
+    verification = verifier.check_contract_verification(entry["address"])
+    return {"token": token, "verification": verification}
+
+
+def submit_verification(entry: Dict[str, Any], chain: Chain, base_dir: str) -> Dict[str, Any]:
+    """Find the matching compiler settings locally and submit them; returns the submission outcome."""
+    address = Web3.to_checksum_address(entry["address"])
+    data = chain.explorer.getsourcecode(address)
+    if data.get("status") == "1" and data["result"] and data["result"][0].get("SourceCode"):
+        print("✅ Already verified")
+        return {"state": "pass", "result": "Already verified"}
+
+    source_file = entry["source"]
+    with open(os.path.join(base_dir, source_file)) as f:
+        sources = {os.path.basename(source_file): f.read()}
+    code = pooled_web3(chain.pool).eth.get_code(address)
+    metadata = decode_metadata(code)
+    versions = entry.get("compiler_versions") or ([metadata["solc"]] if metadata and metadata["solc"] else [])
+    if not versions:
+        return {"state": "fail", "result": "No compiler version in metadata or manifest"}
+
+    try:
+        match = search(code, sources, os.path.basename(source_file), entry["contract_name"], versions)
+    except SearchUnavailable as e:
+        return {"state": "fail", "result": str(e)}
+    if match is None:
+        return {"state": "fail", "result": "No compiler settings reproduce the deployed bytecode"}
+    print(f"✅ Local {match['match']} match: {describe(match)}")
+
+    args = resolve_constructor_args(entry, chain, base_dir, sources[os.path.basename(source_file)], match)
+    if args is None:
+        return {"state": "fail", "result": "Constructor arguments could not be recovered"}
+    params = arbiscan_params(match, address, os.path.basename(source_file), entry["contract_name"],
+                             arbiscan_compiler_version(match["version"]), args)
+    response = chain.explorer.verifysourcecode(timeout=60, **params)
+    if response.get("status") == "1":
+        print(f"✅ Verification submitted! GUID: {response['result']}")
+        return {"state": "submitted", "guid": response["result"]}
+    if "already verified" in str(response.get("result", "")).lower():
+        return {"state": "pass", "result": response["result"]}
+    return {"state": "fail", "result": response.get("result", "Unknown error")}
+
+
+def process_entry(entry: Dict[str, Any], chain: Chain, tasks: List[str], base_dir: str,
+                  output: _ThreadOutput) -> Dict[str, Any]:
+    """Run the requested tasks for one manifest entry."""
+    result: Dict[str, Any] = {"name": entry["name"], "chain": chain.name, "address": entry["address"]}
+    output.capture()
+    try:
+        print(f"\n{'=' * 70}\n📦 {entry['name']} on {chain.name}: {entry['address']}\n{'=' * 70}")
+        if "analyze" in tasks:
+            result["analysis"] = analyze(entry, chain)
+        if "verify" in tasks:
+            result["verification"] = submit_verification(entry, chain, base_dir)
+    except Exception as e:
+        print(f"❌ {entry['name']}: {e}")
+        result["error"] = str(e)
+    finally:
+        result["log"] = output.release()
+    return result
+
+
+def run(manifest_path: str, only: Optional[List[str]] = None, tasks: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    manifest = load_manifest(manifest_path)
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    entries = [entry for entry in manifest["contracts"] if not only or entry["name"] in only]
+    chains = {name: Chain(name, config) for name, config in manifest["chains"].items()
+              if any(entry["chain"] == name for entry in entries)}
+
+    print(f"🗂️  Processing {len(entries)} contract(s) across {len(chains)} chain(s)")
+    _prefetch_creations(entries, chains, tasks)
+    output = _ThreadOutput(sys.stdout)
+    sys.stdout = output
+    results = []
+    # One executor per chain, sized to its limit, so a chain with a long queue never holds up the others
+    executors = {name: ThreadPoolExecutor(max_workers=chain.concurrency) for name, chain in chains.items()}
+    try:
+        futures = [
+            executors[entry["chain"]].submit(process_entry, entry, chains[entry["chain"]],
+                                             [task for task in entry.get("tasks", TASKS) if not tasks or task in tasks],
+                                             base_dir, output)
+            for entry in entries
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            output.stream.write(result["log"])
+            results.append(result)
+    finally:
+        for executor in executors.values():
+            executor.shutdown(wait=True)
+        sys.stdout = output.stream
+
+    _await_verifications(results, chains)
+    _print_summary(results)
+    return results
+
+
+def _prefetch_creations(entries: List[Dict[str, Any]], chains: Dict[str, Chain], tasks: Optional[List[str]]) -> None:
+    """Look up the creation transactions of every entry to verify up front, batched per chain."""
+    if tasks and "verify" not in tasks:
+        return
+    for name, chain in chains.items():
+        addresses = [entry["address"] for entry in entries
+                     if entry["chain"] == name and "verify" in entry.get("tasks", TASKS)]
+        if not addresses:
+            continue
+        try:
+            chain.constructors.prefetch(addresses)
+        except Exception as e:
+            # Each entry retries on its own and reports the failure there
+            print(f"⚠️  Creation lookup on {name} failed: {e}")
+
+
+def _await_verifications(results: List[Dict[str, Any]], chains: Dict[str, Chain]) -> None:
+    """Poll every submitted GUID, one poller per chain, all chains at once."""
+    submitted: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for result in results:
+        verification = result.get("verification") or {}
+        if verification.get("state") == "submitted":
+            submitted.setdefault(result["chain"], {})[verification["guid"]] = verification
+    if not submitted:
+        return
+
+    print(f"\n🔍 Waiting for {sum(len(guids) for guids in submitted.values())} verification(s)...")
+
+    def poll(chain_name: str) -> None:
+        for outcome in VerificationPoller(client=chains[chain_name].explorer, verbose=False).poll(submitted[chain_name]):
+            submitted[chain_name][outcome["guid"]].update(state=outcome["state"], result=outcome["result"])
+
+    with ThreadPoolExecutor(max_workers=len(submitted)) as executor:
+        for future in [executor.submit(poll, chain_name) for chain_name in submitted]:
+            future.result()
+
+
+def _print_summary(results: List[Dict[str, Any]]) -> None:
+    print("\n" + "=" * 70)
+    print("                    BATCH SUMMARY")
+    print("=" * 70)
+    icons = {"pass": "✅", "fail": "❌", "timeout": "⏱️ ", "submitted": "⏳"}
+    for result in sorted(results, key=lambda result: (result["chain"], result["name"])):
+        parts = []
+        if "analysis" in result:
+            token = result["analysis"]["token"]
+            info = token.get("token_info") or {}
+            parts.append(f"{info.get('symbol', '?')} contract={'yes' if token.get('is_contract') else 'no'}")
+        if "verification" in result:
+            verification = result["verification"]
+            parts.append(f"{icons.get(verification['state'], '•')} {verification['state']}"
+                         + (f" ({verification['result']})" if verification.get("result") else ""))
+        if "error" in result:
+            parts.append(f"❌ {result['error']}")
+        print(f"• {result['name']} [{result['chain']}] {result['address']}: {'; '.join(parts)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verify and analyze every contract in a deployment manifest")
+    parser.add_argument("manifest", help="path to the JSON manifest")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="process only these entries")
+    parser.add_argument("--tasks", help=f"comma-separated subset of {','.join(TASKS)}")
+    args = parser.parse_args(argv)
+
+    tasks = [task.strip() for task in args.tasks.split(",")] if args.tasks else None
+    try:
+        results = run(args.manifest, args.only, tasks)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    failed = [result for result in results
+              if "error" in result or (result.get("verification") or {}).get("state") in ("fail", "timeout")]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
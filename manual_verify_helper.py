@@ -11,6 +11,8 @@ from web3 import Web3
 from datetime import datetime
 from dotenv import load_dotenv
 
+from constructor_args import ConstructorArgs, constructor_types, format_values
+
 # Load environment variables
 load_dotenv()
 
@@ -19,6 +21,15 @@ TOKEN_ADDRESS = "0x602b869eEf1C9F0487F31776bad8Af3C4A173394"
 CREATION_TX = "0x1061de9e96b65cc62fabc748d972fefcf7cfc7fc9c518464855ac9744ef7d85d"
 ARBISCAN_API_KEY = os.getenv('ARBISCAN_API_KEY', 'YOUR_API_KEY_HERE')
 
+def derive_constructor_args():
+    """Constructor arguments as deployed, read back from the creation transaction; None if they can't be recovered."""
+    try:
+        types = constructor_types()
+        return ConstructorArgs().derive(TOKEN_ADDRESS, types)
+    except Exception as e:
+        print(f"⚠️  Could not derive constructor arguments: {e}")
+        return None
+
 def generate_verification_info():
     """Generate all information needed for manual verification."""
     
@@ -110,8 +121,20 @@ contract DiamondzShadowGameMovies is ERC20, Ownable {
     # Step 6: Constructor Arguments
     print("🔨 STEP 6: CONSTRUCTOR ARGUMENTS")
     print("-" * 40)
-    print("This token appears to have NO constructor arguments")
-    print("Leave this field EMPTY")
+    constructor = derive_constructor_args()
+    if constructor is None:
+        print("Copy them from the creation transaction input on Arbiscan:")
+        print(f"https://arbiscan.io/tx/{CREATION_TX}")
+        print("They are the bytes after the compiled init code")
+    elif not constructor["hex"]:
+        print("The constructor takes NO arguments - leave this field EMPTY")
+    else:
+        print(f"Read from creation tx {constructor['tx_hash']}:")
+        for value in format_values(constructor["types"], constructor["values"]):
+            print(f"• {value}")
+        print()
+        print("Paste this ABI-encoded value (without 0x):")
+        print(constructor["hex"])
     print()
     
     # Step 7: Libraries
@@ -188,6 +211,7 @@ contract DiamondzShadowGameMovies is ERC20, Ownable {
     info = {
         "contract_address": TOKEN_ADDRESS,
         "creation_tx": CREATION_TX,
+        "constructor_args": constructor["hex"] if constructor else None,
         "arbiscan_api_key": ARBISCAN_API_KEY,
         "verification_url": f"https://arbiscan.io/verifyContract?a={TOKEN_ADDRESS}",
         "token_info": {
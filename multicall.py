@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Multicall3 balance engine for SDM holder checks
+Packs hundreds of balanceOf calls into a single eth_call via Multicall3.aggregate3
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple, Iterable, Optional
+
+from web3 import Web3
+from hexbytes import HexBytes
+
+# Multicall3 is deployed at the same address on Arbitrum and most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+AGGREGATE3_SELECTOR = HexBytes("0x82ad56cb")  # aggregate3((address,bool,bytes)[])
+BALANCE_OF_SELECTOR = HexBytes("0x70a08231")  # balanceOf(address)
+
+# Provider limits used to size each aggregate3 chunk
+DEFAULT_CALL_GAS_LIMIT = 50_000_000      # Arbitrum Nitro default eth_call gas cap
+DEFAULT_MAX_PAYLOAD_BYTES = 256 * 1024   # Stay well under common 1MB request body limits
+DEFAULT_MAX_CALLS_PER_CHUNK = 1000
+
+# Conservative per-call estimates for aggregate3 wrapping balanceOf
+GAS_PER_BALANCE_CALL = 12_000            # Cold SLOAD + call overhead + loop bookkeeping
+BYTES_PER_BALANCE_CALL = 224             # ABI-encoded (address,bool,bytes) tuple incl. offset
+
+
+class MulticallBalanceChecker:
+    """Fetch ERC20 balances for many addresses with as few eth_calls as possible."""
+
+    def __init__(
+        self,
+        w3: Web3,
+        token_address: str,
+        gas_limit: int = DEFAULT_CALL_GAS_LIMIT,
+        max_payload_bytes: int = DEFAULT_MAX_PAYLOAD_BYTES,
+        max_calls_per_chunk: int = DEFAULT_MAX_CALLS_PER_CHUNK,
+        max_workers: int = 4,
+    ):
+        self.w3 = w3
+        self.token_address = Web3.to_checksum_address(token_address)
+        self.gas_limit = gas_limit
+        self.max_payload_bytes = max_payload_bytes
+        self.max_calls_per_chunk = max_calls_per_chunk
+        self.max_workers = max_workers
+        self.rpc_calls = 0
+
+    @property
+    def chunk_size(self) -> int:
+        """Largest number of balanceOf calls that fits the gas and payload limits."""
+        by_gas = self.gas_limit // GAS_PER_BALANCE_CALL
+        by_payload = self.max_payload_bytes // BYTES_PER_BALANCE_CALL
+        return max(1, min(by_gas, by_payload, self.max_calls_per_chunk))
+
+    def _encode_aggregate(self, addresses: List[str]) -> HexBytes:
+        """Build aggregate3 calldata with allowFailure set on every balanceOf."""
+        calls = [
+            (self.token_address, True, BALANCE_OF_SELECTOR + self.w3.codec.encode(["address"], [address]))
+            for address in addresses
+        ]
+        return AGGREGATE3_SELECTOR + self.w3.codec.encode(["(address,bool,bytes)[]"], [calls])
+
+    def _call_params(self, addresses: List[str]) -> Dict[str, Any]:
+        self.rpc_calls += 1
+        return {"to": MULTICALL3_ADDRESS, "data": self._encode_aggregate(addresses), "gas": self.gas_limit}
+
+    def _chunk_results(self, addresses: List[str], raw: bytes) -> Dict[str, Dict[str, Any]]:
+        """Decode aggregate3 return data into per-address results."""
+        returns = self.w3.codec.decode(["(bool,bytes)[]"], raw)[0]
+        results = {}
+        for address, (success, data) in zip(addresses, returns):
+            if success and len(data) >= 32:
+                results[address] = {"balance": int.from_bytes(data[:32], "big"), "error": None}
+            else:
+                results[address] = {"balance": None, "error": "balanceOf call failed"}
+        return results
+
+    def _check_chunk(self, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Check one chunk, halving it whenever the provider rejects the whole call."""
+        try:
+            return self._chunk_results(addresses, self.w3.eth.call(self._call_params(addresses)))
+        except Exception as e:
+            if len(addresses) == 1:
+                return {addresses[0]: {"balance": None, "error": str(e)}}
+            mid = len(addresses) // 2
+            results = self._check_chunk(addresses[:mid])
+            results.update(self._check_chunk(addresses[mid:]))
+            return results
+
+    async def _check_chunk_async(self, addresses: List[str], semaphore: asyncio.Semaphore) -> Dict[str, Dict[str, Any]]:
+        """AsyncWeb3 counterpart of _check_chunk."""
+        try:
+            async with semaphore:
+                raw = await self.w3.eth.call(self._call_params(addresses))
+            return self._chunk_results(addresses, raw)
+        except Exception as e:
+            if len(addresses) == 1:
+                return {addresses[0]: {"balance": None, "error": str(e)}}
+            mid = len(addresses) // 2
+            halves = await asyncio.gather(
+                self._check_chunk_async(addresses[:mid], semaphore),
+                self._check_chunk_async(addresses[mid:], semaphore)
+            )
+            return {**halves[0], **halves[1]}
+
+    def _split(self, addresses: Iterable[str]) -> Tuple[List[List[str]], Dict[str, Dict[str, Any]]]:
+        """Validate addresses and group them into chunks sized for the provider limits."""
+        results = {}
+        valid = []
+        for address in addresses:
+            if Web3.is_address(address):
+                valid.append(Web3.to_checksum_address(address))
+            else:
+                results[address] = {"balance": None, "error": "Invalid address"}
+
+        size = self.chunk_size
+        return [valid[i:i + size] for i in range(0, len(valid), size)], results
+
+    def balances(self, addresses: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Return {address: {"balance": int | None, "error": str | None}} for every input address."""
+        chunks, results = self._split(addresses)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for chunk_results in executor.map(self._check_chunk, chunks):
+                results.update(chunk_results)
+        return results
+
+    async def balances_async(self, addresses: Iterable[str], semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Dict[str, Any]]:
+        """Same as balances() for an AsyncWeb3 instance, sharing the caller's concurrency limit."""
+        semaphore = semaphore or asyncio.Semaphore(self.max_workers)
+        chunks, results = self._split(addresses)
+        for chunk_results in await asyncio.gather(*(self._check_chunk_async(c, semaphore) for c in chunks)):
+            results.update(chunk_results)
+        return results
+
+
+def load_watch_addresses(path: str) -> List[Tuple[str, str]]:
+    """Read (label, address) pairs from a file with one 'address' or 'label,address' per line."""
+    entries = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if "," in line:
+                label, address = [part.strip() for part in line.split(",", 1)]
+            else:
+                label, address = line, line
+            entries.append((label, address))
+    return entries
@@ -6,29 +6,42 @@ This provides better reliability and additional features
 
 import os
 import json
-import requests
-from web3 import Web3
+import asyncio
+import argparse
 from datetime import datetime
 import time
 from dotenv import load_dotenv
+from eth_hash.auto import keccak
+
+from log_scanner import TOKEN_CREATION_BLOCK, TRANSFER_TOPIC
+from event_index import DEFAULT_CONFIRMATIONS, EventIndex
+from block_times import BlockTimes
+from evm_disasm import PANIC_SELECTOR, analyze, has_constant, has_selector
+from cbor_metadata import decode_metadata
+from event_decoder import to_checksum_address
+from lite_rpc import BACKENDS, RPC_BACKEND, LiteClient
+from rpc_pool import get_rpc_pool, pooled_web3, pooled_async_web3
+from arbiscan_client import get_arbiscan_client
 
 # Load environment variables
 load_dotenv()
 
-# QuickNode Configuration
-QUICKNODE_RPC = os.getenv('QUICKNODE_RPC_URL', "https://arb1.arbitrum.io/rpc")
-ARBISCAN_API = "https://api.arbiscan.io/api"
+# QuickNode Configuration (QUICKNODE_RPC_URL is read by the shared RPC pool)
 ARBISCAN_API_KEY = os.getenv('ARBISCAN_API_KEY')
 
-if not ARBISCAN_API_KEY:
-    print("⚠️  Warning: ARBISCAN_API_KEY not found in environment variables.")
-    print("   Some features will be limited without an API key.")
-    print("   Copy .env.example to .env and add your API key.")
-
 # Token Details
 TOKEN_ADDRESS = "0x602b869eEf1C9F0487F31776bad8Af3C4A173394"
 MINT_TX_HASH = "0x1061de9e96b65cc62fabc748d972fefcf7cfc7fc9c518464855ac9744ef7d85d"
 
+# Average Arbitrum One block time, for estimating the token's age when block timestamps can't be read
+ESTIMATED_BLOCK_TIME = 0.25
+
+# Maximum number of in-flight requests for AsyncQuickNodeVerifier
+DEFAULT_CONCURRENCY = 8
+
+# Optional file of extra addresses to check ("address" or "label,address" per line)
+WATCH_ADDRESSES_FILE = os.getenv('WATCH_ADDRESSES_FILE', 'watch_addresses.txt')
+
 # Enhanced ERC20 ABI with additional functions
 ERC20_ABI = [
     {"constant": True, "inputs": [], "name": "name", "outputs": [{"name": "", "type": "string"}], "type": "function"},
@@ -44,48 +57,75 @@ ERC20_ABI = [
 ]
 
 class QuickNodeVerifier:
-    def __init__(self):
-        """Initialize with QuickNode RPC."""
+    def __init__(self, pool=None, backend=RPC_BACKEND):
+        """Initialize with the shared RPC pool (QuickNode plus any other configured endpoints).
+        
+        With backend="lite" the token reads, code and log lookups go through
+        lite_rpc; web3 is only loaded if the Multicall3 holder check runs.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {', '.join(BACKENDS)}")
         print("🚀 Connecting to QuickNode Arbitrum RPC...")
-        self.w3 = Web3(Web3.HTTPProvider(QUICKNODE_RPC))
+        self.pool = pool or get_rpc_pool()
+        self.lite = LiteClient(self.pool) if backend == "lite" else None
+        self.w3 = pooled_web3(self.pool) if self.lite is None else None
+        self.block_times = BlockTimes(pool=self.pool)
         
-        if not self.w3.is_connected():
+        if not (self.lite.is_connected() if self.lite else self.w3.is_connected()):
             raise ConnectionError("Failed to connect to QuickNode")
         
-        print("✅ Connected to QuickNode successfully!")
-        print(f"   Endpoint: QuickNode Arbitrum Mainnet")
-        print(f"   Chain ID: {self.w3.eth.chain_id}")
-        print(f"   Latest Block: {self.w3.eth.block_number:,}")
-        print(f"   Gas Price: {self.w3.eth.gas_price / 10**9:.2f} Gwei")
+        chain_id, block_number, gas_price = (
+            (self.lite.chain_id(), self.lite.block_number(), self.lite.gas_price()) if self.lite
+            else (self.w3.eth.chain_id, self.w3.eth.block_number, self.w3.eth.gas_price)
+        )
+        print("✅ Connected to QuickNode successfully!" + (" (lite client)" if self.lite else ""))
+        print(f"   Endpoints: {', '.join(endpoint.name for endpoint in self.pool.endpoints)}")
+        print(f"   Chain ID: {chain_id}")
+        print(f"   Latest Block: {block_number:,}")
+        print(f"   Gas Price: {gas_price / 10**9:.2f} Gwei")
         print()
 
+    def _block_number(self):
+        return self.lite.block_number() if self.lite else self.w3.eth.block_number
+
     def get_detailed_token_info(self):
         """Get comprehensive token information."""
+        # Check if address is a contract
+        code = self._token_code()
+        
+        if self.lite:
+            address = to_checksum_address(TOKEN_ADDRESS)
+            read = lambda fn_name, *args: self.lite.call(address, fn_name, *args)
+            return self._report_token_info(code, read)
+        
+        # Initialize contract
+        contract = self.w3.eth.contract(
+            address=to_checksum_address(TOKEN_ADDRESS),
+            abi=ERC20_ABI
+        )
+        read = lambda fn_name, *args: getattr(contract.functions, fn_name)(*args).call()
+        
+        return self._report_token_info(code, read)
+
+    def _report_token_info(self, code, read):
+        """Build and print token info from contract code and an ERC20 read callable."""
         print("📊 Fetching Detailed Token Information")
         print("=" * 60)
         
-        # Check if address is a contract
-        code = self.w3.eth.get_code(Web3.to_checksum_address(TOKEN_ADDRESS))
         if len(code) == 0:
             print("❌ Address is not a contract!")
             return None
         
         print(f"✅ Valid Contract (Size: {len(code):,} bytes)")
         
-        # Initialize contract
-        contract = self.w3.eth.contract(
-            address=Web3.to_checksum_address(TOKEN_ADDRESS),
-            abi=ERC20_ABI
-        )
-        
         info = {}
         
         # Get basic token information
         try:
-            info["name"] = contract.functions.name().call()
-            info["symbol"] = contract.functions.symbol().call()
-            info["decimals"] = contract.functions.decimals().call()
-            info["total_supply_raw"] = contract.functions.totalSupply().call()
+            info["name"] = read("name")
+            info["symbol"] = read("symbol")
+            info["decimals"] = read("decimals")
+            info["total_supply_raw"] = read("totalSupply")
             info["total_supply"] = info["total_supply_raw"] / (10 ** info["decimals"])
             
             print(f"Name: {info['name']}")
@@ -98,11 +138,11 @@ class QuickNodeVerifier:
         
         # Get owner information
         try:
-            info["owner"] = contract.functions.owner().call()
+            info["owner"] = read("owner")
             print(f"Owner: {info['owner']}")
             
             # Check owner balance
-            owner_balance = contract.functions.balanceOf(info["owner"]).call()
+            owner_balance = read("balanceOf", info["owner"])
             info["owner_balance"] = owner_balance / (10 ** info["decimals"])
             info["owner_percentage"] = (owner_balance / info["total_supply_raw"]) * 100
             print(f"Owner Balance: {info['owner_balance']:,.2f} {info['symbol']} ({info['owner_percentage']:.2f}%)")
@@ -112,117 +152,207 @@ class QuickNodeVerifier:
         
         return info
 
-    def analyze_holders(self):
-        """Analyze token holder distribution."""
-        print("\n📊 Analyzing Token Holders")
-        print("=" * 60)
+    def analyze_holders(self, watch_addresses=None):
+        """Analyze token holder distribution.
         
-        contract = self.w3.eth.contract(
-            address=Web3.to_checksum_address(TOKEN_ADDRESS),
-            abi=ERC20_ABI
-        )
+        Balances are fetched through Multicall3, so thousands of watch
+        addresses cost only a handful of eth_calls.
+        """
+        from multicall import MulticallBalanceChecker
+        addresses_to_check = self._holder_addresses(watch_addresses)
         
+        checker = MulticallBalanceChecker(self.w3 or pooled_web3(self.pool), TOKEN_ADDRESS)
+        start = time.time()
+        balances = checker.balances(address for _, address in addresses_to_check)
+        
+        return self._report_holders(addresses_to_check, balances, checker.rpc_calls, time.time() - start)
+
+    def _holder_addresses(self, watch_addresses=None):
+        """Known addresses plus any watch list entries, as (label, address) pairs."""
         # Check some known addresses
         addresses_to_check = [
             ("Creator", "0xC5D133296E17BA25DF0409a6C31607bf3B78e3e3"),
             ("Initial Mint Recipient", "0x18b2b2ce7d05bfe0883ff874ba0c536a89d07363"),
             ("Recent Transfer", "0x192cea8729e0df7c6f1f0f60fb0e67a7b34bc")
         ]
-        
-        print("Checking known addresses:")
+        if watch_addresses is None and os.path.exists(WATCH_ADDRESSES_FILE):
+            from multicall import load_watch_addresses
+            watch_addresses = load_watch_addresses(WATCH_ADDRESSES_FILE)
+        if watch_addresses:
+            addresses_to_check.extend(watch_addresses)
+        return addresses_to_check
+
+    def _report_holders(self, addresses_to_check, balances, rpc_calls, elapsed):
+        """Print holder balances and return one result dict per checked address."""
+        print("\n📊 Analyzing Token Holders")
+        print("=" * 60)
+        print(f"Checking {len(addresses_to_check):,} addresses "
+              f"({rpc_calls} eth_call(s), {elapsed:.2f}s):")
         print("-" * 40)
         
+        results = []
         for name, address in addresses_to_check:
-            try:
-                # Ensure valid address format
-                if len(address) == 42:  # Valid address length
-                    checksum_addr = Web3.to_checksum_address(address)
-                    balance = contract.functions.balanceOf(checksum_addr).call()
-                    balance_formatted = balance / (10 ** 18)
-                    if balance > 0:
-                        print(f"{name}: {balance_formatted:,.2f} SDM")
-                    else:
-                        print(f"{name}: 0 SDM")
-            except Exception as e:
-                print(f"{name}: Error checking ({str(e)[:30]}...)")
-        
-        return True
+            # Invalid addresses are reported under the address as given, valid ones checksummed
+            key = address if address in balances else to_checksum_address(address)
+            entry = balances[key]
+            results.append({"name": name, "address": address, **entry})
+        
+        # Print every entry for short lists, otherwise only a summary and the largest balances
+        verbose = len(results) <= 20
+        for entry in results:
+            if entry["balance"] is None:
+                if entry["error"] != "Invalid address":
+                    print(f"{entry['name']}: Error checking ({entry['error'][:30]}...)")
+            elif verbose:
+                balance_formatted = entry["balance"] / (10 ** 18)
+                if entry["balance"] > 0:
+                    print(f"{entry['name']}: {balance_formatted:,.2f} SDM")
+                else:
+                    print(f"{entry['name']}: 0 SDM")
+        
+        if not verbose:
+            funded = sorted((e for e in results if e["balance"]), key=lambda e: e["balance"], reverse=True)
+            failed = sum(1 for e in results if e["balance"] is None)
+            print(f"Addresses with balance: {len(funded):,}")
+            print(f"Failed lookups: {failed:,}")
+            print("\nLargest balances:")
+            for entry in funded[:10]:
+                print(f"{entry['name']}: {entry['balance'] / (10 ** 18):,.2f} SDM")
+        
+        return results
 
-    def check_recent_activity(self):
-        """Check recent blockchain activity for the token."""
-        print("\n📈 Recent Activity Analysis")
-        print("=" * 60)
+    def check_recent_activity(self, full_history=False):
+        """Check recent blockchain activity for the token.
         
+        With full_history, every Transfer since the token's creation block is
+        read from the local event index instead of just the last 1000 blocks.
+        """
         try:
             # Get latest block
-            latest_block = self.w3.eth.block_number
+            latest_block = self._block_number()
             
-            # Get recent logs (Transfer events)
-            transfer_topic = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+            if full_history:
+                logs = self._scan_transfers(TOKEN_CREATION_BLOCK, latest_block)
+                self._report_recent_activity(TOKEN_CREATION_BLOCK, latest_block, logs)
+                return
             
             # Check last 1000 blocks (approximately last few hours)
             from_block = max(0, latest_block - 1000)
-            
-            print(f"Checking blocks {from_block:,} to {latest_block:,}")
-            
-            filter_params = {
-                "fromBlock": from_block,
-                "toBlock": latest_block,
-                "address": Web3.to_checksum_address(TOKEN_ADDRESS),
-                "topics": [transfer_topic]
-            }
-            
-            logs = self.w3.eth.get_logs(filter_params)
-            
-            print(f"Found {len(logs)} Transfer events in recent blocks")
-            
-            if logs:
-                print("\nLast 5 transfers:")
-                print("-" * 40)
-                for log in logs[-5:]:
-                    block = log["blockNumber"]
-                    tx_hash = log["transactionHash"].hex()
-                    print(f"Block {block}: {tx_hash[:20]}...")
+            logs = (self.lite or self.w3.eth).get_logs(self._transfer_filter(from_block, latest_block))
+            self._report_recent_activity(from_block, latest_block, logs)
             
         except Exception as e:
-            print(f"Error checking activity: {e}")
+            self._report_recent_activity(error=e)
+
+    def _scan_transfers(self, from_block, to_block):
+        """Transfer logs between two blocks.
+
+        Confirmed blocks come from the local event index, synced first; the last
+        DEFAULT_CONFIRMATIONS blocks can still reorg, so they are read live and never stored.
+        """
+        confirmed = to_block - DEFAULT_CONFIRMATIONS
+        logs = []
+        if from_block <= confirmed:
+            index = EventIndex(pool=self.pool)
+            try:
+                index.sync(to_block=confirmed)
+                logs = index.logs("Transfer", from_block, confirmed)
+            finally:
+                index.close()
+        tail_start = max(from_block, confirmed + 1)
+        if tail_start <= to_block:
+            logs += LiteClient(self.pool).get_logs(self._transfer_filter(tail_start, to_block))
+        return logs
+
+    @staticmethod
+    def _transfer_filter(from_block, to_block):
+        # Get recent logs (Transfer events)
+        return {
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "address": to_checksum_address(TOKEN_ADDRESS),
+            "topics": [TRANSFER_TOPIC]
+        }
+
+    def _report_recent_activity(self, from_block=None, latest_block=None, logs=None, error=None):
+        """Print the recent Transfer activity summary."""
+        print("\n📈 Recent Activity Analysis")
+        print("=" * 60)
+        
+        if error is not None:
+            print(f"Error checking activity: {error}")
+            return
+        
+        print(f"Checking blocks {from_block:,} to {latest_block:,}")
+        print(f"Found {len(logs)} Transfer events in {latest_block - from_block + 1:,} blocks")
+        
+        if logs:
+            print("\nLast 5 transfers:")
+            print("-" * 40)
+            for log in logs[-5:]:
+                block = log["blockNumber"]
+                tx_hash = "0x" + bytes(log["transactionHash"]).hex()
+                print(f"Block {block}: {tx_hash[:20]}...")
+
+    def _token_code(self):
+        """Token bytecode at the finalized block, which the chain cache can serve on every later read."""
+        if self.lite:
+            return self.lite.get_code(to_checksum_address(TOKEN_ADDRESS), self.pool.finalized_block())
+        return self.w3.eth.get_code(to_checksum_address(TOKEN_ADDRESS),
+                                    block_identifier=self.pool.finalized_block())
 
     def verify_contract_bytecode(self):
         """Analyze contract bytecode for verification hints."""
+        return self._report_bytecode(self._token_code())
+
+    def _report_bytecode(self, code):
+        """Print bytecode patterns and metadata hints for the given runtime code."""
         print("\n🔍 Bytecode Analysis for Verification")
         print("=" * 60)
         
-        code = self.w3.eth.get_code(Web3.to_checksum_address(TOKEN_ADDRESS))
-        code_hex = code.hex()
+        start = time.perf_counter()
+        analysis = analyze(code)
+        elapsed = time.perf_counter() - start
         
         print(f"Contract Bytecode Size: {len(code):,} bytes")
-        print(f"Bytecode Hash: {Web3.keccak(code).hex()[:20]}...")
+        print(f"Bytecode Hash: 0x{keccak(bytes(code)).hex()[:18]}...")
+        print(f"Disassembled {analysis['instructions']:,} instructions in {elapsed * 1000:.1f}ms, "
+              f"{len(analysis['selectors'])} dispatcher selectors")
         
-        # Look for common patterns
+        # Selectors come from the dispatcher and constants from PUSH operands, never from PUSH data or metadata
         patterns = {
-            "Solidity 0.8": "6080604052",
-            "OpenZeppelin": "8be0079c531659141344cd1fd0a4f28419497f9722a3daafe3b4186f6b6457e0",
-            "Ownable": "f2fde38b",
-            "ERC20": "18160ddd",  # totalSupply selector
-            "Mint Function": "40c10f19",  # mint selector
-            "Burn Function": "42966c68"   # burn selector
+            "Solidity memory prologue": analysis["solidity_prologue"],
+            "Solidity 0.8 checked arithmetic": has_constant(analysis, PANIC_SELECTOR),
+            "OpenZeppelin": has_constant(analysis, "0x8be0079c531659141344cd1fd0a4f28419497f9722a3daafe3b4186f6b6457e0"),
+            "Ownable": has_selector(analysis, "0xf2fde38b"),
+            "ERC20": has_selector(analysis, "0x18160ddd"),  # totalSupply selector
+            "Mint Function": has_selector(analysis, "0x40c10f19"),  # mint selector
+            "Burn Function": has_selector(analysis, "0x42966c68")   # burn selector
         }
         
         print("\nDetected Patterns:")
         print("-" * 40)
-        for name, pattern in patterns.items():
-            if pattern.lower() in code_hex:
+        for name, found in patterns.items():
+            if found:
                 print(f"✅ {name} pattern found")
             else:
                 print(f"❌ {name} pattern not found")
         
         # Check for metadata
-        if "a264697066735822" in code_hex:  # IPFS hash marker
-            print("✅ Metadata hash found (indicates Solidity >=0.5.0)")
-            # Extract metadata
-            metadata_start = code_hex.index("a264697066735822")
-            metadata_section = code_hex[metadata_start:metadata_start+100]
-            print(f"   Metadata: {metadata_section[:50]}...")
+        metadata = decode_metadata(code)
+        if metadata is not None:
+            print(f"✅ Metadata trailer found at offset {analysis['metadata_offset']:,} "
+                  f"({len(analysis['metadata'])} bytes of CBOR)")
+            print(f"   Compiler: solc {metadata['solc'] or 'unknown (< 0.5.9)'}")
+            if metadata["ipfs"]:
+                print(f"   Metadata IPFS: {metadata['ipfs']}")
+            for swarm in ("bzzr0", "bzzr1"):
+                if metadata[swarm]:
+                    print(f"   Metadata Swarm ({swarm}): {metadata[swarm]}")
+            if metadata["experimental"]:
+                print("   ⚠️ Compiled with experimental features enabled")
+        elif analysis["metadata"] is not None:
+            print(f"⚠️ Metadata trailer at offset {analysis['metadata_offset']:,} could not be decoded")
         
         return True
 
@@ -275,14 +405,35 @@ echo "API Key: $ARBISCAN_API_KEY"
 
     def check_contract_security(self):
         """Perform security checks on the contract."""
+        address = to_checksum_address(TOKEN_ADDRESS)
+        try:
+            if self.lite:
+                owner = self.lite.call(address, "owner")
+            else:
+                owner = self.w3.eth.contract(address=address, abi=ERC20_ABI).functions.owner().call()
+        except Exception as e:
+            owner = e
+        current_block = self._block_number()
+        verified = self.check_verification_status()
+        
+        return self._report_security(owner, current_block, verified, self._age_seconds(current_block))
+
+    def _age_seconds(self, current_block):
+        """Seconds between the token's creation block and current_block, from real block timestamps.
+
+        None if either timestamp can't be read, so the report falls back to an estimate.
+        """
+        try:
+            timestamps = self.block_times.timestamps([TOKEN_CREATION_BLOCK, current_block])
+            return timestamps[current_block] - timestamps[TOKEN_CREATION_BLOCK]
+        except Exception:
+            return None
+
+    def _report_security(self, owner, current_block, verified, age_seconds):
+        """Print the security analysis; owner is an exception if owner() could not be read."""
         print("\n🔒 Security Analysis")
         print("=" * 60)
         
-        contract = self.w3.eth.contract(
-            address=Web3.to_checksum_address(TOKEN_ADDRESS),
-            abi=ERC20_ABI
-        )
-        
         security_checks = {
             "has_owner": False,
             "owner_renounced": False,
@@ -294,7 +445,8 @@ echo "API Key: $ARBISCAN_API_KEY"
         
         # Check for owner
         try:
-            owner = contract.functions.owner().call()
+            if isinstance(owner, Exception):
+                raise owner
             if owner != "0x0000000000000000000000000000000000000000":
                 security_checks["has_owner"] = True
                 print(f"✅ Has Owner: {owner}")
@@ -305,12 +457,13 @@ echo "API Key: $ARBISCAN_API_KEY"
             print("❓ No standard owner function")
         
         # Check contract age
-        creation_block = 362698455  # From our previous analysis
-        current_block = self.w3.eth.block_number
-        blocks_old = current_block - creation_block
-        days_old = blocks_old * 2 / 86400  # ~2 seconds per block on Arbitrum
-        
-        print(f"📅 Contract Age: ~{days_old:.1f} days ({blocks_old:,} blocks)")
+        blocks_old = current_block - TOKEN_CREATION_BLOCK
+        if age_seconds is not None:
+            days_old = age_seconds / 86400
+            print(f"📅 Contract Age: {days_old:.1f} days ({blocks_old:,} blocks)")
+        else:
+            days_old = blocks_old * ESTIMATED_BLOCK_TIME / 86400
+            print(f"📅 Contract Age: ~{days_old:.1f} days ({blocks_old:,} blocks, estimated from block count)")
         
         if days_old < 7:
             print("   ⚠️ Very new contract (< 1 week)")
@@ -324,7 +477,7 @@ echo "API Key: $ARBISCAN_API_KEY"
         print("-" * 40)
         risk_level = 0
         
-        if not self.check_verification_status():
+        if not verified:
             print("• HIGH RISK: Contract not verified")
             risk_level += 3
         
@@ -347,16 +500,8 @@ echo "API Key: $ARBISCAN_API_KEY"
 
     def check_verification_status(self):
         """Quick check if contract is verified."""
-        params = {
-            "module": "contract",
-            "action": "getsourcecode",
-            "address": TOKEN_ADDRESS,
-            "apikey": ARBISCAN_API_KEY
-        }
-        
         try:
-            response = requests.get(ARBISCAN_API, params=params, timeout=10)
-            data = response.json()
+            data = get_arbiscan_client().getsourcecode(TOKEN_ADDRESS)
             
             if data["status"] == "1" and data["result"]:
                 source = data["result"][0]
@@ -402,24 +547,185 @@ echo "API Key: $ARBISCAN_API_KEY"
         
         print("=" * 70)
 
-def main():
+
+class AsyncQuickNodeVerifier(QuickNodeVerifier):
+    """AsyncWeb3 variant of QuickNodeVerifier that overlaps independent network calls.
+    
+    Each section is printed once its data has arrived, so analyses run
+    concurrently without interleaving their output.
+    """
+
+    def __init__(self, pool=None, concurrency=DEFAULT_CONCURRENCY):
+        # Connection checks need a running event loop, use create() instead
+        self.pool = pool or get_rpc_pool()
+        self.lite = None
+        self.w3 = pooled_async_web3(self.pool)
+        self.block_times = BlockTimes(pool=self.pool)
+        self.concurrency = concurrency
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+    @classmethod
+    async def create(cls, pool=None, concurrency=DEFAULT_CONCURRENCY):
+        """Initialize with the shared RPC pool and check the connection."""
+        print("🚀 Connecting to QuickNode Arbitrum RPC...")
+        self = cls(pool, concurrency)
+        
+        if not await self.w3.is_connected():
+            raise ConnectionError("Failed to connect to QuickNode")
+        
+        chain_id, block_number, gas_price = await asyncio.gather(
+            self.w3.eth.chain_id, self.w3.eth.block_number, self.w3.eth.gas_price
+        )
+        print("✅ Connected to QuickNode successfully!")
+        print(f"   Endpoints: {', '.join(endpoint.name for endpoint in self.pool.endpoints)} (async, concurrency {self.concurrency})")
+        print(f"   Chain ID: {chain_id}")
+        print(f"   Latest Block: {block_number:,}")
+        print(f"   Gas Price: {gas_price / 10**9:.2f} Gwei")
+        print()
+        return self
+
+    async def _limited(self, awaitable):
+        async with self.semaphore:
+            return await awaitable
+
+    async def _gather(self, awaitables):
+        """Await named calls concurrently, returning exceptions in place of failed values."""
+        values = await asyncio.gather(
+            *(self._limited(awaitable) for awaitable in awaitables.values()),
+            return_exceptions=True
+        )
+        return dict(zip(awaitables.keys(), values))
+
+    def _contract(self):
+        return self.w3.eth.contract(address=to_checksum_address(TOKEN_ADDRESS), abi=ERC20_ABI)
+
+    async def get_detailed_token_info(self):
+        """Get comprehensive token information with all reads in flight at once."""
+        contract = self._contract()
+        finalized = await asyncio.to_thread(self.pool.finalized_block)
+        calls = {"code": self.w3.eth.get_code(contract.address, block_identifier=finalized)}
+        for fn_name in ("name", "symbol", "decimals", "totalSupply", "owner"):
+            calls[fn_name] = getattr(contract.functions, fn_name)().call()
+        values = await self._gather(calls)
+        
+        # The owner balance depends on the owner read, so it is the only follow-up call
+        if not isinstance(values["owner"], Exception):
+            values.update(await self._gather({"balanceOf": contract.functions.balanceOf(values["owner"]).call()}))
+        
+        def read(fn_name, *args):
+            value = values.get(fn_name, LookupError(fn_name))
+            if isinstance(value, Exception):
+                raise value
+            return value
+        
+        return self._report_token_info(read("code"), read)
+
+    async def analyze_holders(self, watch_addresses=None):
+        """Analyze token holder distribution with Multicall3 chunks fetched concurrently."""
+        from multicall import MulticallBalanceChecker
+        addresses_to_check = self._holder_addresses(watch_addresses)
+        
+        checker = MulticallBalanceChecker(self.w3, TOKEN_ADDRESS)
+        start = time.time()
+        balances = await checker.balances_async((address for _, address in addresses_to_check), self.semaphore)
+        
+        return self._report_holders(addresses_to_check, balances, checker.rpc_calls, time.time() - start)
+
+    async def check_recent_activity(self, full_history=False):
+        """Check recent blockchain activity for the token."""
+        try:
+            latest_block = await self._limited(self.w3.eth.block_number)
+            if full_history:
+                # The scanner runs its own worker threads over the shared pool
+                logs = await asyncio.to_thread(self._scan_transfers, TOKEN_CREATION_BLOCK, latest_block)
+                self._report_recent_activity(TOKEN_CREATION_BLOCK, latest_block, logs)
+                return
+            from_block = max(0, latest_block - 1000)
+            logs = await self._limited(self.w3.eth.get_logs(self._transfer_filter(from_block, latest_block)))
+            self._report_recent_activity(from_block, latest_block, logs)
+        except Exception as e:
+            self._report_recent_activity(error=e)
+
+    async def verify_contract_bytecode(self):
+        """Analyze contract bytecode for verification hints."""
+        finalized = await asyncio.to_thread(self.pool.finalized_block)
+        code = await self._limited(self.w3.eth.get_code(to_checksum_address(TOKEN_ADDRESS),
+                                                        block_identifier=finalized))
+        return self._report_bytecode(code)
+
+    async def check_contract_security(self):
+        """Perform security checks, fetching owner, head and verification status concurrently."""
+        values = await self._gather({
+            "owner": self._contract().functions.owner().call(),
+            "block_number": self.w3.eth.block_number,
+            "verified": asyncio.to_thread(self.check_verification_status)
+        })
+        if isinstance(values["block_number"], Exception):
+            raise values["block_number"]
+        age_seconds = await asyncio.to_thread(self._age_seconds, values["block_number"])
+        return self._report_security(values["owner"], values["block_number"], values["verified"] is True, age_seconds)
+
+
+async def run_async(concurrency, full_history=False):
+    """Run the analyses with independent network calls overlapped."""
+    verifier = await AsyncQuickNodeVerifier.create(concurrency=concurrency)
+    
+    token_info = await verifier.get_detailed_token_info()
+    if token_info:
+        await asyncio.gather(
+            verifier.analyze_holders(),
+            verifier.check_recent_activity(full_history),
+            verifier.verify_contract_bytecode(),
+            verifier.check_contract_security()
+        )
+        verifier.generate_verification_script()
+        await asyncio.to_thread(verifier.generate_final_report)
+    verifier.pool.print_stats()
+    get_arbiscan_client().print_timing()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Enhanced SDM token verification with QuickNode")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="overlap independent network calls using AsyncWeb3")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"maximum in-flight requests in async mode (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--full-history", action="store_true",
+                        help=f"scan every Transfer since the creation block ({TOKEN_CREATION_BLOCK:,}) instead of the last 1000 blocks")
+    parser.add_argument("--backend", choices=BACKENDS, default=RPC_BACKEND,
+                        help=f"client for token reads, code and logs; lite avoids web3 (default: {RPC_BACKEND})")
+    args = parser.parse_args(argv)
+    if args.use_async and args.backend == "lite":
+        parser.error("--async uses AsyncWeb3 and cannot be combined with --backend lite")
+    
+    if not ARBISCAN_API_KEY:
+        print("⚠️  Warning: ARBISCAN_API_KEY not found in environment variables.")
+        print("   Some features will be limited without an API key.")
+        print("   Copy .env.example to .env and add your API key.")
+    
     print("🚀 Enhanced Token Verification with QuickNode")
     print("=" * 70)
     print()
     
     try:
+        if args.use_async:
+            asyncio.run(run_async(args.concurrency, args.full_history))
+            print("\n✅ Analysis complete!")
+            return 0
+        
         # Initialize verifier
-        verifier = QuickNodeVerifier()
+        verifier = QuickNodeVerifier(backend=args.backend)
         
         # Run comprehensive analysis
         token_info = verifier.get_detailed_token_info()
         if token_info:
             verifier.analyze_holders()
-            verifier.check_recent_activity()
+            verifier.check_recent_activity(args.full_history)
             verifier.verify_contract_bytecode()
             verifier.check_contract_security()
             verifier.generate_verification_script()
             verifier.generate_final_report()
+        verifier.pool.print_stats()
+        get_arbiscan_client().print_timing()
         
         print("\n✅ Analysis complete!")
         
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Token-bucket rate limiting for Arbiscan API keys
+Bucket state can live in a lock-protected file so concurrently running scripts share one quota
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to per-process limiting
+    fcntl = None
+
+# Arbiscan's documented free-tier limit is 5 calls per second per API key
+ARBISCAN_RATE_LIMIT = float(os.getenv('ARBISCAN_RATE_LIMIT', '5'))
+
+# Requests without a key are limited to 1 call every 5 seconds
+KEYLESS_RATE_LIMIT = 0.2
+
+# Shared across every script run by the same user on this machine
+RATE_LIMIT_STATE_DIR = os.getenv('RATE_LIMIT_STATE_DIR', os.path.join(tempfile.gettempdir(), "sdm-ratelimit"))
+
+
+class TokenBucket:
+    """Classic token bucket refilled at `rate` tokens per second up to `capacity`.
+
+    With a state_path the bucket is stored in a JSON file guarded by flock,
+    so every process using the same path draws from the same quota.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, state_path: Optional[str] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.state_path = state_path if fcntl else None
+        self._state = {"tokens": self.capacity, "updated": time.time()}
+        self._lock = threading.Lock()
+        if self.state_path:
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+
+    @contextmanager
+    def _locked_state(self):
+        """Yield the bucket state dict under an exclusive lock, persisting changes on exit."""
+        with self._lock:
+            if not self.state_path:
+                yield self._state
+                return
+
+            with open(self.state_path, "a+") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        state = json.loads(f.read() or "{}")
+                    except ValueError:
+                        state = {}
+                    state.setdefault("tokens", self.capacity)
+                    state.setdefault("updated", time.time())
+                    yield state
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def try_acquire(self, tokens: float = 1.0) -> Tuple[bool, float]:
+        """Take tokens if available. Returns (acquired, seconds until enough tokens would be available)."""
+        with self._locked_state() as state:
+            now = time.time()
+            elapsed = max(0.0, now - state["updated"])
+            state["tokens"] = min(self.capacity, state["tokens"] + elapsed * self.rate)
+            state["updated"] = now
+            if state["tokens"] >= tokens:
+                state["tokens"] -= tokens
+                return True, 0.0
+            return False, (tokens - state["tokens"]) / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until tokens are available; returns the total time spent waiting."""
+        waited = 0.0
+        while True:
+            acquired, wait = self.try_acquire(tokens)
+            if acquired:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+
+class APIKeyPool:
+    """Round-robin pool of API keys, each with its own token bucket."""
+
+    def __init__(self, keys: List[Optional[str]], rate_per_key: float = ARBISCAN_RATE_LIMIT,
+                 state_dir: Optional[str] = RATE_LIMIT_STATE_DIR):
+        if not keys:
+            raise ValueError("APIKeyPool needs at least one key (use None for keyless access)")
+        self.keys = keys
+        self.buckets = [
+            TokenBucket(rate_per_key if key else KEYLESS_RATE_LIMIT,
+                        state_path=self._state_path(state_dir, key) if state_dir else None)
+            for key in keys
+        ]
+        self.waited = 0.0
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _state_path(state_dir: str, key: Optional[str]) -> str:
+        # Never write the key itself to disk
+        key_id = hashlib.sha256((key or "anonymous").encode()).hexdigest()[:16]
+        return os.path.join(state_dir, f"arbiscan_{key_id}.json")
+
+    def acquire(self) -> Optional[str]:
+        """Return a key with quota available, waiting for the soonest one if all are exhausted."""
+        while True:
+            with self._lock:
+                start = self._next
+                self._next = (self._next + 1) % len(self.keys)
+            shortest_wait = None
+            for offset in range(len(self.keys)):
+                index = (start + offset) % len(self.keys)
+                acquired, wait = self.buckets[index].try_acquire()
+                if acquired:
+                    return self.keys[index]
+                shortest_wait = wait if shortest_wait is None else min(shortest_wait, wait)
+            time.sleep(shortest_wait)
+            self.waited += shortest_wait
+
+    def stats(self) -> Dict[str, Any]:
+        return {"keys": len(self.keys), "rate_per_key": self.buckets[0].rate, "waited_seconds": round(self.waited, 2)}
+
+
+def arbiscan_keys_from_env() -> List[Optional[str]]:
+    """ARBISCAN_API_KEYS (comma-separated) plus ARBISCAN_API_KEY, deduplicated; [None] if none are set."""
+    keys = [key.strip() for key in os.getenv('ARBISCAN_API_KEYS', '').split(",") if key.strip()]
+    single = os.getenv('ARBISCAN_API_KEY')
+    if single and single not in keys:
+        keys.append(single)
+    return keys or [None]
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Shared multi-endpoint JSON-RPC pool for the Arbitrum scripts
+Routes every call to the healthiest endpoint, fails over mid-run and can hedge slow calls
+"""
+
+import os
+import time
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
+
+import requests
+from dotenv import load_dotenv
+
+# Load environment variables before chain_cache reads its settings at import
+load_dotenv()
+
+from chain_cache import CHAIN_CACHE, ChainCache, cache_key, pinned_block  # noqa: E402
+
+if TYPE_CHECKING:
+    from web3 import Web3, AsyncWeb3
+
+# Arbitrum RPC endpoints (ARBITRUM_RPC_URL replaces the public one, e.g. with a local replay server)
+ARBITRUM_RPC = os.getenv('ARBITRUM_RPC_URL') or 'https://arb1.arbitrum.io/rpc'
+INFURA_API_KEY = os.getenv('INFURA_API_KEY', '')
+QUICKNODE_RPC_URL = os.getenv('QUICKNODE_RPC_URL', '')
+
+# Set RPC_HEDGE=1 to send a duplicate request when the primary endpoint is slower than its p95
+RPC_HEDGE = os.getenv('RPC_HEDGE', '0') == '1'
+
+# Calls that must never be duplicated by hedging
+NON_IDEMPOTENT_METHODS = {"eth_sendRawTransaction", "eth_sendTransaction"}
+
+# JSON-RPC errors that mean the endpoint, not the request, is at fault: rate limits only.
+# -32005 alone is not enough, Infura also returns it for eth_getLogs queries with too many results
+ENDPOINT_ERROR_CODES = {429}
+RATE_LIMIT_MESSAGES = ("rate limit", "rate exceeded", "too many requests", "request limit",
+                       "daily request count", "compute units")
+
+# Seconds before the finalized block number is looked up again
+FINALIZED_REFRESH = 60
+
+
+class EndpointError(Exception):
+    """Transport-level failure of a single endpoint (timeout, HTTP error, rate limit)."""
+
+
+class RPCError(Exception):
+    """JSON-RPC error returned by the node for the request itself."""
+
+    def __init__(self, error: Dict[str, Any]):
+        super().__init__(error.get("message", str(error)))
+        self.code = error.get("code")
+        self.error = error
+
+
+def _is_endpoint_error(error: Any) -> bool:
+    """Whether a JSON-RPC error object is the endpoint refusing service rather than rejecting the request."""
+    if not isinstance(error, dict):
+        return False
+    message = str(error.get("message", "")).lower()
+    return error.get("code") in ENDPOINT_ERROR_CODES or any(text in message for text in RATE_LIMIT_MESSAGES)
+
+
+def _is_configured(value: str) -> bool:
+    return bool(value) and not value.startswith("YOUR_")
+
+
+class RPCEndpoint:
+    """One JSON-RPC endpoint with moving-average latency and error-rate tracking."""
+
+    def __init__(self, name: str, url: str, alpha: float = 0.2, window: int = 200):
+        self.name = name
+        self.url = url
+        self.alpha = alpha
+        self.session = requests.Session()
+        self.latency_ewma: Optional[float] = None
+        self.error_ewma = 0.0
+        self.samples = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, ok: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            if ok:
+                self.samples.append(latency)
+                if self.latency_ewma is None:
+                    self.latency_ewma = latency
+                else:
+                    self.latency_ewma += self.alpha * (latency - self.latency_ewma)
+            else:
+                self.errors += 1
+            self.error_ewma += self.alpha * ((0.0 if ok else 1.0) - self.error_ewma)
+
+    def p95(self) -> Optional[float]:
+        with self._lock:
+            if len(self.samples) < 5:
+                return None
+            ordered = sorted(self.samples)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+    @property
+    def score(self) -> float:
+        """Expected cost of a call; lower is better. Unmeasured endpoints get a neutral guess."""
+        latency = self.latency_ewma if self.latency_ewma is not None else 0.5
+        return latency * (1 + 10 * self.error_ewma)
+
+    def post(self, payload: Any, timeout: float) -> Any:
+        """POST a JSON-RPC payload, recording latency and raising EndpointError on failure."""
+        start = time.monotonic()
+        try:
+            response = self.session.post(self.url, json=payload, timeout=timeout)
+            if response.status_code == 429 or response.status_code >= 500:
+                raise EndpointError(f"{self.name}: HTTP {response.status_code}")
+            response.raise_for_status()
+            data = response.json()
+            responses = data if isinstance(data, list) else [data]
+            for item in responses:
+                if isinstance(item, dict) and _is_endpoint_error(item.get("error")):
+                    raise EndpointError(f"{self.name}: {item['error'].get('message')}")
+        except EndpointError:
+            self.record(time.monotonic() - start, ok=False)
+            raise
+        except Exception as e:
+            self.record(time.monotonic() - start, ok=False)
+            raise EndpointError(f"{self.name}: {e}") from e
+
+        self.record(time.monotonic() - start, ok=True)
+        return data
+
+
+class RPCPool:
+    """Latency-aware JSON-RPC router over several endpoints, shared by all scripts."""
+
+    def __init__(
+        self,
+        endpoints: List[RPCEndpoint],
+        hedge: bool = RPC_HEDGE,
+        hedge_min_delay: float = 0.25,
+        timeout: float = 30,
+        max_workers: int = 16,
+        cache: Optional[ChainCache] = None,
+    ):
+        if not endpoints:
+            raise ValueError("RPCPool needs at least one endpoint")
+        self.endpoints = endpoints
+        self.hedge = hedge and len(endpoints) > 1
+        self.hedge_min_delay = hedge_min_delay
+        self.timeout = timeout
+        self.hedged_requests = 0
+        self._ids = iter(range(1, 2**62))
+        self._id_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers) if self.hedge else None
+        self.cache = cache
+        self._finalized = -1
+        self._finalized_checked = 0.0
+
+    @classmethod
+    def from_env(cls, **kwargs) -> "RPCPool":
+        """Build the pool from the public, Infura and QuickNode endpoints that are configured."""
+        endpoints = [RPCEndpoint("public", ARBITRUM_RPC)]
+        if _is_configured(INFURA_API_KEY):
+            endpoints.append(RPCEndpoint("infura", f"https://arbitrum-mainnet.infura.io/v3/{INFURA_API_KEY}"))
+        if _is_configured(QUICKNODE_RPC_URL) and QUICKNODE_RPC_URL != ARBITRUM_RPC:
+            endpoints.append(RPCEndpoint("quicknode", QUICKNODE_RPC_URL))
+        if CHAIN_CACHE:
+            kwargs.setdefault("cache", ChainCache())
+        return cls(endpoints, **kwargs)
+
+    def _next_id(self) -> int:
+        with self._id_lock:
+            return next(self._ids)
+
+    def ranked(self) -> List[RPCEndpoint]:
+        """Endpoints ordered from best to worst current score."""
+        return sorted(self.endpoints, key=lambda endpoint: endpoint.score)
+
+    def _send(self, payload: Any, hedgeable: bool) -> Any:
+        """Send a payload to the best endpoint, failing over (and optionally hedging) as needed."""
+        ranked = self.ranked()
+        if hedgeable and self.hedge:
+            return self._send_hedged(payload, ranked)
+
+        last_error = None
+        for endpoint in ranked:
+            try:
+                return endpoint.post(payload, self.timeout)
+            except EndpointError as e:
+                last_error = e
+        raise ConnectionError(f"All RPC endpoints failed, last error: {last_error}")
+
+    def _send_hedged(self, payload: Any, ranked: List[RPCEndpoint]) -> Any:
+        """Race a duplicate request on the next endpoint if the primary misses its p95 deadline."""
+        primary = ranked[0]
+        deadline = max(self.hedge_min_delay, primary.p95() or self.hedge_min_delay)
+        pending = {self._executor.submit(primary.post, payload, self.timeout)}
+        done, _ = wait(pending, timeout=deadline)
+        remaining = list(ranked[1:])
+        last_error = None
+
+        while True:
+            for future in done:
+                pending.discard(future)
+                try:
+                    return future.result()
+                except EndpointError as e:
+                    last_error = e
+            # Primary is slow or failed: bring in the next endpoint
+            if remaining and (not done or not pending):
+                self.hedged_requests += 1
+                pending.add(self._executor.submit(remaining.pop(0).post, payload, self.timeout))
+            if not pending:
+                raise ConnectionError(f"All RPC endpoints failed, last error: {last_error}")
+            done, _ = wait(pending, timeout=deadline if remaining else None, return_when=FIRST_COMPLETED)
+
+    def finalized_block(self) -> int:
+        """Latest finalized block number, refreshed at most every FINALIZED_REFRESH seconds."""
+        if time.monotonic() - self._finalized_checked > FINALIZED_REFRESH:
+            block = self.request("eth_getBlockByNumber", ["finalized", False])
+            self._finalized = int(block["number"], 16)
+            self._finalized_checked = time.monotonic()
+        return self._finalized
+
+    def _cached(self, method: str, params: Any) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return (cache key, cached response) for a request; the response is None on a miss."""
+        key = cache_key(method, params) if self.cache else None
+        if key is None:
+            return None, None
+        hit, result = self.cache.get(key)
+        return key, ({"jsonrpc": "2.0", "id": self._next_id(), "result": result} if hit else None)
+
+    def _remember(self, key: Optional[str], method: str, params: Any, response: Dict[str, Any]) -> None:
+        """Cache a response if everything it depends on is at or below the finalized block."""
+        if key is None or "error" in response:
+            return
+        block = pinned_block(method, params, response.get("result"))
+        if block is None:
+            return
+        if block > self._finalized:
+            try:
+                self.finalized_block()
+            except Exception:
+                return
+        if block <= self._finalized:
+            self.cache.put(key, response["result"])
+
+    def raw_request(self, method: str, params: Any) -> Dict[str, Any]:
+        """Return the full JSON-RPC response dict, including any node-side error."""
+        key, cached = self._cached(method, params)
+        if cached is not None:
+            return cached
+        payload = {"jsonrpc": "2.0", "id": self._next_id(), "method": method, "params": params}
+        response = self._send(payload, hedgeable=method not in NON_IDEMPOTENT_METHODS)
+        self._remember(key, method, params, response)
+        return response
+
+    def request(self, method: str, params: Any) -> Any:
+        """Return the call's result, raising RPCError if the node rejected it."""
+        response = self.raw_request(method, params)
+        if "error" in response:
+            raise RPCError(response["error"])
+        return response.get("result")
+
+    def batch(self, calls: List[Tuple[str, Any]]) -> List[Dict[str, Any]]:
+        """Send calls as one JSON-RPC batch array, returning responses in call order.
+
+        Calls answered by the chain cache are left out of the batch.
+        """
+        lookups = [self._cached(method, params) for method, params in calls]
+        pending = [i for i, (_, cached) in enumerate(lookups) if cached is None]
+        responses = [cached for _, cached in lookups]
+        if not pending:
+            return responses
+
+        ids = [self._next_id() for _ in pending]
+        payload = [
+            {"jsonrpc": "2.0", "id": call_id, "method": calls[i][0], "params": calls[i][1]}
+            for call_id, i in zip(ids, pending)
+        ]
+        data = self._send(payload, hedgeable=all(calls[i][0] not in NON_IDEMPOTENT_METHODS for i in pending))
+        if not isinstance(data, list):
+            raise RPCError(data.get("error", {"message": f"Endpoint rejected batch request: {data}"}))
+
+        # Batch responses may come back in any order
+        by_id = {item.get("id"): item for item in data}
+        for call_id, i in zip(ids, pending):
+            responses[i] = by_id.get(call_id, {"error": {"message": "No response in batch"}})
+            self._remember(lookups[i][0], calls[i][0], calls[i][1], responses[i])
+        return responses
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": endpoint.name,
+                "requests": endpoint.requests,
+                "errors": endpoint.errors,
+                "latency_ms": round(endpoint.latency_ewma * 1000, 1) if endpoint.latency_ewma is not None else None,
+                "p95_ms": round(endpoint.p95() * 1000, 1) if endpoint.p95() is not None else None,
+            }
+            for endpoint in self.endpoints
+        ]
+
+    def print_stats(self) -> None:
+        print("\n🌐 RPC Endpoint Statistics")
+        print("-" * 40)
+        for stat in self.stats():
+            latency = f"{stat['latency_ms']}ms" if stat["latency_ms"] is not None else "n/a"
+            p95 = f"{stat['p95_ms']}ms" if stat["p95_ms"] is not None else "n/a"
+            print(f"• {stat['name']}: {stat['requests']} requests, {stat['errors']} errors, "
+                  f"avg {latency}, p95 {p95}")
+        if self.hedge:
+            print(f"• Hedged requests: {self.hedged_requests}")
+        if self.cache:
+            cache = self.cache.stats()
+            print(f"• Chain cache: {cache['hits']} hits, {cache['misses']} misses, "
+                  f"{cache['evictions']} evictions, {cache['size_mb']} MB")
+
+
+def _provider_classes():
+    """web3 provider classes over the pool, defined on first use so importing this module never loads web3."""
+    global _providers
+    if _providers is None:
+        from web3.providers.base import JSONBaseProvider
+        from web3.providers.async_base import AsyncJSONBaseProvider
+
+        class PooledHTTPProvider(JSONBaseProvider):
+            """web3 provider that sends every request through an RPCPool."""
+
+            def __init__(self, pool: Optional[RPCPool] = None):
+                super().__init__()
+                self.pool = pool or get_rpc_pool()
+
+            def make_request(self, method, params):
+                return self.pool.raw_request(method, params)
+
+            def is_connected(self, show_traceback: bool = False) -> bool:
+                try:
+                    self.pool.request("eth_chainId", [])
+                    return True
+                except Exception:
+                    if show_traceback:
+                        raise
+                    return False
+
+        class AsyncPooledHTTPProvider(AsyncJSONBaseProvider):
+            """AsyncWeb3 provider that runs pool requests in worker threads."""
+
+            def __init__(self, pool: Optional[RPCPool] = None):
+                super().__init__()
+                self.pool = pool or get_rpc_pool()
+
+            async def make_request(self, method, params):
+                return await asyncio.to_thread(self.pool.raw_request, method, params)
+
+            async def is_connected(self, show_traceback: bool = False) -> bool:
+                try:
+                    await asyncio.to_thread(self.pool.request, "eth_chainId", [])
+                    return True
+                except Exception:
+                    if show_traceback:
+                        raise
+                    return False
+
+        _providers = (PooledHTTPProvider, AsyncPooledHTTPProvider)
+    return _providers
+
+
+_providers = None
+
+
+_shared_pool: Optional[RPCPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_rpc_pool() -> RPCPool:
+    """Return the process-wide pool, building it from the environment on first use."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = RPCPool.from_env()
+        return _shared_pool
+
+
+def pooled_web3(pool: Optional[RPCPool] = None) -> "Web3":
+    from web3 import Web3
+    return Web3(_provider_classes()[0](pool))
+
+
+def pooled_async_web3(pool: Optional[RPCPool] = None) -> "AsyncWeb3":
+    from web3 import AsyncWeb3
+    return AsyncWeb3(_provider_classes()[1](pool))
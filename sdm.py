@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Single command line for the SDM verification and analysis scripts
+Each subcommand imports what it needs when it runs, so --help and cache-only commands never load web3
+
+Usage:
+    python sdm.py verify [--template | --manifest deployments.json]
+    python sdm.py analyze [--quicknode | --extra] [script options, e.g. --async]
+    python sdm.py holders [--cached] [--top N]
+    python sdm.py bytecode [--address ADDR | --code-file PATH]
+    python sdm.py manual
+"""
+
+import os
+import sys
+import argparse
+
+TOKEN_ADDRESS = "0x602b869eEf1C9F0487F31776bad8Af3C4A173394"
+
+# SDM's decimals; only assumed when holders are listed without network access
+TOKEN_DECIMALS = 18
+
+
+def _print_arbiscan_timing() -> None:
+    """Arbiscan call stats, if the command made any calls (never creates a client just to print)."""
+    client_module = sys.modules.get("arbiscan_client")
+    if client_module is not None and client_module._shared_client is not None:
+        client_module._shared_client.print_timing()
+
+
+def cmd_verify(args, extra) -> int:
+    if args.manifest:
+        import manifest_runner
+        return manifest_runner.main([args.manifest] + extra)
+    if extra:
+        raise SystemExit(f"sdm verify: unrecognized arguments: {' '.join(extra)}")
+    if args.template:
+        import verify_contract
+        status = verify_contract.main()
+    else:
+        import verify_burnmint
+        status = verify_burnmint.main()
+    _print_arbiscan_timing()
+    return status or 0
+
+
+def cmd_analyze(args, extra) -> int:
+    if args.extra:
+        import token_analysis
+        token_analysis.main()
+        return 0
+    if args.quicknode:
+        import quicknode_verify
+        return quicknode_verify.main(extra)
+    import verify_token
+    return verify_token.main(extra)
+
+
+def cmd_holders(args, extra) -> int:
+    if not args.cached:
+        import token_analysis
+        holders = token_analysis.get_token_holders()
+        _print_arbiscan_timing()
+        return 0 if holders else 1
+
+    from event_index import EVENT_INDEX_DB, EventIndex
+    from holder_ledger import HolderLedger
+    if not os.path.exists(args.db or EVENT_INDEX_DB):
+        print(f"❌ No event index at {args.db or EVENT_INDEX_DB}; run `sdm holders` once without --cached")
+        return 1
+    index = EventIndex(args.db or EVENT_INDEX_DB)
+    checkpoint = index.checkpoint()
+    ledger = HolderLedger.from_index(index, to_block=checkpoint)
+    index.close()
+    if not ledger.balances:
+        print("No holder data available yet")
+        return 1
+
+    print(f"📊 Holders as of block {checkpoint:,} (local event index, not synced)")
+    print(f"Total holders found: {ledger.holder_count:,} (from {ledger.transfer_count:,} transfers)")
+    print(f"\nTop {args.top} Holders:")
+    print("-" * 50)
+    for i, holder in enumerate(ledger.top(args.top), 1):
+        print(f"{i}. {holder['address']}")
+        print(f"   Balance: {holder['balance'] / 10**TOKEN_DECIMALS:,.2f} SDM ({holder['percentage']:.2f}%)")
+    return 0
+
+
+def cmd_bytecode(args, extra) -> int:
+    from evm_disasm import analyze
+    from cbor_metadata import decode_metadata
+
+    if args.code_file:
+        with open(args.code_file) as f:
+            text = f.read().strip()
+        code = bytes.fromhex(text[2:] if text.startswith("0x") else text)
+        source = args.code_file
+    else:
+        from rpc_pool import get_rpc_pool
+        pool = get_rpc_pool()
+        # Pinned to the finalized block so the chain cache answers every later run
+        block = pool.finalized_block()
+        code = bytes.fromhex(pool.request("eth_getCode", [args.address, hex(block)])[2:])
+        source = f"{args.address} at block {block:,}"
+    if not code:
+        print(f"❌ No code at {source}")
+        return 1
+
+    analysis = analyze(code)
+    metadata = decode_metadata(code)
+    print(f"🔍 Bytecode of {source}")
+    print("=" * 60)
+    print(f"Size: {analysis['size']:,} bytes ({analysis['executable_size']:,} executable)")
+    print(f"Instructions: {analysis['instructions']:,}, jump destinations: {analysis['jumpdests']:,}")
+    if analysis["unknown_opcodes"]:
+        print(f"⚠️  {analysis['unknown_opcodes']} unknown opcodes in executable code")
+    print(f"Solidity prologue: {'yes' if analysis['solidity_prologue'] else 'no'}")
+    if metadata is not None:
+        print(f"Compiler: solc {metadata['solc'] or 'unknown (< 0.5.9)'}")
+        if metadata["ipfs"]:
+            print(f"Metadata IPFS: {metadata['ipfs']}")
+    else:
+        print("No metadata trailer")
+    print(f"\nDispatcher selectors ({len(analysis['selectors'])}):")
+    for selector in analysis["selectors"]:
+        print(f"• {selector}")
+    return 0
+
+
+def cmd_manual(args, extra) -> int:
+    if extra:
+        raise SystemExit(f"sdm manual: unrecognized arguments: {' '.join(extra)}")
+    import manual_verify_helper
+    manual_verify_helper.generate_verification_info()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="sdm", description="SDM token verification and analysis")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
+
+    verify = commands.add_parser("verify", help="verify the token's source on Arbiscan")
+    mode = verify.add_mutually_exclusive_group()
+    mode.add_argument("--template", action="store_true", help="try the ERC20 template instead of BurnMintERC677")
+    mode.add_argument("--manifest", metavar="PATH", help="verify every contract in a deployment manifest")
+    verify.set_defaults(handler=cmd_verify)
+
+    analyze = commands.add_parser("analyze", help="token analysis report; other options go to the underlying script")
+    source = analyze.add_mutually_exclusive_group()
+    source.add_argument("--quicknode", action="store_true", help="enhanced report (quicknode_verify.py)")
+    source.add_argument("--extra", action="store_true", help="holders, transfers and risk summary (token_analysis.py)")
+    analyze.set_defaults(handler=cmd_analyze)
+
+    holders = commands.add_parser("holders", help="largest holders, replayed from Transfer logs")
+    holders.add_argument("--cached", action="store_true", help="use the local event index as is, without network")
+    holders.add_argument("--top", type=int, default=10, help="number of holders to list (default: 10)")
+    holders.add_argument("--db", metavar="PATH", help="event index database (default: EVENT_INDEX_DB)")
+    holders.set_defaults(handler=cmd_holders)
+
+    bytecode = commands.add_parser("bytecode", help="disassembly summary and compiler metadata of deployed code")
+    target = bytecode.add_mutually_exclusive_group()
+    target.add_argument("--address", default=TOKEN_ADDRESS, help="contract to inspect (default: SDM)")
+    target.add_argument("--code-file", metavar="PATH", help="analyze saved runtime bytecode (hex) without network")
+    bytecode.set_defaults(handler=cmd_bytecode)
+
+    manual = commands.add_parser("manual", help="print everything needed for manual verification on Arbiscan")
+    manual.set_defaults(handler=cmd_manual)
+    return parser
+
+
+def main(argv=None) -> int:
+    args, extra = build_parser().parse_known_args(argv)
+    if extra and args.command in ("holders", "bytecode"):
+        raise SystemExit(f"sdm {args.command}: unrecognized arguments: {' '.join(extra)}")
+    from dotenv import load_dotenv
+    load_dotenv()
+    return args.handler(args, extra)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+In-process Solidity flattener
+Resolves imports through remappings.txt and foundry.toml and lays files out the way `forge flatten` does, cached by source hashes
+
+Usage: python sol_flatten.py src/tokens/BurnMintERC677.sol [-o BurnMintERC677_flattened.sol]
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import tempfile
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: foundry.toml remappings are skipped, remappings.txt still applies
+    tomllib = None
+
+FLATTEN_CACHE = os.getenv('FLATTEN_CACHE', 'sdm_flatten_cache.json')
+
+# Files whose changes alter import resolution even when no source changed
+CONFIG_FILES = ("remappings.txt", "foundry.toml")
+
+# Comments and string literals, so directives inside them are never matched
+_OPAQUE = re.compile(r'//[^\n]*|/\*.*?\*/|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'', re.S)
+_DIRECTIVE = re.compile(r'\b(import|pragma)\b[^;]*;')
+_IMPORT_PATH = re.compile(r'["\']([^"\']+)["\']')
+_LICENSE = re.compile(r'//\s*SPDX-License-Identifier:\s*([^\n]*?)\s*(?:\n|$)')
+_BLANK_LINES = re.compile(r'\n[ \t]*\n(?:[ \t]*\n)+')
+
+
+def _sha256(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def load_remappings(root: str) -> List[Tuple[str, str, str]]:
+    """(context, prefix, target) from remappings.txt and foundry.toml; remappings.txt wins on conflicts."""
+    lines = []
+    toml_path = os.path.join(root, "foundry.toml")
+    if tomllib is not None and os.path.exists(toml_path):
+        with open(toml_path, "rb") as f:
+            lines += tomllib.load(f).get("profile", {}).get("default", {}).get("remappings", [])
+    txt_path = os.path.join(root, "remappings.txt")
+    if os.path.exists(txt_path):
+        with open(txt_path) as f:
+            lines += [line.strip() for line in f]
+
+    remappings = {}
+    for line in lines:
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        left, target = line.split("=", 1)
+        context, _, prefix = left.rpartition(":")
+        remappings[(context, prefix)] = target
+    return [(context, prefix, target) for (context, prefix), target in remappings.items()]
+
+
+def _lib_dirs(root: str) -> List[str]:
+    toml_path = os.path.join(root, "foundry.toml")
+    if tomllib is not None and os.path.exists(toml_path):
+        with open(toml_path, "rb") as f:
+            return tomllib.load(f).get("profile", {}).get("default", {}).get("libs", ["lib"])
+    return ["lib"]
+
+
+def resolve_import(path: str, importer: str, root: str, remappings: List[Tuple[str, str, str]],
+                   libs: List[str]) -> str:
+    """Project-relative path of an import; raises FileNotFoundError if it resolves to nothing."""
+    if path.startswith("."):
+        resolved = os.path.normpath(os.path.join(os.path.dirname(importer), path))
+    else:
+        # Longest matching prefix wins, and a remapping scoped to the importer beats a global one
+        applicable = [(len(context), len(prefix), prefix, target) for context, prefix, target in remappings
+                      if path.startswith(prefix) and importer.startswith(context)]
+        if applicable:
+            _, _, prefix, target = max(applicable)
+            resolved = os.path.normpath(target + path[len(prefix):])
+        else:
+            resolved = os.path.normpath(path)
+            if not os.path.exists(os.path.join(root, resolved)):
+                for lib in libs:
+                    if os.path.exists(os.path.join(root, lib, path)):
+                        resolved = os.path.normpath(os.path.join(lib, path))
+                        break
+    resolved = resolved.replace(os.sep, "/")
+    if not os.path.isfile(os.path.join(root, resolved)):
+        raise FileNotFoundError(f"Cannot resolve import {path!r} in {importer}")
+    return resolved
+
+
+def parse_source(text: str) -> Dict[str, Any]:
+    """Split a source file into its imports, pragmas, license and the code that remains once they are removed."""
+    # Comments keep their opening "//" or "/*", strings their quotes; everything inside is blanked
+    masked = _OPAQUE.sub(lambda m: m.group(0)[:2] + " " * (len(m.group(0)) - 2) if m.group(0)[0] == "/"
+                         else m.group(0)[0] + " " * (len(m.group(0)) - 2) + m.group(0)[-1], text)
+    imports, pragmas, removals = [], [], []
+    for match in _DIRECTIVE.finditer(masked):
+        directive = text[match.start():match.end()]
+        if match.group(1) == "import":
+            imports.append(_IMPORT_PATH.search(directive).group(1))
+        else:
+            pragmas.append(" ".join(directive[len("pragma"):-1].split()))
+        removals.append((match.start(), match.end()))
+
+    license_match = _LICENSE.search(text)
+    if license_match and masked[license_match.start():license_match.start() + 2] == "//":
+        removals.append((license_match.start(), license_match.end() - 1 if text[license_match.end() - 1] == "\n"
+                         else license_match.end()))
+
+    body, last = [], 0
+    for start, end in sorted(removals):
+        body.append(text[last:start])
+        last = end
+    body.append(text[last:])
+    return {
+        "imports": imports,
+        "pragmas": pragmas,
+        "license": license_match.group(1) if license_match else None,
+        "body": _BLANK_LINES.sub("\n\n", "".join(body)).strip(),
+    }
+
+
+def ordered_files(target: str, graph: Dict[str, List[str]]) -> List[str]:
+    """Every file target depends on (and target itself), ordered like forge flatten.
+
+    Files with fewer transitive dependencies come first, then by file name,
+    then by full path, so each file follows everything it needs.
+    """
+    closure: Dict[str, set] = {}
+
+    def dependencies(path, stack=()):
+        if path not in closure:
+            found = set()
+            for dependency in graph[path]:
+                if dependency != path and dependency not in stack:
+                    found.add(dependency)
+                    found |= dependencies(dependency, stack + (path,))
+            closure[path] = found
+        return closure[path]
+
+    files = dependencies(target) | {target}
+    return sorted(files, key=lambda path: (len(dependencies(path)), os.path.basename(path), path))
+
+
+def _render(files: List[str], parsed: Dict[str, Dict[str, Any]]) -> str:
+    licenses, versions, other_pragmas = [], [], []
+    for path in files:
+        source = parsed[path]
+        if source["license"] and source["license"] not in licenses:
+            licenses.append(source["license"])
+        for pragma in source["pragmas"]:
+            if pragma.startswith("solidity "):
+                version = pragma[len("solidity "):]
+                if version not in versions:
+                    versions.append(version)
+            elif pragma not in other_pragmas:
+                other_pragmas.append(pragma)
+
+    header = ""
+    if licenses:
+        header += f"// SPDX-License-Identifier: {' AND '.join(licenses)}\n"
+    if versions:
+        header += f"pragma solidity {' '.join(versions)};\n"
+    for pragma in other_pragmas:
+        header += f"pragma {pragma};\n"
+    return header + "".join(f"\n// {path}\n\n{parsed[path]['body']}\n" for path in files) + "\n"
+
+
+class _Cache:
+    """JSON file of parsed sources (keyed by content hash) and flattened outputs (keyed by target)."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.data = {"sources": {}, "outputs": {}}
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.data = json.load(f)
+            except (OSError, ValueError):
+                pass
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(self.data, f)
+        os.replace(tmp, self.path)
+
+
+def _stamp(path: str) -> List[int]:
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _fresh_output(entry: Dict[str, Any], root: str) -> Tuple[bool, bool]:
+    """(fresh, restamped): fresh if no file behind a cached output changed.
+
+    Files whose mtime moved are re-hashed before giving up; restamped says
+    whether any of them turned out unchanged and got a new stamp.
+    """
+    restamped = False
+    for path, (stamp, digest) in entry["files"].items():
+        full = os.path.join(root, path)
+        if not os.path.exists(full):
+            if digest is None:
+                continue
+            return False, restamped
+        if digest is None:
+            return False, restamped
+        if _stamp(full) != stamp:
+            if _sha256(full) != digest:
+                return False, restamped
+            entry["files"][path][0] = _stamp(full)
+            restamped = True
+    return True, restamped
+
+
+def flatten(target: str, root: Optional[str] = None, cache_path: Optional[str] = FLATTEN_CACHE) -> str:
+    """Flatten target (a path relative to root) into a single source file.
+
+    With a cache, an unchanged tree is answered after stat-ing each file, and
+    only changed files are re-parsed.
+    """
+    root = os.path.abspath(root or os.getcwd())
+    target = os.path.relpath(os.path.join(root, target), root).replace(os.sep, "/")
+    if cache_path and not os.path.isabs(cache_path):
+        cache_path = os.path.join(root, cache_path)
+    cache = _Cache(cache_path)
+
+    entry = cache.data["outputs"].get(target)
+    if entry:
+        fresh, restamped = _fresh_output(entry, root)
+        if fresh:
+            if restamped:
+                cache.save()
+            return entry["output"]
+
+    remappings = load_remappings(root)
+    libs = _lib_dirs(root)
+    parsed: Dict[str, Dict[str, Any]] = {}
+    graph: Dict[str, List[str]] = {}
+    files: Dict[str, Any] = {}
+    pending = [target]
+    while pending:
+        path = pending.pop()
+        if path in graph:
+            continue
+        full = os.path.join(root, path)
+        digest = _sha256(full)
+        files[path] = [_stamp(full), digest]
+        source = cache.data["sources"].get(digest)
+        if source is None:
+            with open(full, encoding="utf-8") as f:
+                source = parse_source(f.read())
+            cache.data["sources"][digest] = source
+        parsed[path] = source
+        graph[path] = [resolve_import(imported, path, root, remappings, libs) for imported in source["imports"]]
+        pending.extend(graph[path])
+
+    for name in CONFIG_FILES:
+        full = os.path.join(root, name)
+        files[name] = [_stamp(full), _sha256(full)] if os.path.exists(full) else [None, None]
+
+    output = _render(ordered_files(target, graph), parsed)
+    cache.data["outputs"][target] = {"files": files, "output": output}
+    # Parsed sources no longer referenced by any output would otherwise pile up
+    live = {digest for saved in cache.data["outputs"].values() for _, digest in saved["files"].values()}
+    cache.data["sources"] = {digest: source for digest, source in cache.data["sources"].items() if digest in live}
+    cache.save()
+    return output
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Flatten a Solidity file and its imports into one source")
+    parser.add_argument("target", help="path of the contract to flatten, relative to --root")
+    parser.add_argument("-o", "--output", help="write here instead of stdout")
+    parser.add_argument("--root", default=".", help="project root holding remappings.txt/foundry.toml")
+    args = parser.parse_args(argv)
+
+    try:
+        output = flatten(args.target, args.root)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+        print(f"✅ Flattened {args.target} into {args.output}")
+    else:
+        sys.stdout.write(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,67 +5,59 @@ Additional Token Analysis for SDM Token on Arbitrum
 
 import os
 import json
-import requests
-from web3 import Web3
-from datetime import datetime
-import time
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 
+from rpc_pool import pooled_web3
+from arbiscan_client import get_arbiscan_client
+from event_index import EventIndex
+from holder_ledger import HolderLedger
+from event_decoder import decode_logs
+from block_times import BlockTimes, daily_counts
+from log_scanner import TOKEN_CREATION_BLOCK
+
 # Load environment variables
 load_dotenv()
 
 # Configuration
-ARBITRUM_RPC = "https://arb1.arbitrum.io/rpc"
-ARBISCAN_API = "https://api.arbiscan.io/api"
 ARBISCAN_API_KEY = os.getenv('ARBISCAN_API_KEY')
 TOKEN_ADDRESS = "0x602b869eEf1C9F0487F31776bad8Af3C4A173394"
 
-if not ARBISCAN_API_KEY:
-    print("⚠️  Warning: ARBISCAN_API_KEY not found in environment variables.")
-    print("   Some features will be limited without an API key.")
-    print("   Copy .env.example to .env and add your API key.")
-
-# Initialize Web3
-w3 = Web3(Web3.HTTPProvider(ARBITRUM_RPC))
+def _read_uint(selector):
+    """Call a no-argument uint view function on the token."""
+    return int.from_bytes(pooled_web3().eth.call({"to": TOKEN_ADDRESS, "data": selector}), "big")
 
 def get_token_holders():
-    """Get top token holders from Arbiscan."""
+    """Get every token holder by replaying the Transfer history from the local event index."""
     print("📊 Fetching Token Holder Information...")
     print("-" * 50)
     
-    params = {
-        "module": "token",
-        "action": "tokenholderlist",
-        "contractaddress": TOKEN_ADDRESS,
-        "page": "1",
-        "offset": "20",
-        "apikey": ARBISCAN_API_KEY
-    }
-    
     try:
-        response = requests.get(ARBISCAN_API, params=params, timeout=10)
-        data = response.json()
+        index = EventIndex()
+        index.sync()
+        ledger = HolderLedger.from_index(index, to_block=index.checkpoint())
         
-        if data["status"] == "1" and data["result"]:
-            holders = data["result"]
-            print(f"Total holders found: {len(holders)}")
-            print("\nTop 10 Holders:")
-            print("-" * 50)
-            
-            total_supply = 4000000000 * 10**18  # 4B tokens with 18 decimals
-            
-            for i, holder in enumerate(holders[:10], 1):
-                balance = int(holder["TokenHolderQuantity"])
-                percentage = (balance / total_supply) * 100
-                readable_balance = balance / 10**18
-                
-                print(f"{i}. {holder['TokenHolderAddress']}")
-                print(f"   Balance: {readable_balance:,.2f} SDM ({percentage:.2f}%)")
-            
-            return holders
-        else:
+        if not ledger.balances:
             print("No holder data available yet")
             return []
+        
+        # Percentages use the live supply rather than a hard-coded one
+        total_supply = _read_uint("0x18160ddd")  # totalSupply()
+        decimals = _read_uint("0x313ce567")      # decimals()
+        
+        print(f"Total holders found: {ledger.holder_count:,} (from {ledger.transfer_count:,} transfers)")
+        if ledger.circulating != total_supply:
+            print(f"⚠️  Ledger sums to {ledger.circulating / 10**decimals:,.2f} SDM but totalSupply is "
+                  f"{total_supply / 10**decimals:,.2f} SDM (index may be behind head)")
+        print("\nTop 10 Holders:")
+        print("-" * 50)
+        
+        holders = ledger.top(ledger.holder_count, total_supply)
+        for i, holder in enumerate(holders[:10], 1):
+            print(f"{i}. {holder['address']}")
+            print(f"   Balance: {holder['balance'] / 10**decimals:,.2f} SDM ({holder['percentage']:.2f}%)")
+        
+        return holders
             
     except Exception as e:
         print(f"Error fetching holders: {e}")
@@ -76,19 +68,8 @@ def get_token_transfers():
     print("\n📤 Recent Token Transfers")
     print("-" * 50)
     
-    params = {
-        "module": "account",
-        "action": "tokentx",
-        "contractaddress": TOKEN_ADDRESS,
-        "page": "1",
-        "offset": "20",
-        "sort": "desc",
-        "apikey": ARBISCAN_API_KEY
-    }
-    
     try:
-        response = requests.get(ARBISCAN_API, params=params, timeout=10)
-        data = response.json()
+        data = get_arbiscan_client().tokentx(TOKEN_ADDRESS, page=1, offset=20, sort="desc")
         
         if data["status"] == "1" and data["result"]:
             transfers = data["result"]
@@ -139,52 +120,39 @@ def check_liquidity_pools():
     print(f"• DexScreener: https://dexscreener.com/arbitrum/{TOKEN_ADDRESS}")
 
 def get_contract_events():
-    """Get recent contract events."""
+    """Summarize contract events from the local event index, syncing new blocks first."""
     print("\n📝 Recent Contract Events")
     print("-" * 50)
     
-    params = {
-        "module": "logs",
-        "action": "getLogs",
-        "address": TOKEN_ADDRESS,
-        "fromBlock": "0",
-        "toBlock": "latest",
-        "page": "1",
-        "offset": "10",
-        "apikey": ARBISCAN_API_KEY
-    }
-    
     try:
-        response = requests.get(ARBISCAN_API, params=params, timeout=10)
-        data = response.json()
+        index = EventIndex()
+        index.sync()
         
-        if data["status"] == "1" and data["result"]:
-            events = data["result"]
-            print(f"Found {len(events)} recent events")
-            
-            # Count event types
-            transfer_events = 0
-            approval_events = 0
-            other_events = 0
-            
-            for event in events:
-                if len(event["topics"]) > 0:
-                    topic = event["topics"][0]
-                    if topic == "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef":
-                        transfer_events += 1
-                    elif topic == "0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925":
-                        approval_events += 1
-                    else:
-                        other_events += 1
-            
-            print(f"• Transfer events: {transfer_events}")
-            print(f"• Approval events: {approval_events}")
-            print(f"• Other events: {other_events}")
-            
-            return events
-        else:
+        counts = index.count_by_event()
+        if not counts:
             print("No event data available")
             return []
+        
+        print(f"Indexed {sum(counts.values()):,} events up to block {index.checkpoint():,}")
+        for event_name, count in counts.items():
+            print(f"• {event_name} events: {count:,}")
+        
+        events = decode_logs(index.logs(limit=10, newest_first=True), include_unknown=True)
+        print("\nLatest events:")
+        for event in events:
+            args = ", ".join(f"{name}={value}" for name, value in event["args"].items())
+            print(f"• Block {event['blockNumber']}: {event['event']}({args})")
+        
+        # Find the block at the start of the window, then bucket indexed Transfers by UTC day
+        block_times = BlockTimes()
+        since = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=6)
+        start_block = block_times.block_at(int(since.timestamp()), low=TOKEN_CREATION_BLOCK, high=index.checkpoint())
+        transfers = index.logs("Transfer", start_block + 1, index.checkpoint())
+        print("\nTransfers per day (last 7 days, UTC):")
+        for day, count in daily_counts(block_times, (log["blockNumber"] for log in transfers)).items():
+            print(f"• {day}: {count:,}")
+        
+        return events
             
     except Exception as e:
         print(f"Error fetching events: {e}")
@@ -210,9 +178,9 @@ def analyze_token_security():
     print(f"✓ Owner Address: 0xC5D133296E17BA25DF0409a6C31607bf3B78e3e3")
     print("  → Owner has NOT been renounced")
     
-    # Token age
-    creation_date = datetime(2025, 7, 29, 5, 26, 31)
-    age_days = (datetime.now() - creation_date).days
+    # Token age from the creation block's timestamp
+    creation_date = datetime.fromtimestamp(BlockTimes().timestamp(TOKEN_CREATION_BLOCK), tz=timezone.utc)
+    age_days = (datetime.now(timezone.utc) - creation_date).days
     print(f"✓ Token Age: {age_days} days")
     
     if age_days < 7:
@@ -263,23 +231,25 @@ RECOMMENDATIONS:
 """)
 
 def main():
+    if not ARBISCAN_API_KEY:
+        print("⚠️  Warning: ARBISCAN_API_KEY not found in environment variables.")
+        print("   Some features will be limited without an API key.")
+        print("   Copy .env.example to .env and add your API key.")
+    
     print("🔍 Advanced Token Analysis for SDM on Arbitrum")
     print("=" * 60)
     print(f"Starting analysis at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
     # Run analyses
+    # Arbiscan calls are paced by the shared client's rate limiter
     holders = get_token_holders()
-    time.sleep(1)  # Rate limiting
     
     transfers = get_token_transfers()
-    time.sleep(1)
     
     check_liquidity_pools()
-    time.sleep(1)
     
     events = get_contract_events()
-    time.sleep(1)
     
     security = analyze_token_security()
     
@@ -299,6 +269,7 @@ def main():
         json.dump(analysis_data, f, indent=2)
     
     print(f"\n📊 Analysis saved to: {filename}")
+    get_arbiscan_client().print_timing()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,82 +4,125 @@ Verification script for BurnMintERC677 token on Arbitrum
 """
 
 import json
-import requests
-import time
-import subprocess
 import os
 from dotenv import load_dotenv
 
+from web3 import Web3
+
+from rpc_pool import pooled_web3
+from arbiscan_client import get_arbiscan_client
+from cbor_metadata import decode_metadata, arbiscan_compiler_version
+from bytecode_match import SearchUnavailable, search, describe, arbiscan_params, creation_code
+from constructor_args import ConstructorArgs, constructor_types, format_values
+from verify_poller import VerificationPoller
+from sol_flatten import flatten
+
 # Load environment variables
 load_dotenv()
 
 # Configuration
-ARBISCAN_API = "https://api.arbiscan.io/api"
 ARBISCAN_API_KEY = os.getenv('ARBISCAN_API_KEY')
 TOKEN_ADDRESS = "0x602b869eEf1C9F0487F31776bad8Af3C4A173394"
+SOURCE_FILE = "BurnMintERC677_flattened.sol"
+CONTRACT_NAME = "BurnMintERC677"
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 
-if not ARBISCAN_API_KEY:
-    print("⚠️  Error: ARBISCAN_API_KEY not found in environment variables.")
-    print("   Please set it in your .env file or as an environment variable.")
-    print("   Copy .env.example to .env and add your API key.")
-    exit(1)
+# Compiler from foundry.toml, only assumed when the deployed code's metadata has no solc version
+DEFAULT_SOLC_VERSION = "0.8.19"
 
 def flatten_contract():
     """Flatten the BurnMintERC677 contract."""
     print("📝 Flattening contract...")
     try:
-        # Use forge flatten to get the complete source code
-        result = subprocess.run(
-            ["forge", "flatten", "src/tokens/BurnMintERC677.sol"],
-            capture_output=True,
-            text=True,
-            cwd="/workspace"
-        )
-        
-        if result.returncode == 0:
-            flattened = result.stdout
-            # Save flattened contract
-            with open("/workspace/BurnMintERC677_flattened.sol", "w") as f:
-                f.write(flattened)
-            print("✅ Contract flattened successfully")
-            return flattened
-        else:
-            print(f"❌ Error flattening: {result.stderr}")
-            return None
+        flattened = flatten("src/tokens/BurnMintERC677.sol", root=PROJECT_ROOT)
+        # Save flattened contract
+        with open(os.path.join(PROJECT_ROOT, SOURCE_FILE), "w") as f:
+            f.write(flattened)
+        print("✅ Contract flattened successfully")
+        return flattened
+    except Exception as e:
+        print(f"❌ Error flattening: {e}")
+        return None
+
+def find_matching_settings(source_code):
+    """Compile the source locally across compiler settings and return the match for the deployed code.
+    
+    Returns (searched, match, metadata): searched is False when no local solc could
+    be used; metadata is the deployed code's decoded CBOR metadata, or None.
+    """
+    print("\n🔬 Searching compiler settings locally...")
+    try:
+        code = pooled_web3().eth.get_code(Web3.to_checksum_address(TOKEN_ADDRESS))
+    except Exception as e:
+        print(f"⚠️  Could not read deployed bytecode: {e}")
+        return False, None, None
+    metadata = decode_metadata(code)
+    versions = [metadata["solc"]] if metadata and metadata["solc"] else [DEFAULT_SOLC_VERSION]
+    try:
+        return True, search(code, {SOURCE_FILE: source_code}, SOURCE_FILE, CONTRACT_NAME, versions), metadata
+    except SearchUnavailable as e:
+        print(f"⚠️  {e}, falling back to the foundry.toml settings")
+        return False, None, metadata
+
+def derive_constructor_args(match):
+    """Read the constructor arguments back from the creation transaction.
+    
+    With a local match the compiled init code marks where they start; otherwise
+    they are located after the runtime code's metadata.
+    """
+    print("\n🔨 Deriving constructor arguments from the creation transaction...")
+    try:
+        init_code = creation_code(match, SOURCE_FILE, CONTRACT_NAME) if match else None
+        constructor = ConstructorArgs().derive(TOKEN_ADDRESS, constructor_types(contract_name=CONTRACT_NAME), init_code)
     except Exception as e:
-        print(f"❌ Error: {e}")
+        print(f"❌ Could not derive constructor arguments: {e}")
         return None
+    print(f"✅ From tx {constructor['tx_hash']}:")
+    for value in format_values(constructor["types"], constructor["values"]):
+        print(f"   • {value}")
+    return constructor["hex"]
 
 def verify_contract(source_code):
     """Submit contract for verification."""
-    print("\n📤 Submitting contract for verification...")
+    searched, match, metadata = find_matching_settings(source_code)
+    if searched and match is None:
+        print("❌ No compiler settings reproduce the deployed bytecode, not submitting")
+        return None
+    
+    constructor_args = derive_constructor_args(match)
+    if constructor_args is None:
+        return None
     
-    # Constructor arguments (ABI encoded)
-    # constructor(string memory name_, string memory symbol_, address initialAccount)
-    # name: "Diamondz Shadow Game + Movies"
-    # symbol: "SDM"
-    # initialAccount: 0x18b2b2ce7d05bfe0883ff874ba0c536a89d07363 (received initial mint)
-    constructor_args = "000000000000000000000000000000000000000000000000000000000000006000000000000000000000000000000000000000000000000000000000000000a000000000000000000000000018b2b2ce7d05bfe0883ff874ba0c536a89d07363000000000000000000000000000000000000000000000000000000000000001d4469616d6f6e647a20536861646f772047616d65202b204d6f766965730000000000000000000000000000000000000000000000000000000000000000000003534d0000000000000000000000000000000000000000000000000000000000"
+    if match:
+        print(f"✅ Local {match['match']} match: {describe(match)}")
+        params = arbiscan_params(match, TOKEN_ADDRESS, SOURCE_FILE, CONTRACT_NAME,
+                                 arbiscan_compiler_version(match["version"]), constructor_args)
+    else:
+        # No local check: the compiler comes from the deployed code's metadata, the rest from foundry.toml
+        from_metadata = bool(metadata and metadata["solc"])
+        version = metadata["solc"] if from_metadata else DEFAULT_SOLC_VERSION
+        compiler_version = arbiscan_compiler_version(version)
+        if compiler_version is None:
+            print(f"❌ Could not resolve the solc {version} build, not submitting")
+            return None
+        print(f"📋 Compiler {compiler_version} ({'from the deployed metadata' if from_metadata else 'foundry.toml default'})")
+        params = {
+            "contractaddress": TOKEN_ADDRESS,
+            "sourceCode": source_code,
+            "codeformat": "solidity-single-file",
+            "contractname": "BurnMintERC677",
+            "compilerversion": compiler_version,
+            "optimizationUsed": "1",
+            "runs": "10000",
+            "constructorArguements": constructor_args,  # Note: Arbiscan uses this spelling
+            "evmversion": "",  # Compiler default (paris for 0.8.19)
+            "licenseType": "3",  # MIT
+        }
     
-    params = {
-        "module": "contract",
-        "action": "verifysourcecode",
-        "contractaddress": TOKEN_ADDRESS,
-        "sourceCode": source_code,
-        "codeformat": "solidity-single-file",
-        "contractname": "BurnMintERC677",
-        "compilerversion": "v0.8.19+commit.7dd6d404",
-        "optimizationUsed": "1",
-        "runs": "10000",
-        "constructorArguements": constructor_args,  # Note: Arbiscan uses this spelling
-        "evmversion": "paris",  # Default for 0.8.19
-        "licenseType": "3",  # MIT
-        "apikey": ARBISCAN_API_KEY
-    }
+    print("\n📤 Submitting contract for verification...")
     
     try:
-        response = requests.post(ARBISCAN_API, data=params, timeout=60)
-        data = response.json()
+        data = get_arbiscan_client().verifysourcecode(timeout=60, **params)
         
         if data.get("status") == "1":
             guid = data["result"]
@@ -107,40 +150,23 @@ def check_verification_status(guid):
         
     print(f"\n🔍 Checking verification status...")
     
-    params = {
-        "module": "contract",
-        "action": "checkverifystatus",
-        "guid": guid,
-        "apikey": ARBISCAN_API_KEY
-    }
-    
-    max_attempts = 10
-    for attempt in range(max_attempts):
-        try:
-            time.sleep(3)  # Wait between checks
-            response = requests.get(ARBISCAN_API, params=params, timeout=10)
-            data = response.json()
-            
-            status = data.get("status", "0")
-            result = data.get("result", "")
-            
-            if status == "1":
-                print(f"✅ Verification SUCCESSFUL!")
-                return True
-            elif "pending" in result.lower():
-                print(f"⏳ Verification pending... (attempt {attempt + 1}/{max_attempts})")
-            elif "fail" in result.lower():
-                print(f"❌ Verification failed: {result}")
-                return False
-            else:
-                print(f"Status: {result}")
-                
-        except Exception as e:
-            print(f"Error checking status: {e}")
-    
+    outcome = VerificationPoller().wait(guid)
+    if outcome["state"] == "pass":
+        print(f"✅ Verification SUCCESSFUL! ({outcome['attempts']} checks, {outcome['elapsed']:.0f}s)")
+        return True
+    if outcome["state"] == "timeout":
+        print(f"⏱️  Verification still pending after {outcome['elapsed']:.0f}s")
+    else:
+        print(f"❌ Verification failed: {outcome['result']}")
     return False
 
 def main():
+    if not ARBISCAN_API_KEY:
+        print("⚠️  Error: ARBISCAN_API_KEY not found in environment variables.")
+        print("   Please set it in your .env file or as an environment variable.")
+        print("   Copy .env.example to .env and add your API key.")
+        return 1
+    
     print("🚀 BurnMintERC677 Contract Verification")
     print("=" * 60)
     print(f"Contract: {TOKEN_ADDRESS}")
@@ -149,16 +175,8 @@ def main():
     
     # Check if already verified
     print("\n🔍 Checking current verification status...")
-    params = {
-        "module": "contract",
-        "action": "getsourcecode",
-        "address": TOKEN_ADDRESS,
-        "apikey": ARBISCAN_API_KEY
-    }
-    
     try:
-        response = requests.get(ARBISCAN_API, params=params, timeout=10)
-        data = response.json()
+        data = get_arbiscan_client().getsourcecode(TOKEN_ADDRESS)
         
         if data["status"] == "1" and data["result"]:
             source = data["result"][0]
@@ -202,4 +220,6 @@ def main():
         return 1
 
 if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    status = main()
+    get_arbiscan_client().print_timing()
+    exit(status)
\ No newline at end of file
@@ -6,45 +6,31 @@ Token: SDM (0x602b869eEf1C9F0487F31776bad8Af3C4A173394)
 
 import os
 import json
-import requests
-import time
 from web3 import Web3
 from datetime import datetime
 from dotenv import load_dotenv
 
+from rpc_pool import pooled_web3
+from arbiscan_client import get_arbiscan_client
+from cbor_metadata import decode_metadata, arbiscan_compiler_version
+from bytecode_match import SearchUnavailable, search, describe, arbiscan_params, creation_code
+from constructor_args import ConstructorArgs, types_from_source, format_values
+from verify_poller import VerificationPoller
+
 # Load environment variables
 load_dotenv()
 
 # Configuration
-ARBISCAN_API = "https://api.arbiscan.io/api"
 ARBISCAN_API_KEY = os.getenv('ARBISCAN_API_KEY')
 TOKEN_ADDRESS = "0x602b869eEf1C9F0487F31776bad8Af3C4A173394"
-ARBITRUM_RPC = "https://arb1.arbitrum.io/rpc"
-
-if not ARBISCAN_API_KEY:
-    print("⚠️  Error: ARBISCAN_API_KEY not found in environment variables.")
-    print("   Please set it in your .env file or as an environment variable.")
-    print("   Copy .env.example to .env and add your API key.")
-    exit(1)
-
-# Initialize Web3
-w3 = Web3(Web3.HTTPProvider(ARBITRUM_RPC))
 
 def get_contract_creation_info():
     """Get contract creation transaction details."""
     print("📋 Fetching Contract Creation Information...")
     print("-" * 60)
     
-    params = {
-        "module": "contract",
-        "action": "getcontractcreation",
-        "contractaddresses": TOKEN_ADDRESS,
-        "apikey": ARBISCAN_API_KEY
-    }
-    
     try:
-        response = requests.get(ARBISCAN_API, params=params, timeout=10)
-        data = response.json()
+        data = get_arbiscan_client().getcontractcreation(TOKEN_ADDRESS)
         
         if data["status"] == "1" and data["result"]:
             creation_info = data["result"][0]
@@ -67,16 +53,8 @@ def check_verification_status():
     print("\n🔍 Checking Current Verification Status...")
     print("-" * 60)
     
-    params = {
-        "module": "contract",
-        "action": "getsourcecode",
-        "address": TOKEN_ADDRESS,
-        "apikey": ARBISCAN_API_KEY
-    }
-    
     try:
-        response = requests.get(ARBISCAN_API, params=params, timeout=10)
-        data = response.json()
+        data = get_arbiscan_client().getsourcecode(TOKEN_ADDRESS)
         
         if data["status"] == "1" and data["result"]:
             source = data["result"][0]
@@ -300,12 +278,27 @@ contract DiamondzShadowGameMovies is ERC20, Ownable {
     
     return source_code
 
+def derive_constructor_args(source_code, match=None):
+    """Constructor arguments the deployment actually used, as hex; None if they can't be recovered."""
+    try:
+        init_code = creation_code(match, "DiamondzShadowGameMovies.sol", "DiamondzShadowGameMovies") if match else None
+        types = types_from_source(source_code, "DiamondzShadowGameMovies")
+        constructor = ConstructorArgs().derive(TOKEN_ADDRESS, types, init_code)
+    except Exception as e:
+        print(f"❌ Could not derive constructor arguments: {e}")
+        return None
+    if constructor["values"]:
+        print(f"✅ Constructor arguments from tx {constructor['tx_hash']}:")
+        for value in format_values(constructor["types"], constructor["values"]):
+            print(f"   • {value}")
+    return constructor["hex"]
+
 def submit_for_verification():
     """Submit contract for verification on Arbiscan."""
     print("\n📝 Preparing Verification Submission...")
     print("-" * 60)
     
-    # Common compiler versions to try
+    # Common compiler versions to try when the deployed code doesn't say which one was used
     compiler_versions = [
         "v0.8.20+commit.a1b79de6",
         "v0.8.19+commit.7dd6d404",
@@ -317,6 +310,23 @@ def submit_for_verification():
         "v0.8.0+commit.c7dfd78e"
     ]
     
+    # The metadata trailer of the deployed code names the exact compiler
+    try:
+        code = pooled_web3().eth.get_code(Web3.to_checksum_address(TOKEN_ADDRESS))
+    except Exception as e:
+        print(f"⚠️  Could not read deployed bytecode: {e}")
+        code = None
+    metadata = decode_metadata(code) if code else None
+    compiler = arbiscan_compiler_version(metadata["solc"]) if metadata and metadata["solc"] else None
+    if compiler:
+        print(f"✅ Deployed bytecode was compiled with {compiler}")
+        if metadata["ipfs"]:
+            print(f"   Metadata IPFS: {metadata['ipfs']}")
+        compiler_versions = [compiler]
+    else:
+        print("⚠️  No compiler version in the bytecode metadata, trying common versions")
+        compiler_versions = compiler_versions[:3]
+    
     source_code = prepare_standard_erc20_source()
     
     print("\n⚠️  IMPORTANT NOTICE:")
@@ -333,17 +343,36 @@ def submit_for_verification():
     print("• The compiler settings used")
     print()
     
+    # Reproduce the deployed code locally first so only settings that match are submitted
+    if code:
+        versions = [compiler.lstrip("v").split("+")[0] for compiler in compiler_versions]
+        try:
+            match = search(code, {"DiamondzShadowGameMovies.sol": source_code},
+                           "DiamondzShadowGameMovies.sol", "DiamondzShadowGameMovies", versions)
+        except SearchUnavailable as e:
+            print(f"⚠️  {e}, submitting without a local check")
+        else:
+            if match is None:
+                print("❌ No compiler settings reproduce the deployed bytecode from this source, not submitting")
+                return False
+            print(f"✅ Local {match['match']} match: {describe(match)}")
+            constructor_args = derive_constructor_args(source_code, match)
+            if constructor_args is None:
+                return False
+            params = arbiscan_params(match, TOKEN_ADDRESS, "DiamondzShadowGameMovies.sol", "DiamondzShadowGameMovies",
+                                     arbiscan_compiler_version(match["version"]), constructor_args)
+            return submit_and_check(params)
+    
+    constructor_args = derive_constructor_args(source_code)
+    if constructor_args is None:
+        return False
+    
     # Try to verify with standard settings
-    for i, compiler in enumerate(compiler_versions[:3]):  # Try first 3 versions
-        if i > 0:
-            print("⏳ Waiting 3 seconds to avoid rate limit...")
-            time.sleep(3)
-            
+    # Submissions are paced by the shared client's rate limiter
+    for compiler in compiler_versions:
         print(f"\n🔄 Attempting verification with compiler {compiler}...")
         
         params = {
-            "module": "contract",
-            "action": "verifysourcecode",
             "contractaddress": TOKEN_ADDRESS,
             "sourceCode": source_code,
             "codeformat": "solidity-single-file",
@@ -351,65 +380,47 @@ def submit_for_verification():
             "compilerversion": compiler,
             "optimizationUsed": "1",  # Try with optimization
             "runs": "200",  # Standard optimization runs
-            "constructorArguements": "",  # No constructor arguments for basic ERC20
+            "constructorArguements": constructor_args,  # Note: Arbiscan uses this spelling
             "evmversion": "london",  # Try london EVM version
             "licenseType": "3",  # MIT license
-            "apikey": ARBISCAN_API_KEY
         }
         
-        try:
-            response = requests.post(ARBISCAN_API, data=params, timeout=30)
-            data = response.json()
+        if submit_and_check(params):
+            return True
+    
+    return False
+
+def submit_and_check(params):
+    """Submit one set of verification parameters and wait for Arbiscan's verdict."""
+    try:
+        data = get_arbiscan_client().verifysourcecode(timeout=30, **params)
+        
+        if data["status"] == "1":
+            guid = data["result"]
+            print(f"✅ Verification submitted! GUID: {guid}")
             
-            if data["status"] == "1":
-                guid = data["result"]
-                print(f"✅ Verification submitted! GUID: {guid}")
-                
-                # Check verification result
-                time.sleep(5)  # Wait for processing
-                check_result = check_verification_result(guid)
-                if check_result:
-                    return True
-            else:
-                print(f"❌ Submission failed: {data.get('result', 'Unknown error')}")
-                
-        except Exception as e:
-            print(f"Error submitting: {e}")
+            # Check verification result
+            return check_verification_result(guid)
+        else:
+            print(f"❌ Submission failed: {data.get('result', 'Unknown error')}")
+            
+    except Exception as e:
+        print(f"Error submitting: {e}")
     
     return False
 
 def check_verification_result(guid):
-    """Check the result of a verification submission."""
+    """Wait for the result of a verification submission, backing off between checks."""
     print(f"\n🔍 Checking verification result for GUID: {guid}")
     
-    params = {
-        "module": "contract",
-        "action": "checkverifystatus",
-        "guid": guid,
-        "apikey": ARBISCAN_API_KEY
-    }
-    
-    max_attempts = 6
-    for attempt in range(max_attempts):
-        try:
-            response = requests.get(ARBISCAN_API, params=params, timeout=10)
-            data = response.json()
-            
-            if data["status"] == "1":
-                print(f"✅ Verification SUCCESSFUL!")
-                return True
-            elif "Pending" in data.get("result", ""):
-                print(f"⏳ Verification pending... (attempt {attempt + 1}/{max_attempts})")
-                time.sleep(5)
-            else:
-                print(f"❌ Verification failed: {data.get('result', 'Unknown error')}")
-                return False
-                
-        except Exception as e:
-            print(f"Error checking result: {e}")
-            
-        time.sleep(5)
-    
+    outcome = VerificationPoller().wait(guid)
+    if outcome["state"] == "pass":
+        print(f"✅ Verification SUCCESSFUL!")
+        return True
+    if outcome["state"] == "timeout":
+        print(f"⏱️  Verification still pending after {outcome['elapsed']:.0f}s")
+    else:
+        print(f"❌ Verification failed: {outcome['result'] or 'Unknown error'}")
     return False
 
 def provide_manual_verification_guide():
@@ -443,8 +454,8 @@ def provide_manual_verification_guide():
     print("   • Contract name must match exactly")
     print()
     print("5. Constructor Arguments:")
-    print("   • If your contract had constructor parameters,")
-    print("     encode them using https://abi.hashex.org/")
+    print("   • Run manual_verify_helper.py: it reads them back from the")
+    print("     creation transaction and prints the ABI-encoded value")
     print()
     print("6. Libraries:")
     print("   • Add any library addresses if used")
@@ -477,6 +488,12 @@ def provide_manual_verification_guide():
     print("=" * 70)
 
 def main():
+    if not ARBISCAN_API_KEY:
+        print("⚠️  Error: ARBISCAN_API_KEY not found in environment variables.")
+        print("   Please set it in your .env file or as an environment variable.")
+        print("   Copy .env.example to .env and add your API key.")
+        return 1
+    
     print("🚀 Arbiscan Contract Verification Tool")
     print("=" * 70)
     print(f"Token: SDM")
@@ -530,4 +547,6 @@ def main():
         print("• Contract has custom modifications or imports")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    status = main()
+    get_arbiscan_client().print_timing()
+    exit(status or 0)
\ No newline at end of file
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Concurrent Arbiscan verification status poller
+Tracks many submission GUIDs at once with jittered exponential backoff and reports each as soon as it settles
+"""
+
+import time
+import heapq
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, Optional
+
+from arbiscan_client import ArbiscanClient, get_arbiscan_client
+
+# Arbiscan usually needs a few seconds before a submission leaves the queue
+DEFAULT_INITIAL_DELAY = 3.0
+DEFAULT_MAX_DELAY = 30.0
+DEFAULT_MULTIPLIER = 1.6
+DEFAULT_JITTER = 0.25
+DEFAULT_TIMEOUT = 600.0
+
+# Status checks in flight at once; the client's rate limiter still paces the actual calls
+DEFAULT_WORKERS = 4
+
+
+def verification_state(data: Dict[str, Any]) -> str:
+    """Classify a checkverifystatus response as "pass", "pending" or "fail"."""
+    result = str(data.get("result", ""))
+    lowered = result.lower()
+    if data.get("status") == "1" or "already verified" in lowered:
+        return "pass"
+    if "pending" in lowered or "queue" in lowered:
+        return "pending"
+    return "fail"
+
+
+class VerificationPoller:
+    """Poll many verification GUIDs, backing off per GUID until each reaches a terminal state."""
+
+    def __init__(self, client: Optional[ArbiscanClient] = None, initial_delay: float = DEFAULT_INITIAL_DELAY,
+                 max_delay: float = DEFAULT_MAX_DELAY, multiplier: float = DEFAULT_MULTIPLIER,
+                 jitter: float = DEFAULT_JITTER, timeout: float = DEFAULT_TIMEOUT,
+                 max_workers: int = DEFAULT_WORKERS, verbose: bool = True):
+        self.client = client or get_arbiscan_client()
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.verbose = verbose
+
+    def _jittered(self, delay: float) -> float:
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _check(self, guid: str) -> Dict[str, Any]:
+        try:
+            return self.client.checkverifystatus(guid)
+        except Exception as e:
+            # Transport errors are retried like a pending answer
+            return {"status": "0", "result": f"Pending (request failed: {e})"}
+
+    def poll(self, guids: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Yield {"guid", "state", "result", "attempts", "elapsed"} for each GUID as soon as it settles.
+
+        state is "pass", "fail" or "timeout".
+        """
+        start = time.monotonic()
+        attempts: Dict[str, int] = {}
+        delays: Dict[str, float] = {}
+        schedule = []
+        for guid in dict.fromkeys(guids):
+            attempts[guid] = 0
+            delays[guid] = self.initial_delay
+            heapq.heappush(schedule, (start + self._jittered(self.initial_delay), guid))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while schedule:
+                wait = schedule[0][0] - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                now = time.monotonic()
+                due = []
+                while schedule and schedule[0][0] <= now:
+                    due.append(heapq.heappop(schedule)[1])
+
+                for guid, data in zip(due, executor.map(self._check, due)):
+                    attempts[guid] += 1
+                    state = verification_state(data)
+                    elapsed = time.monotonic() - start
+                    if state == "pending" and elapsed >= self.timeout:
+                        state = "timeout"
+                    if state != "pending":
+                        yield {"guid": guid, "state": state, "result": data.get("result", ""),
+                               "attempts": attempts[guid], "elapsed": elapsed}
+                        continue
+                    if self.verbose:
+                        print(f"⏳ Verification pending... ({guid[:12]}…, attempt {attempts[guid]})")
+                    delays[guid] = min(self.max_delay, delays[guid] * self.multiplier)
+                    heapq.heappush(schedule, (time.monotonic() + self._jittered(delays[guid]), guid))
+
+    def wait(self, guid: str) -> Dict[str, Any]:
+        """Poll a single GUID until it settles."""
+        return next(self.poll([guid]))
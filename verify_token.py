@@ -6,30 +6,29 @@ Mint Transaction: 0x1061de9e96b65cc62fabc748d972fefcf7cfc7fc9c518464855ac9744ef7
 """
 
 import os
+import sys
 import json
-import requests
-from web3 import Web3
-from datetime import datetime
-from typing import Dict, Any, Optional
+import asyncio
+import argparse
+from hexbytes import HexBytes
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Tuple, Callable, Awaitable
 from dotenv import load_dotenv
 
+from rpc_pool import RPCPool, get_rpc_pool, pooled_web3, pooled_async_web3
+from arbiscan_client import ArbiscanClient, get_arbiscan_client
+from event_decoder import decode_log, to_checksum_address, ZERO_ADDRESS
+from event_index import EventIndex
+from bulk_receipts import ReceiptFetcher
+from block_times import BlockTimes
+from lite_rpc import BACKENDS, RPC_BACKEND, LiteClient, from_wei
+
 # Load environment variables
 load_dotenv()
 
-# Arbitrum RPC endpoints
-ARBITRUM_RPC = "https://arb1.arbitrum.io/rpc"
-INFURA_API_KEY = os.getenv('INFURA_API_KEY', '')
-ARBITRUM_BACKUP_RPC = f"https://arbitrum-mainnet.infura.io/v3/{INFURA_API_KEY}" if INFURA_API_KEY else ARBITRUM_RPC
-
-# Arbiscan API (for contract verification status)
-ARBISCAN_API = "https://api.arbiscan.io/api"
+# Arbiscan API key (for contract verification status)
 ARBISCAN_API_KEY = os.getenv('ARBISCAN_API_KEY')
 
-if not ARBISCAN_API_KEY:
-    print("⚠️  Warning: ARBISCAN_API_KEY not found in environment variables.")
-    print("   Please set it in your .env file or as an environment variable.")
-    print("   Copy .env.example to .env and add your API key.")
-
 # Token contract address
 TOKEN_ADDRESS = "0x602b869eEf1C9F0487F31776bad8Af3C4A173394"
 MINT_TX_HASH = "0x1061de9e96b65cc62fabc748d972fefcf7cfc7fc9c518464855ac9744ef7d85d"
@@ -100,28 +99,94 @@ ERC20_ABI = [
     }
 ]
 
+# Maximum number of in-flight requests for AsyncTokenVerifier
+DEFAULT_CONCURRENCY = 8
+
+# Read-only ERC20 calls fetched by verify_token_contract, with their return types
+ERC20_READS = [
+    ("name", "string"),
+    ("symbol", "string"),
+    ("decimals", "uint8"),
+    ("totalSupply", "uint256"),
+    ("owner", "address"),
+]
+
 class TokenVerifier:
-    def __init__(self, rpc_url: str = ARBITRUM_RPC):
-        """Initialize the token verifier with Web3 connection."""
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not self.w3.is_connected() and ARBITRUM_BACKUP_RPC != ARBITRUM_RPC:
-            print(f"Failed to connect to {rpc_url}, trying backup...")
-            self.w3 = Web3(Web3.HTTPProvider(ARBITRUM_BACKUP_RPC))
-        
-        if not self.w3.is_connected():
+    def __init__(self, pool: Optional[RPCPool] = None, explorer: Optional[ArbiscanClient] = None,
+                 backend: str = RPC_BACKEND):
+        """Initialize the token verifier and check the RPC connection.
+        
+        Calls go through the shared RPC pool, which routes each request to the
+        fastest healthy Arbitrum endpoint and fails over mid-run. explorer
+        defaults to the shared Arbiscan client. backend="lite" makes the
+        calls through lite_rpc instead of web3, which is then never imported.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {', '.join(BACKENDS)}")
+        self.pool = pool or get_rpc_pool()
+        self.lite = LiteClient(self.pool) if backend == "lite" else None
+        self.w3 = pooled_web3(self.pool) if self.lite is None else None
+        self.explorer = explorer or get_arbiscan_client()
+        self.block_times = BlockTimes(pool=self.pool)
+        
+        if not (self.lite.is_connected() if self.lite else self.w3.is_connected()):
             raise ConnectionError("Failed to connect to Arbitrum network")
         
-        print(f"✅ Connected to Arbitrum network")
-        print(f"   Chain ID: {self.w3.eth.chain_id}")
-        print(f"   Latest block: {self.w3.eth.block_number}")
+        print(f"✅ Connected to Arbitrum network" + (" (lite client)" if self.lite else ""))
+        print(f"   Endpoints: {', '.join(endpoint.name for endpoint in self.pool.endpoints)}")
+        if self.lite:
+            print(f"   Chain ID: {self.lite.chain_id()}")
+            print(f"   Latest block: {self.lite.block_number()}")
+        else:
+            print(f"   Chain ID: {self.w3.eth.chain_id}")
+            print(f"   Latest block: {self.w3.eth.block_number}")
         print()
 
-    def verify_token_contract(self, token_address: str) -> Dict[str, Any]:
-        """Verify and analyze the token contract."""
-        print(f"🔍 Analyzing Token Contract: {token_address}")
-        print("=" * 60)
+    def _rpc_batch(self, calls: List[Tuple[str, list]]) -> List[Dict[str, Any]]:
+        """Send several JSON-RPC calls as one batch request, returning responses in call order."""
+        return self.pool.batch(calls)
+
+    def _batched_token_reads(self, address: str) -> Tuple[bytes, Callable[[str], Any]]:
+        """Fetch contract code and all ERC20 reads in a single JSON-RPC batch."""
+        if self.lite:
+            return self.lite.token_reads(address, [fn_name for fn_name, _ in ERC20_READS])
+        
+        contract = self.w3.eth.contract(address=address, abi=ERC20_ABI)
+        calls = [("eth_getCode", [contract.address, "latest"])]
+        for fn_name, _ in ERC20_READS:
+            calls.append(("eth_call", [{"to": contract.address, "data": contract.encodeABI(fn_name=fn_name)}, "latest"]))
+        
+        responses = self._rpc_batch(calls)
+        if "error" in responses[0]:
+            raise ValueError(responses[0]["error"].get("message", "eth_getCode failed"))
+        code = HexBytes(responses[0]["result"])
+        
+        output_types = dict(ERC20_READS)
+        call_responses = {fn_name: resp for (fn_name, _), resp in zip(ERC20_READS, responses[1:])}
+        
+        def read(fn_name: str) -> Any:
+            # Failures surface per field so the caller keeps its individual fallbacks
+            resp = call_responses[fn_name]
+            if "error" in resp:
+                raise ValueError(resp["error"].get("message", f"{fn_name}() reverted"))
+            value = self.w3.codec.decode([output_types[fn_name]], HexBytes(resp["result"]))[0]
+            if output_types[fn_name] == "address":
+                value = to_checksum_address(value)
+            return value
+        
+        return code, read
+
+    def _token_reads(self, address: str) -> Tuple[bytes, Callable[[str], Any]]:
+        """Contract code, and an ERC20 read callable that makes one call per read."""
+        if self.lite:
+            return self.lite.get_code(address), lambda fn_name: self.lite.call(address, fn_name)
         
-        result = {
+        contract = self.w3.eth.contract(address=address, abi=ERC20_ABI)
+        return self.w3.eth.get_code(address), lambda fn_name: getattr(contract.functions, fn_name)().call()
+
+    @staticmethod
+    def _new_token_result(token_address: str) -> Dict[str, Any]:
+        return {
             "address": token_address,
             "is_contract": False,
             "contract_info": {},
@@ -129,9 +194,38 @@ class TokenVerifier:
             "security_checks": {},
             "warnings": []
         }
+
+    def verify_token_contract(self, token_address: str, batched: bool = False) -> Dict[str, Any]:
+        """Verify and analyze the token contract.
         
-        # Check if address is a contract
-        code = self.w3.eth.get_code(Web3.to_checksum_address(token_address))
+        With batched=True the code lookup and all ERC20 reads are sent as a
+        single JSON-RPC batch instead of one round trip each.
+        """
+        print(f"🔍 Analyzing Token Contract: {token_address}")
+        print("=" * 60)
+        
+        result = self._new_token_result(token_address)
+        address = to_checksum_address(token_address)
+        
+        if batched:
+            try:
+                code, read = self._batched_token_reads(address)
+                round_trips_saved = len(ERC20_READS)
+                result["contract_info"]["rpc_round_trips"] = 1
+                result["contract_info"]["rpc_round_trips_saved"] = round_trips_saved
+                print(f"📦 Batched {len(ERC20_READS) + 1} reads into 1 request (saved {round_trips_saved} round trips)")
+            except Exception as e:
+                print(f"⚠️  Batch request failed ({e}), falling back to individual calls")
+                batched = False
+        
+        if not batched:
+            # Check if address is a contract
+            code, read = self._token_reads(address)
+        
+        return self._populate_token_result(result, code, read)
+
+    def _populate_token_result(self, result: Dict[str, Any], code: bytes, read: Callable[[str], Any]) -> Dict[str, Any]:
+        """Fill in the token result from the contract code and an ERC20 read callable."""
         result["is_contract"] = len(code) > 0
         
         if not result["is_contract"]:
@@ -150,37 +244,32 @@ class TokenVerifier:
         
         # Try to interact with contract as ERC20
         try:
-            contract = self.w3.eth.contract(
-                address=Web3.to_checksum_address(token_address),
-                abi=ERC20_ABI
-            )
-            
             # Get basic token info
             token_info = {}
             
             try:
-                token_info["name"] = contract.functions.name().call()
+                token_info["name"] = read("name")
                 print(f"   Name: {token_info['name']}")
             except:
                 token_info["name"] = "Unknown"
                 result["warnings"].append("Could not read token name")
             
             try:
-                token_info["symbol"] = contract.functions.symbol().call()
+                token_info["symbol"] = read("symbol")
                 print(f"   Symbol: {token_info['symbol']}")
             except:
                 token_info["symbol"] = "Unknown"
                 result["warnings"].append("Could not read token symbol")
             
             try:
-                token_info["decimals"] = contract.functions.decimals().call()
+                token_info["decimals"] = read("decimals")
                 print(f"   Decimals: {token_info['decimals']}")
             except:
                 token_info["decimals"] = 18
                 result["warnings"].append("Could not read decimals, assuming 18")
             
             try:
-                total_supply = contract.functions.totalSupply().call()
+                total_supply = read("totalSupply")
                 token_info["total_supply_raw"] = total_supply
                 token_info["total_supply"] = total_supply / (10 ** token_info["decimals"])
                 print(f"   Total Supply: {token_info['total_supply']:,.2f} {token_info['symbol']}")
@@ -188,7 +277,7 @@ class TokenVerifier:
                 result["warnings"].append("Could not read total supply")
             
             try:
-                owner = contract.functions.owner().call()
+                owner = read("owner")
                 token_info["owner"] = owner
                 print(f"   Owner: {owner}")
             except:
@@ -202,110 +291,36 @@ class TokenVerifier:
         
         return result
 
-    def analyze_mint_transaction(self, tx_hash: str) -> Dict[str, Any]:
-        """Analyze the mint transaction."""
-        print(f"\n🔍 Analyzing Mint Transaction: {tx_hash}")
-        print("=" * 60)
-        
-        result = {
+    @staticmethod
+    def _new_tx_result(tx_hash: str) -> Dict[str, Any]:
+        return {
             "tx_hash": tx_hash,
             "found": False,
             "details": {},
             "logs": [],
             "warnings": []
         }
+
+    def analyze_mint_transaction(self, tx_hash: str) -> Dict[str, Any]:
+        """Analyze the mint transaction."""
+        print(f"\n🔍 Analyzing Mint Transaction: {tx_hash}")
+        print("=" * 60)
+        
+        result = self._new_tx_result(tx_hash)
         
         try:
             # Get transaction details
-            tx = self.w3.eth.get_transaction(tx_hash)
+            client = self.lite or self.w3.eth
+            tx = client.get_transaction(tx_hash)
             result["found"] = True
             
             # Get transaction receipt for logs
-            receipt = self.w3.eth.get_transaction_receipt(tx_hash)
-            
-            # Parse transaction details
-            details = {
-                "block_number": receipt["blockNumber"],
-                "from": receipt["from"],
-                "to": receipt["to"],
-                "contract_address": receipt.get("contractAddress"),
-                "status": "Success" if receipt["status"] == 1 else "Failed",
-                "gas_used": receipt["gasUsed"],
-                "effective_gas_price": receipt.get("effectiveGasPrice", 0),
-                "transaction_index": receipt["transactionIndex"],
-                "logs_count": len(receipt["logs"])
-            }
-            
-            # Calculate gas cost in ETH
-            if details["effective_gas_price"]:
-                gas_cost_wei = details["gas_used"] * details["effective_gas_price"]
-                details["gas_cost_eth"] = self.w3.from_wei(gas_cost_wei, 'ether')
-            
-            # Get block timestamp
-            block = self.w3.eth.get_block(details["block_number"])
-            details["timestamp"] = datetime.fromtimestamp(block["timestamp"]).strftime('%Y-%m-%d %H:%M:%S UTC')
+            receipt = client.get_transaction_receipt(tx_hash)
             
-            result["details"] = details
-            
-            print(f"✅ Transaction found")
-            print(f"   Block: {details['block_number']}")
-            print(f"   Time: {details['timestamp']}")
-            print(f"   From: {details['from']}")
-            print(f"   To: {details['to']}")
-            if details["contract_address"]:
-                print(f"   Contract Created: {details['contract_address']}")
-            print(f"   Status: {details['status']}")
-            print(f"   Gas Used: {details['gas_used']:,}")
-            if "gas_cost_eth" in details:
-                print(f"   Gas Cost: {details['gas_cost_eth']:.6f} ETH")
-            print(f"   Logs: {details['logs_count']} events")
-            
-            # Parse logs for Transfer events
-            if receipt["logs"]:
-                print(f"\n📝 Transaction Logs:")
-                for i, log in enumerate(receipt["logs"]):
-                    log_data = {
-                        "index": i,
-                        "address": log["address"],
-                        "topics": [topic.hex() for topic in log["topics"]],
-                        "data": log["data"]
-                    }
-                    
-                    # Check if this is a Transfer event
-                    transfer_topic = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
-                    if len(log["topics"]) > 0 and log["topics"][0].hex() == transfer_topic:
-                        print(f"   [{i}] Transfer Event from {log['address']}")
-                        if len(log["topics"]) >= 3:
-                            from_addr = "0x" + log["topics"][1].hex()[26:]
-                            to_addr = "0x" + log["topics"][2].hex()[26:]
-                            print(f"       From: {from_addr}")
-                            print(f"       To: {to_addr}")
-                            
-                            # Check if this is a mint (from 0x0)
-                            if from_addr == "0x" + "0" * 40:
-                                print(f"       ✅ This is a MINT transaction!")
-                                log_data["event_type"] = "MINT"
-                    
-                    result["logs"].append(log_data)
+            # Get block timestamp (cached, so repeat runs skip the header fetch)
+            timestamp = self.block_times.timestamp(receipt["blockNumber"])
             
-            # Check if transaction interacted with our token
-            if details["to"] and details["to"].lower() == TOKEN_ADDRESS.lower():
-                print(f"\n✅ Transaction directly interacted with the token contract")
-            elif details["contract_address"] and details["contract_address"].lower() == TOKEN_ADDRESS.lower():
-                print(f"\n✅ This transaction CREATED the token contract!")
-                result["details"]["is_creation_tx"] = True
-            else:
-                # Check logs for interaction
-                token_found = False
-                for log in receipt["logs"]:
-                    if log["address"].lower() == TOKEN_ADDRESS.lower():
-                        token_found = True
-                        break
-                if token_found:
-                    print(f"\n✅ Transaction interacted with the token through events")
-                else:
-                    print(f"\n⚠️  Transaction does not appear to interact with token {TOKEN_ADDRESS}")
-                    result["warnings"].append("Transaction may not be related to the specified token")
+            self._populate_tx_result(result, receipt, timestamp)
             
         except Exception as e:
             result["warnings"].append(f"Error fetching transaction: {e}")
@@ -313,58 +328,217 @@ class TokenVerifier:
         
         return result
 
-    def check_contract_verification(self, token_address: str) -> Dict[str, Any]:
-        """Check if contract is verified on Arbiscan."""
-        print(f"\n🔍 Checking Contract Verification on Arbiscan")
+    def _populate_tx_result(self, result: Dict[str, Any], receipt: Dict[str, Any], timestamp: int,
+                            verbose: bool = True) -> None:
+        """Fill in transaction details and log analysis from a receipt and its block timestamp."""
+        say = print if verbose else (lambda *args, **kwargs: None)
+        
+        # Parse transaction details
+        details = {
+            "block_number": receipt["blockNumber"],
+            "from": receipt["from"],
+            "to": receipt["to"],
+            "contract_address": receipt.get("contractAddress"),
+            "status": "Success" if receipt["status"] == 1 else "Failed",
+            "gas_used": receipt["gasUsed"],
+            "effective_gas_price": receipt.get("effectiveGasPrice", 0),
+            "transaction_index": receipt["transactionIndex"],
+            "logs_count": len(receipt["logs"])
+        }
+        
+        # Calculate gas cost in ETH
+        if details["effective_gas_price"]:
+            gas_cost_wei = details["gas_used"] * details["effective_gas_price"]
+            details["gas_cost_eth"] = from_wei(gas_cost_wei)
+        
+        details["timestamp"] = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+        
+        result["details"] = details
+        
+        say(f"✅ Transaction found")
+        say(f"   Block: {details['block_number']}")
+        say(f"   Time: {details['timestamp']}")
+        say(f"   From: {details['from']}")
+        say(f"   To: {details['to']}")
+        if details["contract_address"]:
+            say(f"   Contract Created: {details['contract_address']}")
+        say(f"   Status: {details['status']}")
+        say(f"   Gas Used: {details['gas_used']:,}")
+        if "gas_cost_eth" in details:
+            say(f"   Gas Cost: {details['gas_cost_eth']:.6f} ETH")
+        say(f"   Logs: {details['logs_count']} events")
+        
+        # Parse logs for Transfer events
+        if receipt["logs"]:
+            say(f"\n📝 Transaction Logs:")
+            for i, log in enumerate(receipt["logs"]):
+                log_data = {
+                    "index": i,
+                    "address": log["address"],
+                    "topics": ["0x" + bytes(topic).hex() for topic in log["topics"]],
+                    "data": log["data"]
+                }
+                
+                decoded = decode_log(log)
+                if decoded:
+                    log_data["event"] = decoded["event"]
+                    log_data["args"] = decoded["args"]
+                
+                # Check if this is a Transfer event
+                if decoded and decoded["event"] == "Transfer":
+                    say(f"   [{i}] Transfer Event from {log['address']}")
+                    say(f"       From: {decoded['args']['from']}")
+                    say(f"       To: {decoded['args']['to']}")
+                    
+                    # Check if this is a mint (from 0x0)
+                    if decoded["args"]["from"] == ZERO_ADDRESS:
+                        say(f"       ✅ This is a MINT transaction!")
+                        log_data["event_type"] = "MINT"
+                elif decoded:
+                    say(f"   [{i}] {decoded['event']} Event from {log['address']}")
+                
+                result["logs"].append(log_data)
+        
+        # Check if transaction interacted with our token
+        if details["to"] and details["to"].lower() == TOKEN_ADDRESS.lower():
+            say(f"\n✅ Transaction directly interacted with the token contract")
+        elif details["contract_address"] and details["contract_address"].lower() == TOKEN_ADDRESS.lower():
+            say(f"\n✅ This transaction CREATED the token contract!")
+            result["details"]["is_creation_tx"] = True
+        else:
+            # Check logs for interaction
+            token_found = False
+            for log in receipt["logs"]:
+                if log["address"].lower() == TOKEN_ADDRESS.lower():
+                    token_found = True
+                    break
+            if token_found:
+                say(f"\n✅ Transaction interacted with the token through events")
+            else:
+                say(f"\n⚠️  Transaction does not appear to interact with token {TOKEN_ADDRESS}")
+                result["warnings"].append("Transaction may not be related to the specified token")
+
+    def analyze_transactions(self, tx_hashes: List[str], block_numbers: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """Analyze many transactions in one pass, returning the same dicts as analyze_mint_transaction.
+        
+        Receipts are fetched in JSON-RPC batches (or per block with eth_getBlockReceipts
+        when block_numbers is given) and block timestamps come from the BlockTimes cache.
+        """
+        hashes = list(dict.fromkeys(tx_hash.lower() for tx_hash in tx_hashes))
+        print(f"\n🔍 Analyzing {len(hashes):,} transactions")
         print("=" * 60)
         
-        result = {
+        fetcher = ReceiptFetcher(self.pool)
+        if block_numbers:
+            receipts = fetcher.block_receipts(block_numbers, set(hashes))
+        else:
+            receipts = fetcher.receipts(hashes)
+        timestamps = self.block_times.timestamps(receipt["blockNumber"] for receipt in receipts.values())
+        
+        results = []
+        for tx_hash in hashes:
+            result = self._new_tx_result(tx_hash)
+            receipt = receipts.get(tx_hash)
+            try:
+                if receipt is None:
+                    raise LookupError("Transaction receipt not found")
+                result["found"] = True
+                self._populate_tx_result(result, receipt, timestamps[receipt["blockNumber"]], verbose=False)
+            except Exception as e:
+                result["warnings"].append(f"Error fetching transaction: {e}")
+            results.append(result)
+        
+        self._print_bulk_summary(results, fetcher.round_trips)
+        return results
+
+    def analyze_token_activity(self, index: Optional[EventIndex] = None) -> List[Dict[str, Any]]:
+        """Analyze every transaction that emitted a token event, using the local event index."""
+        index = index or EventIndex(pool=self.pool)
+        index.sync()
+        transactions = index.transactions()
+        return self.analyze_transactions(
+            [tx_hash for tx_hash, _ in transactions],
+            [block_number for _, block_number in transactions]
+        )
+
+    @staticmethod
+    def _print_bulk_summary(results: List[Dict[str, Any]], round_trips: int) -> None:
+        found = [result for result in results if result["found"]]
+        failed = [result for result in found if result["details"].get("status") == "Failed"]
+        events: Dict[str, int] = {}
+        minted = 0
+        for result in found:
+            for log in result["logs"]:
+                if log["address"].lower() != TOKEN_ADDRESS.lower() or "event" not in log:
+                    continue
+                events[log["event"]] = events.get(log["event"], 0) + 1
+                if log.get("event_type") == "MINT":
+                    minted += log["args"]["value"]
+        
+        print(f"✅ Found {len(found):,}/{len(results):,} transactions in {round_trips} RPC round trips")
+        if failed:
+            print(f"⚠️  {len(failed)} transactions reverted")
+        for event_name, count in sorted(events.items(), key=lambda item: -item[1]):
+            print(f"   {event_name}: {count:,}")
+        print(f"   Minted via Transfer from 0x0: {minted / 10**18:,.2f} tokens")
+
+    @staticmethod
+    def _new_verification_result() -> Dict[str, Any]:
+        return {
             "verified": False,
             "source_code": None,
             "compiler_version": None,
             "optimization": None
         }
+
+    def check_contract_verification(self, token_address: str) -> Dict[str, Any]:
+        """Check if contract is verified on Arbiscan."""
+        print(f"\n🔍 Checking Contract Verification on Arbiscan")
+        print("=" * 60)
+        
+        result = self._new_verification_result()
         
-        if not ARBISCAN_API_KEY:
+        if not self._has_explorer_key():
             print("⚠️  Cannot check verification status without ARBISCAN_API_KEY")
             return result
             
         try:
-            # Query Arbiscan API
-            params = {
-                "module": "contract",
-                "action": "getsourcecode",
-                "address": token_address,
-                "apikey": ARBISCAN_API_KEY
-            }
-            
-            response = requests.get(ARBISCAN_API, params=params, timeout=10)
-            data = response.json()
-            
-            if data["status"] == "1" and data["result"]:
-                source = data["result"][0]
-                if source["SourceCode"]:
-                    result["verified"] = True
-                    result["compiler_version"] = source.get("CompilerVersion", "Unknown")
-                    result["optimization"] = source.get("OptimizationUsed", "Unknown")
-                    result["contract_name"] = source.get("ContractName", "Unknown")
-                    
-                    print(f"✅ Contract is VERIFIED on Arbiscan")
-                    print(f"   Contract Name: {result['contract_name']}")
-                    print(f"   Compiler: {result['compiler_version']}")
-                    print(f"   Optimization: {result['optimization']}")
-                else:
-                    print(f"⚠️  Contract is NOT verified on Arbiscan")
-                    print(f"   Unverified contracts should be treated with caution")
-            else:
-                print(f"⚠️  Could not check verification status")
-                
+            data = self._fetch_source_code(token_address)
+            self._populate_verification_result(result, data)
         except Exception as e:
             print(f"❌ Error checking verification: {e}")
             result["error"] = str(e)
         
         return result
 
+    def _has_explorer_key(self) -> bool:
+        return any(self.explorer.key_pool.keys)
+
+    def _fetch_source_code(self, token_address: str) -> Dict[str, Any]:
+        """Query the explorer's getsourcecode endpoint."""
+        return self.explorer.getsourcecode(token_address)
+
+    @staticmethod
+    def _populate_verification_result(result: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """Fill in the verification result from a getsourcecode response."""
+        if data["status"] == "1" and data["result"]:
+            source = data["result"][0]
+            if source["SourceCode"]:
+                result["verified"] = True
+                result["compiler_version"] = source.get("CompilerVersion", "Unknown")
+                result["optimization"] = source.get("OptimizationUsed", "Unknown")
+                result["contract_name"] = source.get("ContractName", "Unknown")
+                
+                print(f"✅ Contract is VERIFIED on Arbiscan")
+                print(f"   Contract Name: {result['contract_name']}")
+                print(f"   Compiler: {result['compiler_version']}")
+                print(f"   Optimization: {result['optimization']}")
+            else:
+                print(f"⚠️  Contract is NOT verified on Arbiscan")
+                print(f"   Unverified contracts should be treated with caution")
+        else:
+            print(f"⚠️  Could not check verification status")
+
     def generate_report(self, token_result: Dict, tx_result: Dict, verification_result: Dict) -> str:
         """Generate a comprehensive verification report."""
         report = []
@@ -467,8 +641,244 @@ class TokenVerifier:
         return "\n".join(report)
 
 
-def main():
+class AsyncTokenVerifier(TokenVerifier):
+    """AsyncWeb3 variant of TokenVerifier that overlaps independent network calls.
+    
+    Results have the same shape as TokenVerifier's. Each section is printed
+    once its data has arrived so concurrent sections do not interleave.
+    """
+
+    def __init__(self, pool: Optional[RPCPool] = None, concurrency: int = DEFAULT_CONCURRENCY,
+                 explorer: Optional[ArbiscanClient] = None):
+        # Connection checks need a running event loop, use create() instead
+        self.pool = pool or get_rpc_pool()
+        self.lite = None
+        self.w3 = pooled_async_web3(self.pool)
+        self.explorer = explorer or get_arbiscan_client()
+        self.block_times = BlockTimes(pool=self.pool)
+        self.concurrency = concurrency
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+    @classmethod
+    async def create(cls, pool: Optional[RPCPool] = None, concurrency: int = DEFAULT_CONCURRENCY) -> "AsyncTokenVerifier":
+        """Initialize the verifier and check the connection."""
+        self = cls(pool, concurrency)
+        
+        if not await self.w3.is_connected():
+            raise ConnectionError("Failed to connect to Arbitrum network")
+        
+        chain_id, block_number = await asyncio.gather(self.w3.eth.chain_id, self.w3.eth.block_number)
+        print(f"✅ Connected to Arbitrum network (async, concurrency {self.concurrency})")
+        print(f"   Endpoints: {', '.join(endpoint.name for endpoint in self.pool.endpoints)}")
+        print(f"   Chain ID: {chain_id}")
+        print(f"   Latest block: {block_number}")
+        print()
+        return self
+
+    async def _limited(self, awaitable: Awaitable) -> Any:
+        async with self.semaphore:
+            return await awaitable
+
+    async def _gather(self, awaitables: Dict[str, Awaitable]) -> Dict[str, Any]:
+        """Await named calls concurrently, returning exceptions in place of failed values."""
+        values = await asyncio.gather(
+            *(self._limited(awaitable) for awaitable in awaitables.values()),
+            return_exceptions=True
+        )
+        return dict(zip(awaitables.keys(), values))
+
+    async def verify_token_contract(self, token_address: str) -> Dict[str, Any]:
+        """Verify and analyze the token contract, fetching code and ERC20 reads concurrently."""
+        result = self._new_token_result(token_address)
+        contract = self.w3.eth.contract(
+            address=to_checksum_address(token_address),
+            abi=ERC20_ABI
+        )
+        
+        calls = {"code": self.w3.eth.get_code(contract.address)}
+        for fn_name, _ in ERC20_READS:
+            calls[fn_name] = getattr(contract.functions, fn_name)().call()
+        values = await self._gather(calls)
+        
+        def read(fn_name: str) -> Any:
+            if isinstance(values[fn_name], Exception):
+                raise values[fn_name]
+            return values[fn_name]
+        
+        print(f"🔍 Analyzing Token Contract: {token_address}")
+        print("=" * 60)
+        return self._populate_token_result(result, read("code"), read)
+
+    async def analyze_mint_transaction(self, tx_hash: str) -> Dict[str, Any]:
+        """Analyze the mint transaction, fetching the transaction and receipt concurrently."""
+        result = self._new_tx_result(tx_hash)
+        error = None
+        
+        try:
+            values = await self._gather({
+                "tx": self.w3.eth.get_transaction(tx_hash),
+                "receipt": self.w3.eth.get_transaction_receipt(tx_hash)
+            })
+            if isinstance(values["tx"], Exception):
+                raise values["tx"]
+            result["found"] = True
+            if isinstance(values["receipt"], Exception):
+                raise values["receipt"]
+            receipt = values["receipt"]
+            timestamp = await asyncio.to_thread(self.block_times.timestamp, receipt["blockNumber"])
+        except Exception as e:
+            error = e
+        
+        print(f"\n🔍 Analyzing Mint Transaction: {tx_hash}")
+        print("=" * 60)
+        
+        try:
+            if error:
+                raise error
+            self._populate_tx_result(result, receipt, timestamp)
+        except Exception as e:
+            result["warnings"].append(f"Error fetching transaction: {e}")
+            print(f"❌ Error: {e}")
+        
+        return result
+
+    async def check_contract_verification(self, token_address: str) -> Dict[str, Any]:
+        """Check if contract is verified on Arbiscan without blocking the event loop."""
+        result = self._new_verification_result()
+        
+        if self._has_explorer_key():
+            values = await self._gather({"source": asyncio.to_thread(self._fetch_source_code, token_address)})
+        
+        print(f"\n🔍 Checking Contract Verification on Arbiscan")
+        print("=" * 60)
+        
+        if not self._has_explorer_key():
+            print("⚠️  Cannot check verification status without ARBISCAN_API_KEY")
+            return result
+        
+        try:
+            if isinstance(values["source"], Exception):
+                raise values["source"]
+            self._populate_verification_result(result, values["source"])
+        except Exception as e:
+            print(f"❌ Error checking verification: {e}")
+            result["error"] = str(e)
+        
+        return result
+
+
+def save_results(verifier: TokenVerifier, token_result: Dict, tx_result: Dict, verification_result: Dict) -> None:
+    """Print the report and save it alongside the JSON results."""
+    # Generate and print report
+    report = verifier.generate_report(token_result, tx_result, verification_result)
+    print(report)
+    
+    # Save report to file
+    report_filename = f"token_verification_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+    with open(report_filename, "w") as f:
+        f.write(report)
+    print(f"\n📄 Report saved to: {report_filename}")
+    
+    # Export results as JSON
+    json_results = {
+        "timestamp": datetime.now().isoformat(),
+        "network": "Arbitrum",
+        "token_address": TOKEN_ADDRESS,
+        "mint_tx_hash": MINT_TX_HASH,
+        "token_verification": token_result,
+        "transaction_analysis": tx_result,
+        "contract_verification": verification_result
+    }
+    
+    json_filename = f"token_verification_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(json_filename, "w") as f:
+        json.dump(json_results, f, indent=2, default=str)
+    print(f"📊 JSON data saved to: {json_filename}")
+    
+    verifier.pool.print_stats()
+    get_arbiscan_client().print_timing()
+
+
+def load_tx_hashes(path: str) -> List[str]:
+    """Read transaction hashes, one per line, from a file or '-' for stdin."""
+    f = sys.stdin if path == "-" else open(path)
+    try:
+        hashes = []
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if len(line) != 66 or not line.startswith("0x"):
+                print(f"⚠️  Skipping invalid transaction hash: {line}")
+                continue
+            hashes.append(line)
+        return hashes
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def run_bulk(tx_file: Optional[str], backend: str = RPC_BACKEND) -> None:
+    """Analyze every hash in tx_file, or every token transaction in the event index, and save the results."""
+    verifier = TokenVerifier(backend=backend)
+    if tx_file:
+        results = verifier.analyze_transactions(load_tx_hashes(tx_file))
+    else:
+        results = verifier.analyze_token_activity()
+    
+    json_filename = f"bulk_tx_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(json_filename, "w") as f:
+        json.dump({
+            "timestamp": datetime.now().isoformat(),
+            "network": "Arbitrum",
+            "token_address": TOKEN_ADDRESS,
+            "transactions": results
+        }, f, indent=2, default=str)
+    print(f"📊 JSON data saved to: {json_filename}")
+    verifier.pool.print_stats()
+
+
+async def run_async(concurrency: int) -> None:
+    """Run all three independent checks concurrently."""
+    verifier = await AsyncTokenVerifier.create(concurrency=concurrency)
+    token_result, tx_result, verification_result = await asyncio.gather(
+        verifier.verify_token_contract(TOKEN_ADDRESS),
+        verifier.analyze_mint_transaction(MINT_TX_HASH),
+        verifier.check_contract_verification(TOKEN_ADDRESS)
+    )
+    save_results(verifier, token_result, tx_result, verification_result)
+
+
+def main(argv=None):
     """Main function to run the token verification."""
+    parser = argparse.ArgumentParser(description="Token verification for SDM on Arbitrum")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="overlap independent network calls using AsyncWeb3")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"maximum in-flight requests in async mode (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--tx-file", metavar="PATH",
+                        help="analyze every transaction hash in PATH (one per line, '-' for stdin)")
+    parser.add_argument("--all-token-txs", action="store_true",
+                        help="analyze every transaction that emitted a token event")
+    parser.add_argument("--backend", choices=BACKENDS, default=RPC_BACKEND,
+                        help=f"client for the RPC calls; lite skips web3 entirely (default: {RPC_BACKEND})")
+    args = parser.parse_args(argv)
+    if args.use_async and args.backend == "lite":
+        parser.error("--async uses AsyncWeb3 and cannot be combined with --backend lite")
+    
+    if not ARBISCAN_API_KEY:
+        print("⚠️  Warning: ARBISCAN_API_KEY not found in environment variables.")
+        print("   Please set it in your .env file or as an environment variable.")
+        print("   Copy .env.example to .env and add your API key.")
+    
+    if args.tx_file or args.all_token_txs:
+        try:
+            run_bulk(args.tx_file, args.backend)
+        except Exception as e:
+            print(f"\n❌ Fatal error: {e}")
+            return 1
+        return 0
+    
     print("🚀 Starting Token Verification on Arbitrum")
     print("=" * 70)
     print(f"Token Address: {TOKEN_ADDRESS}")
@@ -477,11 +887,15 @@ def main():
     print()
     
     try:
+        if args.use_async:
+            asyncio.run(run_async(args.concurrency))
+            return 0
+        
         # Initialize verifier
-        verifier = TokenVerifier()
+        verifier = TokenVerifier(backend=args.backend)
         
         # Verify token contract
-        token_result = verifier.verify_token_contract(TOKEN_ADDRESS)
+        token_result = verifier.verify_token_contract(TOKEN_ADDRESS, batched=True)
         
         # Analyze mint transaction
         tx_result = verifier.analyze_mint_transaction(MINT_TX_HASH)
@@ -489,31 +903,7 @@ def main():
         # Check contract verification
         verification_result = verifier.check_contract_verification(TOKEN_ADDRESS)
         
-        # Generate and print report
-        report = verifier.generate_report(token_result, tx_result, verification_result)
-        print(report)
-        
-        # Save report to file
-        report_filename = f"token_verification_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        with open(report_filename, "w") as f:
-            f.write(report)
-        print(f"\n📄 Report saved to: {report_filename}")
-        
-        # Export results as JSON
-        json_results = {
-            "timestamp": datetime.now().isoformat(),
-            "network": "Arbitrum",
-            "token_address": TOKEN_ADDRESS,
-            "mint_tx_hash": MINT_TX_HASH,
-            "token_verification": token_result,
-            "transaction_analysis": tx_result,
-            "contract_verification": verification_result
-        }
-        
-        json_filename = f"token_verification_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(json_filename, "w") as f:
-            json.dump(json_results, f, indent=2, default=str)
-        print(f"📊 JSON data saved to: {json_filename}")
+        save_results(verifier, token_result, tx_result, verification_result)
         
     except Exception as e:
         print(f"\n❌ Fatal error: {e}")
@@ -523,4 +913,4 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    exit(main())